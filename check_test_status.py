@@ -3,16 +3,47 @@
 Quick test status checker for Parquet Analyzer
 """
 
+import contextlib
+import importlib.util
+import io
 import subprocess
 import sys
 
-def run_command(cmd):
-    """Run a command and return success status"""
+def iter_lines(cmd):
+    """Run a command and yield its stdout line by line as it is produced
+
+    Raises subprocess.CalledProcessError once the output is exhausted if the
+    command exited with a non-zero status.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1)
+    with proc:
+        yield from proc.stdout
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+def run_pytest(args):
+    """Run pytest in-process and yield its output line by line
+
+    Falls back to a 'uv run pytest' subprocess when pytest isn't importable
+    from the current interpreter.
+    """
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result.returncode == 0, result.stdout, result.stderr
-    except Exception as e:
-        return False, "", str(e)
+        import pytest
+    except ImportError:
+        yield from iter_lines(["uv", "run", "pytest", *args])
+        return
+    
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        exit_code = pytest.main(list(args))
+    buffer.seek(0)
+    yield from buffer
+    if exit_code != 0:
+        raise subprocess.CalledProcessError(exit_code, ["pytest", *args])
+
+def modules_available(*names):
+    """Check that modules are importable without spawning a new interpreter"""
+    return all(importlib.util.find_spec(name) is not None for name in names)
 
 def main():
     print("🔧 Parquet Analyzer Test Status Check")
@@ -20,7 +51,7 @@ def main():
     
     # Check if dependencies are installed
     print("\n📦 Checking dependencies...")
-    success, _, _ = run_command(["uv", "run", "python", "-c", "import pytest; import pandas; import pyarrow"])
+    success = modules_available("pytest", "pandas", "pyarrow")
     print(f"Dependencies: {'✅ OK' if success else '❌ Missing'}")
     
     if not success:
@@ -29,31 +60,42 @@ def main():
     
     # Run basic tests
     print("\n🧪 Running basic tests...")
-    success, stdout, stderr = run_command(["uv", "run", "pytest", "tests/test_basic_functionality.py", "-v"])
+    summary_lines = []
+    try:
+        for line in run_pytest(["tests/test_basic_functionality.py", "-v"]):
+            if "passed" in line and "failed" not in line:
+                summary_lines.append(line.strip())
+        success, error = True, None
+    except (OSError, subprocess.CalledProcessError) as e:
+        success, error = False, str(e)
     
     if success:
         print("✅ Basic tests: PASSED")
-        lines = stdout.split('\n')
-        for line in lines:
-            if "passed" in line and "failed" not in line:
-                print(f"   {line.strip()}")
+        for line in summary_lines:
+            print(f"   {line}")
     else:
         print("❌ Basic tests: FAILED")
-        print(f"   Error: {stderr}")
+        print(f"   Error: {error}")
     
     # Count all discoverable tests
     print("\n📊 Test discovery...")
-    success, stdout, stderr = run_command(["uv", "run", "pytest", "--collect-only", "-q"])
+    num_tests = num_errors = 0
+    try:
+        # Count in a single pass over the streamed output
+        for line in run_pytest(["--collect-only", "-q"]):
+            if '::test_' in line:
+                num_tests += 1
+            if 'ERROR' in line:
+                num_errors += 1
+        success = True
+    except (OSError, subprocess.CalledProcessError):
+        success = False
     
     if success:
-        lines = stdout.split('\n')
-        test_lines = [l for l in lines if '::test_' in l]
-        error_lines = [l for l in lines if 'ERROR' in l]
-        
-        print(f"Discoverable tests: {len(test_lines)}")
-        print(f"Collection errors: {len(error_lines)}")
+        print(f"Discoverable tests: {num_tests}")
+        print(f"Collection errors: {num_errors}")
         
-        if error_lines:
+        if num_errors:
             print("   Import issues in some test files (expected)")
     
     # Show recommendations
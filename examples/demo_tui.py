@@ -3,6 +3,8 @@
 Demo script showing what the Parquet TUI looks like
 """
 
+import sys
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -10,10 +12,11 @@ from rich.tree import Tree
 from rich import box
 from rich.layout import Layout
 
-def demo_overview():
-    """Show what the overview panel looks like"""
-    console = Console()
-    
+# A single console shared by all demos, so the terminal is only probed once
+_CONSOLE = Console()
+
+def _build_overview():
+    """Build what the overview panel looks like"""
     table = Table(show_header=False, box=box.SIMPLE)
     table.add_column("Property", style="bold cyan")
     table.add_column("Value", style="white")
@@ -29,13 +32,10 @@ def demo_overview():
     table.add_row("💰 Space Saved", "3.61 MB")
     table.add_row("🛠️  Created By", "parquet-mr version 1.12.2")
     
-    panel = Panel(table, title="📊 Parquet File Overview", border_style="blue")
-    console.print(panel)
+    return Panel(table, title="📊 Parquet File Overview", border_style="blue")
 
-def demo_schema():
-    """Show what the schema panel looks like"""
-    console = Console()
-    
+def _build_schema():
+    """Build what the schema panel looks like"""
     tree = Tree("🗂️ Schema")
     
     field_node = tree.add("[bold]orderBookSides[/bold] (list<element: struct<...>>) [dim]nullable[/dim]")
@@ -61,13 +61,10 @@ def demo_schema():
     struct_node.add("minPrice (double) [dim]nullable[/dim]")
     struct_node.add("... (more fields)")
     
-    panel = Panel(tree, title="🏗️ Schema Structure", border_style="green")
-    console.print(panel)
+    return Panel(tree, title="🏗️ Schema Structure", border_style="green")
 
-def demo_compression():
-    """Show what the compression panel looks like"""
-    console = Console()
-    
+def _build_compression():
+    """Build what the compression panel looks like"""
     # Main compression table
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Column", style="cyan", width=30)
@@ -146,12 +143,10 @@ def demo_compression():
         Layout(detail_panel, ratio=1)
     )
     
-    console.print(layout)
+    return layout
 
-def demo_optimization():
-    """Show what the optimization panel looks like"""
-    console = Console()
-    
+def _build_optimization():
+    """Build what the optimization panel looks like"""
     content = """[bold yellow]🎯 OPTIMIZATION RECOMMENDATIONS[/bold yellow]
 
 [bold red]📊 Worst Compressed Column:[/bold red] orderBookSides.list.element.data.list.element.list.element
@@ -171,27 +166,54 @@ Current: 89.6% ratio (31.1MB)
 [bold magenta]💎 MAXIMUM POTENTIAL:[/bold magenta]
 └─ Up to 24.2MB savings (77% reduction)"""
     
-    panel = Panel(content, title="🚀 Optimization Guide", border_style="magenta")
-    console.print(panel)
+    return Panel(content, title="🚀 Optimization Guide", border_style="magenta")
+
+# None of the demo views depend on runtime input, so build them once at import
+OVERVIEW_PANEL = _build_overview()
+SCHEMA_PANEL = _build_schema()
+COMPRESSION_LAYOUT = _build_compression()
+OPTIMIZATION_PANEL = _build_optimization()
+
+
+def demo_overview(console=_CONSOLE):
+    """Show what the overview panel looks like"""
+    console.print(OVERVIEW_PANEL)
+
+def demo_schema(console=_CONSOLE):
+    """Show what the schema panel looks like"""
+    console.print(SCHEMA_PANEL)
+
+def demo_compression(console=_CONSOLE):
+    """Show what the compression panel looks like"""
+    console.print(COMPRESSION_LAYOUT)
+
+def demo_optimization(console=_CONSOLE):
+    """Show what the optimization panel looks like"""
+    console.print(OPTIMIZATION_PANEL)
 
 if __name__ == "__main__":
-    console = Console()
-    
-    console.print("\n[bold green]Parquet TUI Demo - What Each View Looks Like[/bold green]\n")
-    
-    console.print("[bold blue]View 1: Overview (Press '1')[/bold blue]")
-    demo_overview()
-    
-    console.print("\n[bold blue]View 2: Schema (Press '2')[/bold blue]")
-    demo_schema()
-    
-    console.print("\n[bold blue]View 3: Compression (Press '3') - Interactive with ↑/↓[/bold blue]")
-    demo_compression()
-    
-    console.print("\n[bold blue]View 4: Optimization (Press '4')[/bold blue]")
-    demo_optimization()
-    
-    console.print("\n[bold green]To run the actual interactive TUI:[/bold green]")
-    console.print("[bold cyan]uv run parquet-analyzer /path/to/your/file.parquet[/bold cyan]")
-    console.print("[dim]# or: .venv/bin/python -m parquet_analyzer.cli /path/to/your/file.parquet[/dim]")
-    console.print("\nControls: 1-4 (switch views), ↑/↓ (navigate), h (help), q (quit)")
+    console = _CONSOLE
+    
+    # Render everything into one buffer and write it out in a single call
+    with console.capture() as capture:
+        console.print("\n[bold green]Parquet TUI Demo - What Each View Looks Like[/bold green]\n")
+        
+        console.print("[bold blue]View 1: Overview (Press '1')[/bold blue]")
+        demo_overview(console)
+        
+        console.print("\n[bold blue]View 2: Schema (Press '2')[/bold blue]")
+        demo_schema(console)
+        
+        console.print("\n[bold blue]View 3: Compression (Press '3') - Interactive with ↑/↓[/bold blue]")
+        demo_compression(console)
+        
+        console.print("\n[bold blue]View 4: Optimization (Press '4')[/bold blue]")
+        demo_optimization(console)
+        
+        console.print("\n[bold green]To run the actual interactive TUI:[/bold green]")
+        console.print("[bold cyan]uv run parquet-analyzer /path/to/your/file.parquet[/bold cyan]")
+        console.print("[dim]# or: .venv/bin/python -m parquet_analyzer.cli /path/to/your/file.parquet[/dim]")
+        console.print("\nControls: 1-4 (switch views), ↑/↓ (navigate), h (help), q (quit)")
+    
+    sys.stdout.write(capture.get())
+    sys.stdout.flush()
@@ -9,7 +9,30 @@ __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .analyzer import ParquetAnalyzer, ParquetAnalysis, ColumnInfo, SchemaField, PageInfo
-from .tui import ParquetTUI
-
 __all__ = ["ParquetAnalyzer", "ParquetAnalysis", "ColumnInfo", "SchemaField", "PageInfo", "ParquetTUI"]
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package doesn't pull in pyarrow, pandas and rich until they are needed
+_LAZY_IMPORTS = {
+    "ParquetAnalyzer": ".analyzer",
+    "ParquetAnalysis": ".analyzer",
+    "ColumnInfo": ".analyzer",
+    "SchemaField": ".analyzer",
+    "PageInfo": ".analyzer",
+    "ParquetTUI": ".tui",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
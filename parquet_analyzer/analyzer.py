@@ -4,14 +4,20 @@ Core Parquet Analysis Engine
 Separated from UI for better testability and reusability
 """
 
+import functools
 import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime
 import json
 
 try:
+    import numpy as np
     import pandas as pd
     import pyarrow.parquet as pq
     import pyarrow as pa
@@ -19,6 +25,212 @@ except ImportError as e:
     raise ImportError(f"Missing required packages. Please install with: uv sync") from e
 
 
+# Typical data page size used when estimating page counts from column metadata
+ESTIMATED_PAGE_SIZE = 1024 * 1024
+
+# Encoding lists shared between columns, keyed by the set of encodings; wide
+# files have thousands of columns but only a handful of distinct combinations
+_ENC_CACHE: Dict[frozenset, Tuple[str, ...]] = {}
+
+# Physical types whose statistics can be reduced as NumPy arrays
+_NUMERIC_PHYSICAL_TYPES = frozenset({"BOOLEAN", "INT32", "INT64", "FLOAT", "DOUBLE"})
+
+
+def _intern(value: Any) -> Any:
+    """Intern value if it is a string, so repeated column metadata shares one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _shared_encodings(encodings: set) -> Tuple[str, ...]:
+    """Get the shared, sorted encodings tuple for a set of encodings"""
+    key = frozenset(encodings)
+    shared = _ENC_CACHE.get(key)
+    if shared is None:
+        shared = _ENC_CACHE.setdefault(key, tuple(sorted(_intern(e) for e in key)))
+    return shared
+
+
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__ generated from its fields
+
+    Equivalent to dataclass(slots=True), which needs Python 3.10+. Instances
+    get no per-object __dict__, which matters when an analysis holds one
+    object per column chunk.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace['__slots__'] = field_names
+    # Class-level defaults would shadow the slot descriptors; the generated
+    # __init__ already carries them
+    for name in field_names:
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+# Arrow type predicates bound once, they are called for every schema field
+_is_timestamp = pa.types.is_timestamp
+_is_date = pa.types.is_date
+_is_time = pa.types.is_time
+_is_integer = pa.types.is_integer
+_is_floating = pa.types.is_floating
+_is_string = pa.types.is_string
+_is_binary = pa.types.is_binary
+_is_boolean = pa.types.is_boolean
+_is_decimal = pa.types.is_decimal
+_is_list = pa.types.is_list
+_is_struct = pa.types.is_struct
+_is_nested = pa.types.is_nested
+
+# Physical types of the non-parameterized Arrow types, keyed by type id
+_PHYSICAL_TYPE_BY_ID = {
+    pa.bool_().id: "BOOLEAN",
+    pa.int32().id: "INT32",
+    pa.int64().id: "INT64",
+    pa.float32().id: "FLOAT",
+    pa.float64().id: "DOUBLE",
+    pa.string().id: "BYTE_ARRAY",
+    pa.binary().id: "BYTE_ARRAY",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _physical_type_for(arrow_type: pa.DataType) -> str:
+    """Get the physical type name for an Arrow type"""
+    physical_type = _PHYSICAL_TYPE_BY_ID.get(arrow_type.id)
+    if physical_type is not None:
+        return physical_type
+    
+    # Handle specific type categories
+    if _is_timestamp(arrow_type):
+        return "INT64"  # Timestamps are stored as INT64 in Parquet
+    elif _is_date(arrow_type):
+        return "INT32"  # Dates are typically stored as INT32
+    elif _is_time(arrow_type):
+        return "INT64" if arrow_type.bit_width > 32 else "INT32"
+    elif _is_integer(arrow_type):
+        return "INT64" if arrow_type.bit_width > 32 else "INT32"
+    elif _is_floating(arrow_type):
+        return "DOUBLE" if arrow_type.bit_width > 32 else "FLOAT"
+    elif _is_string(arrow_type) or _is_binary(arrow_type):
+        return "BYTE_ARRAY"
+    elif _is_boolean(arrow_type):
+        return "BOOLEAN"
+    elif _is_decimal(arrow_type):
+        return "FIXED_LEN_BYTE_ARRAY"
+    
+    return "UNKNOWN"
+
+
+# Number of files whose footer and analysis are kept in memory; set
+# PARQUET_ANALYZER_META_CACHE to bound it (0 disables the analysis cache)
+META_CACHE_SIZE = int(os.environ.get("PARQUET_ANALYZER_META_CACHE", "32"))
+
+
+class _CachedFile:
+    """An open ParquetFile and what is derived from its footer, cached together"""
+    __slots__ = ('parquet_file', '_row_group_starts')
+
+    def __init__(self, parquet_file: pq.ParquetFile):
+        self.parquet_file = parquet_file
+        self._row_group_starts: Optional[np.ndarray] = None
+
+    @property
+    def row_group_starts(self) -> np.ndarray:
+        """First row of each row group, followed by the total row count"""
+        if self._row_group_starts is None:
+            metadata = self.parquet_file.metadata
+            counts = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+            self._row_group_starts = np.concatenate(([0], np.cumsum(counts, dtype=np.int64)))
+        return self._row_group_starts
+
+
+# Open files by (absolute path, mtime_ns, size), least recently used first.
+# Evicted handles are closed, releasing their file descriptor and mapping.
+_FILE_CACHE: "OrderedDict[Tuple[str, int, int], _CachedFile]" = OrderedDict()
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def _open_parquet_file(file_path: str, mtime_ns: int, size: int) -> _CachedFile:
+    """Open a Parquet file, cached on (path, mtime, size) so the footer is parsed once
+
+    The modification time and size are only part of the cache key, so that a
+    file rewritten in place is reopened instead of served from the cache.
+    
+    The file is memory-mapped, so the data view's page reads are served from
+    the page cache without copying, and column chunk reads are pre-buffered
+    so that PyArrow coalesces the reads of neighbouring columns. A file
+    truncated in place while a read goes through its mapping faults
+    (SIGBUS) rather than raising, like any memory-mapped reader.
+    """
+    key = (file_path, mtime_ns, size)
+    with _FILE_CACHE_LOCK:
+        cached = _FILE_CACHE.get(key)
+        if cached is not None:
+            _FILE_CACHE.move_to_end(key)
+            return cached
+    
+    # Opened outside the lock, so other files' lookups don't wait on the footer
+    opened = _CachedFile(pq.ParquetFile(file_path, memory_map=True, pre_buffer=True))
+    if META_CACHE_SIZE <= 0:
+        return opened
+    
+    to_close = []
+    with _FILE_CACHE_LOCK:
+        # Another thread may have opened the same file meanwhile
+        cached = _FILE_CACHE.setdefault(key, opened)
+        if cached is not opened:
+            to_close.append(opened)
+        while len(_FILE_CACHE) > META_CACHE_SIZE:
+            to_close.append(_FILE_CACHE.popitem(last=False)[1])
+    for evicted in to_close:
+        evicted.parquet_file.close()
+    return cached
+
+
+def _clear_file_cache() -> None:
+    """Close and drop every cached file"""
+    with _FILE_CACHE_LOCK:
+        evicted = list(_FILE_CACHE.values())
+        _FILE_CACHE.clear()
+    for cached in evicted:
+        cached.parquet_file.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _parquet_tools_path() -> Optional[str]:
+    """Location of the parquet-tools executable, looked up on PATH once"""
+    import shutil
+    return shutil.which('parquet-tools')
+
+
+# Results of analyze_file, least recently used first, keyed like
+# _FILE_CACHE plus extract_pages. Shared by every ParquetAnalyzer and
+# guarded by a lock since analyze_files runs analyses in threads.
+_ANALYSIS_CACHE: "OrderedDict[Tuple[str, int, int, bool], ParquetAnalysis]" = OrderedDict()
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+# Converted schema fields by schema (without metadata), least recently used
+# first. Shared like _ANALYSIS_CACHE, so a directory of files with one schema
+# converts it once.
+_SCHEMA_CACHE: "OrderedDict[pa.Schema, List[SchemaField]]" = OrderedDict()
+_SCHEMA_CACHE_LOCK = threading.Lock()
+
+
+def _format_stat_value(value: Any, physical_type: str, path: str) -> str:
+    """Format a min/max statistic of the column at path for display or serialization"""
+    # Millisecond epoch timestamps stored as plain INT64 are kept raw during
+    # analysis (so they aggregate as integers) and pretty-printed here
+    if physical_type == 'INT64' and isinstance(value, int) and 'timestamp' in path.lower():
+        try:
+            return datetime.fromtimestamp(value / 1000).strftime('%Y-%m-%d %H:%M:%S')
+        except (OverflowError, OSError, ValueError):
+            pass
+    return str(value)
+
+
+@_slotted
 @dataclass
 class PageInfo:
     """Information about a single page in a column"""
@@ -30,9 +242,17 @@ class PageInfo:
     compression_ratio: float
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            'page_type': self.page_type,
+            'uncompressed_size': self.uncompressed_size,
+            'compressed_size': self.compressed_size,
+            'num_values': self.num_values,
+            'encoding': self.encoding,
+            'compression_ratio': self.compression_ratio
+        }
 
 
+@_slotted
 @dataclass
 class RowGroupColumnInfo:
     """Column information within a specific row group"""
@@ -45,7 +265,12 @@ class RowGroupColumnInfo:
     min_value: Optional[Any] = None
     max_value: Optional[Any] = None
 
+    def format_stat(self, value: Any) -> str:
+        """Format one of this column chunk's min/max statistics for display"""
+        return _format_stat_value(value, self.physical_type, self.name)
 
+
+@_slotted
 @dataclass
 class RowGroupInfo:
     """Information about a specific row group"""
@@ -65,8 +290,8 @@ class RowGroupInfo:
         interesting_cols = []
         for col in self.columns[:3]:  # Show first 3 columns
             if col.min_value is not None and col.max_value is not None:
-                min_str = str(col.min_value)[:10]
-                max_str = str(col.max_value)[:10]
+                min_str = col.format_stat(col.min_value)[:10]
+                max_str = col.format_stat(col.max_value)[:10]
                 interesting_cols.append(f"{col.name[:8]}: {min_str}→{max_str}")
         
         if interesting_cols:
@@ -75,7 +300,8 @@ class RowGroupInfo:
             return "No range data available"
 
 
-@dataclass  
+@_slotted
+@dataclass
 class ColumnInfo:
     """Comprehensive information about a column"""
     name: str
@@ -90,7 +316,7 @@ class ColumnInfo:
     distinct_count: Optional[int] = None
     min_value: Any = None
     max_value: Any = None
-    encodings: Optional[List[str]] = None
+    encodings: Optional[Tuple[str, ...]] = None
     num_pages: Optional[int] = None
     pages: Optional[List[PageInfo]] = None
     path_in_schema: Optional[str] = None
@@ -99,21 +325,40 @@ class ColumnInfo:
 
     def __post_init__(self):
         if self.encodings is None:
-            self.encodings = []
+            self.encodings = ()
         if self.pages is None:
             self.pages = []
 
     def to_dict(self) -> dict:
         """Convert to dictionary, handling special values"""
-        result = asdict(self)
-        # Handle values that might not be JSON serializable
-        if self.min_value is not None:
-            result['min_value'] = str(self.min_value)
-        if self.max_value is not None:
-            result['max_value'] = str(self.max_value)
-        return result
+        return {
+            'name': self.name,
+            'physical_type': self.physical_type,
+            'logical_type': self.logical_type,
+            'compression': self.compression,
+            'uncompressed_size': self.uncompressed_size,
+            'compressed_size': self.compressed_size,
+            'compression_ratio': self.compression_ratio,
+            'values': self.values,
+            'null_count': self.null_count,
+            'distinct_count': self.distinct_count,
+            # Handle values that might not be JSON serializable
+            'min_value': self.format_stat(self.min_value) if self.min_value is not None else None,
+            'max_value': self.format_stat(self.max_value) if self.max_value is not None else None,
+            'encodings': list(self.encodings),
+            'num_pages': self.num_pages,
+            'pages': [page.to_dict() for page in self.pages],
+            'path_in_schema': self.path_in_schema,
+            'repetition_type': self.repetition_type,
+            'converted_type': self.converted_type
+        }
 
+    def format_stat(self, value: Any) -> str:
+        """Format one of this column's min/max statistics for display or serialization"""
+        return _format_stat_value(value, self.physical_type, self.path_in_schema or self.name)
 
+
+@_slotted
 @dataclass
 class SchemaField:
     """Represents a field in the schema with full type information"""
@@ -143,6 +388,7 @@ class SchemaField:
         return result
 
 
+@_slotted
 @dataclass
 class ParquetAnalysis:
     """Complete analysis of a Parquet file"""
@@ -159,6 +405,47 @@ class ParquetAnalysis:
     row_groups: List[RowGroupInfo] = None
     created_by: Optional[str] = None
     version: Optional[str] = None
+    # Columns grouped for the optimization recommendations, filled from the
+    # column list when not given
+    double_cols: List[ColumnInfo] = None
+    price_cols: List[ColumnInfo] = None
+    nested_cols: List[ColumnInfo] = None
+    # Name lookups, built on first use by columns_by_name/schema_fields_by_name
+    _columns_by_name: Optional[Dict[str, ColumnInfo]] = field(default=None, init=False, repr=False, compare=False)
+    _schema_fields_by_name: Optional[Dict[str, SchemaField]] = field(default=None, init=False, repr=False,
+                                                                     compare=False)
+
+    def __post_init__(self):
+        # init=False defaults live on the class, which _slotted strips
+        self._columns_by_name = self._schema_fields_by_name = None
+        if self.double_cols is None or self.price_cols is None or self.nested_cols is None:
+            self.double_cols, self.price_cols, self.nested_cols = [], [], []
+            # One pass classifies every column for all strategies
+            for col in self.columns:
+                name = col.name
+                if col.physical_type == "DOUBLE":
+                    self.double_cols.append(col)
+                if 'price' in name.lower():
+                    self.price_cols.append(col)
+                if '.' in name:
+                    self.nested_cols.append(col)
+
+    @property
+    def columns_by_name(self) -> Dict[str, ColumnInfo]:
+        """Physical columns by name (path in schema), the first one for a repeated name"""
+        if self._columns_by_name is None:
+            by_name: Dict[str, ColumnInfo] = {}
+            for col in self.columns:
+                by_name.setdefault(col.name, col)
+            self._columns_by_name = by_name
+        return self._columns_by_name
+
+    @property
+    def schema_fields_by_name(self) -> Dict[str, SchemaField]:
+        """Top-level schema fields by name"""
+        if self._schema_fields_by_name is None:
+            self._schema_fields_by_name = {f.name: f for f in self.schema_fields}
+        return self._schema_fields_by_name
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
@@ -179,6 +466,9 @@ class ParquetAnalysis:
 
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string"""
+        # Always json.dumps: orjson escapes neither non-ASCII text nor NaN and
+        # writes floats differently, so --json output would depend on whether
+        # it happens to be installed
         return json.dumps(self.to_dict(), indent=indent, default=str)
 
 
@@ -188,12 +478,21 @@ class ParquetAnalyzer:
     def __init__(self):
         self.debug = False
 
-    def analyze_file(self, file_path: str) -> ParquetAnalysis:
+    def analyze_file(self, file_path: str, extract_pages: bool = False, *,
+                     stat_result: Optional[os.stat_result] = None) -> ParquetAnalysis:
         """
         Analyze a Parquet file and return comprehensive information
         
+        Results are cached for the last META_CACHE_SIZE files, so analyzing an
+        unchanged file again returns the same (read-only) ParquetAnalysis, or
+        a shallow copy of it when the file is reached through another path.
+        
         Args:
             file_path: Path to the Parquet file
+            extract_pages: Also estimate page-level information for each column.
+                PyArrow doesn't expose the page index, so these are estimates
+                derived from column chunk sizes and are off by default.
+            stat_result: os.stat() of file_path, if the caller already has it
             
         Returns:
             ParquetAnalysis object with all extracted information
@@ -202,31 +501,67 @@ class ParquetAnalyzer:
             FileNotFoundError: If file doesn't exist
             ValueError: If file is not a valid Parquet file
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+        # A single stat provides the existence check, the file size and the
+        # cache key for the ParquetFile handle
+        st = stat_result
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {file_path}") from None
+        
+        # The same file, unchanged since it was last analyzed, gives the same
+        # result; callers treat an analysis as read-only
+        key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size, extract_pages)
+        with _ANALYSIS_CACHE_LOCK:
+            analysis = _ANALYSIS_CACHE.get(key)
+            if analysis is not None:
+                _ANALYSIS_CACHE.move_to_end(key)
+        if analysis is not None:
+            # The cached analysis carries the path it was first asked for
+            if analysis.file_path != file_path:
+                analysis = replace(analysis, file_path=file_path)
+            return analysis
         
+        analysis = self._analyze(file_path, st, extract_pages)
+        if META_CACHE_SIZE > 0:
+            with _ANALYSIS_CACHE_LOCK:
+                _ANALYSIS_CACHE[key] = analysis
+                if len(_ANALYSIS_CACHE) > META_CACHE_SIZE:
+                    _ANALYSIS_CACHE.popitem(last=False)
+        return analysis
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop every cached analysis, schema and file handle, e.g. after
+        changing a file without changing its modification time or size"""
+        with _ANALYSIS_CACHE_LOCK:
+            _ANALYSIS_CACHE.clear()
+        with _SCHEMA_CACHE_LOCK:
+            _SCHEMA_CACHE.clear()
+        _clear_file_cache()
+
+    def _analyze(self, file_path: str, st: os.stat_result, extract_pages: bool) -> ParquetAnalysis:
+        """Build the analysis of analyze_file, for a file already stat'ed as st"""
         try:
-            # Get file size
-            file_size = os.path.getsize(file_path)
+            file_size = st.st_size
             
-            # Load Parquet file
-            table = pq.read_table(file_path)
-            parquet_file = pq.ParquetFile(file_path)
+            # Open the Parquet file; only the footer is read, no column data
+            parquet_file = self._open(file_path, st)
             metadata = parquet_file.metadata
+            arrow_schema = parquet_file.schema_arrow
             
             # Extract schema information
-            schema_fields = self._extract_schema_fields(table.schema)
+            schema_fields = self._extract_schema_fields(arrow_schema)
             
-            # Analyze columns
-            columns = self._analyze_columns(metadata, table.schema)
+            # Analyze columns, totalling sizes along the way
+            columns, total_uncompressed, total_compressed = self._analyze_columns(
+                metadata, arrow_schema, extract_pages
+            )
             
             # Analyze row groups
             row_groups = self._analyze_row_groups(metadata)
             
-            # Calculate totals
-            total_uncompressed = sum(col.uncompressed_size for col in columns)
-            total_compressed = sum(col.compressed_size for col in columns)
-            
             # Extract metadata
             created_by = getattr(metadata, 'created_by', None)
             version = getattr(metadata, 'version', None)
@@ -250,20 +585,68 @@ class ParquetAnalyzer:
         except Exception as e:
             raise ValueError(f"Error analyzing Parquet file: {e}") from e
 
-    def get_data_sample(self, file_path: str, max_rows: int = 1000) -> pd.DataFrame:
-        """Get a sample of the actual data from the Parquet file"""
-        try:
-            import pyarrow.parquet as pq
+    def analyze_files(self, file_paths: List[str], max_workers: int = 8,
+                      extract_pages: bool = False) -> List[ParquetAnalysis]:
+        """
+        Analyze several Parquet files concurrently
+        
+        PyArrow releases the GIL while reading and decoding footers, so a
+        thread pool scales well without the overhead of multiprocessing.
+        
+        Args:
+            file_paths: Paths to the Parquet files
+            max_workers: Maximum number of files analyzed at the same time
+            extract_pages: Passed through to analyze_file
+            
+        Returns:
+            One ParquetAnalysis per path, in the same order as file_paths
             
+        Raises:
+            The first error raised by analyze_file, in path order
+        """
+        if len(file_paths) <= 1 or max_workers <= 1:
+            return [self.analyze_file(path, extract_pages) for path in file_paths]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+            return list(executor.map(
+                lambda path: self.analyze_file(path, extract_pages), file_paths
+            ))
+
+    def _open(self, file_path: str, st: Optional[os.stat_result] = None) -> pq.ParquetFile:
+        """Get a (cached) ParquetFile handle for a path, reusing st if already stat'ed"""
+        return self._open_cached(file_path, st).parquet_file
+
+    def _open_cached(self, file_path: str, st: Optional[os.stat_result] = None) -> _CachedFile:
+        """Get the cached file entry for a path, reusing st if already stat'ed"""
+        if st is None:
+            st = os.stat(file_path)
+        return _open_parquet_file(os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+
+    def get_data_sample(self, file_path: str, max_rows: int = 1000,
+                        columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Get a sample of the actual data from the Parquet file
+        
+        Only the leading row groups needed to reach max_rows, and only the
+        requested columns (all of them by default), are read and decompressed.
+        """
+        try:
             # Read a sample of the data
-            parquet_file = pq.ParquetFile(file_path)
+            parquet_file = self._open(file_path)
+            metadata = parquet_file.metadata
             
             # If the file is small, read all data
-            if parquet_file.metadata.num_rows <= max_rows:
-                table = pq.read_table(file_path)
+            if metadata.num_rows <= max_rows:
+                table = parquet_file.read(columns=columns, use_threads=True)
             else:
-                # Read only the first max_rows rows
-                table = pq.read_table(file_path, use_threads=True)
+                # Read just enough leading row groups to cover max_rows
+                rows = 0
+                num_groups = 0
+                while rows < max_rows:
+                    rows += metadata.row_group(num_groups).num_rows
+                    num_groups += 1
+                table = parquet_file.read_row_groups(
+                    list(range(num_groups)), columns=columns, use_threads=True
+                )
                 table = table.slice(0, max_rows)
             
             # Convert to pandas DataFrame
@@ -274,14 +657,19 @@ class ParquetAnalyzer:
         except Exception as e:
             raise ValueError(f"Error reading data from Parquet file: {e}") from e
 
-    def get_data_sample_paginated(self, file_path: str, max_rows: int = 50, offset: int = 0) -> pd.DataFrame:
-        """Get a paginated sample of the actual data from the Parquet file"""
+    def get_data_sample_paginated(self, file_path: str, max_rows: int = 50, offset: int = 0,
+                                  columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Get a paginated sample of the actual data from the Parquet file
+        
+        Only the row groups overlapping the requested rows, and only the
+        requested columns (all of them by default), are read and decompressed.
+        """
         try:
-            import pyarrow.parquet as pq
-            
             # Read a sample of the data with offset
-            parquet_file = pq.ParquetFile(file_path)
-            total_rows = parquet_file.metadata.num_rows
+            cached = self._open_cached(file_path)
+            parquet_file = cached.parquet_file
+            metadata = parquet_file.metadata
+            total_rows = metadata.num_rows
             
             # Calculate actual offset and limit
             start_row = min(offset, total_rows)
@@ -289,12 +677,23 @@ class ParquetAnalyzer:
             
             if start_row >= total_rows:
                 # Return empty DataFrame with correct schema
-                table = pq.read_table(file_path)
-                return table.slice(0, 0).to_pandas()
+                table = parquet_file.schema_arrow.empty_table()
+                if columns is not None:
+                    table = table.select(columns)
+                return table.to_pandas()
+            
+            # Find the row groups covering [start_row, end_row): from the last
+            # one starting at or before start_row up to the last one starting
+            # before end_row
+            starts = cached.row_group_starts
+            first_group = int(np.searchsorted(starts, start_row, side='right')) - 1
+            end_group = int(np.searchsorted(starts, end_row, side='left'))
+            row_groups = list(range(first_group, end_group))
+            first_row = int(starts[first_group])
             
             # Read the slice of data
-            table = pq.read_table(file_path, use_threads=True)
-            table = table.slice(start_row, end_row - start_row)
+            table = parquet_file.read_row_groups(row_groups, columns=columns, use_threads=True)
+            table = table.slice(start_row - first_row, end_row - start_row)
             
             # Convert to pandas DataFrame
             df = table.to_pandas()
@@ -304,15 +703,51 @@ class ParquetAnalyzer:
         except Exception as e:
             raise ValueError(f"Error reading data from Parquet file: {e}") from e
 
-    def _extract_schema_fields(self, schema: pa.Schema) -> List[SchemaField]:
-        """Extract schema fields with full type information"""
-        fields = []
+    def get_preview_columns(self, file_path: str) -> Tuple[List[str], List[str]]:
+        """Get the data columns of a file, and those of them holding nested data
+        
+        Columns are named as in the DataFrames returned by get_data_sample
+        and get_data_sample_paginated: index columns stored from pandas are
+        left out. Nested data (lists, structs and maps) is found from the
+        Arrow schema, so no data has to be read.
+        """
+        schema = self._open(file_path).schema_arrow
+        pandas_metadata = schema.pandas_metadata or {}
+        index_columns = {name for name in pandas_metadata.get('index_columns', []) if isinstance(name, str)}
         
+        names = []
+        nested = []
         for field in schema:
-            schema_field = self._convert_arrow_field(field)
-            fields.append(schema_field)
+            if field.name in index_columns:
+                continue
+            names.append(field.name)
+            if _is_nested(field.type):
+                nested.append(field.name)
+        return names, nested
+
+    def _extract_schema_fields(self, schema: pa.Schema) -> List[SchemaField]:
+        """Extract schema fields with full type information
         
-        return fields
+        The converted fields are cached per schema, so analyzing several files
+        that share a schema only walks it once. The returned SchemaField
+        objects are shared between analyses and should be treated as read-only.
+        """
+        # Schema-level metadata (e.g. pandas metadata) doesn't affect the fields
+        key = schema.remove_metadata()
+        with _SCHEMA_CACHE_LOCK:
+            fields = _SCHEMA_CACHE.get(key)
+            if fields is not None:
+                _SCHEMA_CACHE.move_to_end(key)
+        
+        if fields is None:
+            fields = [self._convert_arrow_field(field) for field in schema]
+            if META_CACHE_SIZE > 0:
+                with _SCHEMA_CACHE_LOCK:
+                    _SCHEMA_CACHE[key] = fields
+                    if len(_SCHEMA_CACHE) > META_CACHE_SIZE:
+                        _SCHEMA_CACHE.popitem(last=False)
+        
+        return list(fields)
 
     def _convert_arrow_field(self, field: pa.Field, depth: int = 0) -> SchemaField:
         """Convert Arrow field to our SchemaField representation"""
@@ -327,12 +762,12 @@ class ParquetAnalyzer:
             logical_type = str(field_type.logical_type)
         
         # Handle different field types
-        if pa.types.is_list(field_type):
+        if _is_list(field_type):
             value_type = field_type.value_type
-            if pa.types.is_struct(value_type):
+            if _is_struct(value_type):
                 for struct_field in value_type:
                     children.append(self._convert_arrow_field(struct_field, depth + 1))
-            elif pa.types.is_list(value_type):
+            elif _is_list(value_type):
                 # Nested list
                 inner_field = pa.field("element", value_type)
                 children.append(self._convert_arrow_field(inner_field, depth + 1))
@@ -340,7 +775,7 @@ class ParquetAnalyzer:
                 # Simple list element
                 physical_type = self._get_physical_type(value_type)
                 
-        elif pa.types.is_struct(field_type):
+        elif _is_struct(field_type):
             for struct_field in field_type:
                 children.append(self._convert_arrow_field(struct_field, depth + 1))
         else:
@@ -348,7 +783,7 @@ class ParquetAnalyzer:
         
         return SchemaField(
             name=field.name,
-            type_str=type_str,
+            type_str=sys.intern(type_str),
             logical_type=logical_type,
             nullable=field.nullable,
             repetition="optional" if field.nullable else "required",
@@ -358,170 +793,177 @@ class ParquetAnalyzer:
 
     def _get_physical_type(self, arrow_type) -> str:
         """Get the physical type name for an Arrow type"""
-        type_mapping = {
-            pa.bool_(): "BOOLEAN",
-            pa.int32(): "INT32",
-            pa.int64(): "INT64",
-            pa.float32(): "FLOAT",
-            pa.float64(): "DOUBLE",
-            pa.string(): "BYTE_ARRAY",
-            pa.binary(): "BYTE_ARRAY",
-        }
-        
-        for arrow_t, physical_t in type_mapping.items():
-            if arrow_type == arrow_t:
-                return physical_t
-        
-        # Handle specific type categories
-        if pa.types.is_timestamp(arrow_type):
-            return "INT64"  # Timestamps are stored as INT64 in Parquet
-        elif pa.types.is_date(arrow_type):
-            return "INT32"  # Dates are typically stored as INT32
-        elif pa.types.is_time(arrow_type):
-            return "INT64" if arrow_type.bit_width > 32 else "INT32"
-        elif pa.types.is_integer(arrow_type):
-            return "INT64" if arrow_type.bit_width > 32 else "INT32"
-        elif pa.types.is_floating(arrow_type):
-            return "DOUBLE" if arrow_type.bit_width > 32 else "FLOAT"
-        elif pa.types.is_string(arrow_type) or pa.types.is_binary(arrow_type):
-            return "BYTE_ARRAY"
-        elif pa.types.is_boolean(arrow_type):
-            return "BOOLEAN"
-        elif pa.types.is_decimal(arrow_type):
-            return "FIXED_LEN_BYTE_ARRAY"
-        
-        return "UNKNOWN"
+        return _physical_type_for(arrow_type)
 
     def _get_logical_type_from_arrow_schema(self, column_name: str, arrow_schema) -> str:
         """Get logical type from Arrow schema for a specific column"""
-        for field in arrow_schema:
-            if field.name == column_name:
-                arrow_type = field.type
-                
-                # Map Arrow types to logical type names
-                if pa.types.is_string(arrow_type):
-                    return "UTF8"
-                elif pa.types.is_timestamp(arrow_type):
-                    return f"TIMESTAMP({arrow_type.unit})"
-                elif pa.types.is_date(arrow_type):
-                    return "DATE"
-                elif pa.types.is_time(arrow_type):
-                    return f"TIME({arrow_type.unit})"
-                elif pa.types.is_decimal(arrow_type):
-                    return f"DECIMAL({arrow_type.precision},{arrow_type.scale})"
-                elif pa.types.is_list(arrow_type):
-                    return "LIST"
-                elif pa.types.is_struct(arrow_type):
-                    return "STRUCT"
-                elif pa.types.is_binary(arrow_type):
-                    return "BINARY"
-                else:
-                    # For basic types, return the physical type equivalent
-                    return self._get_physical_type(arrow_type)
+        # The schema's name index finds the (first) field without a Python scan
+        indices = arrow_schema.get_all_field_indices(column_name)
+        if not indices:
+            # Fallback if column not found in schema
+            return "UNKNOWN"
+        arrow_type = arrow_schema.field(indices[0]).type
         
-        # Fallback if column not found in schema
-        return "UNKNOWN"
+        # Map Arrow types to logical type names
+        if _is_string(arrow_type):
+            return "UTF8"
+        elif _is_timestamp(arrow_type):
+            return f"TIMESTAMP({arrow_type.unit})"
+        elif _is_date(arrow_type):
+            return "DATE"
+        elif _is_time(arrow_type):
+            return f"TIME({arrow_type.unit})"
+        elif _is_decimal(arrow_type):
+            return f"DECIMAL({arrow_type.precision},{arrow_type.scale})"
+        elif _is_list(arrow_type):
+            return "LIST"
+        elif _is_struct(arrow_type):
+            return "STRUCT"
+        elif _is_binary(arrow_type):
+            return "BINARY"
+        else:
+            # For basic types, return the physical type equivalent
+            return self._get_physical_type(arrow_type)
 
-    def _analyze_columns(self, metadata, arrow_schema) -> List[ColumnInfo]:
-        """Analyze all columns in the Parquet file"""
-        # Aggregate column statistics across all row groups
-        column_stats = {}
+    def _analyze_columns(self, metadata, arrow_schema,
+                         extract_pages: bool = False) -> Tuple[List[ColumnInfo], int, int]:
+        """Analyze all columns in the Parquet file
         
-        for i in range(metadata.num_row_groups):
+        Returns:
+            The per-column analysis along with the file's total uncompressed
+            and compressed sizes
+        """
+        num_row_groups = metadata.num_row_groups
+        num_columns = metadata.num_columns
+        if num_row_groups == 0:
+            return [], 0, 0
+        
+        # Numeric per-chunk metrics, one row per row group and one column per
+        # physical column, summed across row groups in a single pass at the end
+        shape = (num_row_groups, num_columns)
+        uncompressed = np.zeros(shape, dtype=np.int64)
+        compressed = np.zeros(shape, dtype=np.int64)
+        values = np.zeros(shape, dtype=np.int64)
+        null_counts = np.zeros(shape, dtype=np.int64)
+        num_pages = np.zeros(shape, dtype=np.int64)
+        
+        # Non-numeric column properties, taken from the first row group
+        column_stats = []
+        
+        for i in range(num_row_groups):
             rg = metadata.row_group(i)
-            for j in range(rg.num_columns):
+            for j in range(num_columns):
                 col = rg.column(j)
-                col_path = col.path_in_schema
-                
-                # Extract page information
-                pages, num_pages = self._extract_page_info(col)
                 
                 # Extract statistics
                 stats = self._extract_column_statistics(col)
                 
-                # Get type information
-                logical_type = self._get_logical_type_from_arrow_schema(col_path, arrow_schema)
+                uncompressed[i, j] = col.total_uncompressed_size
+                compressed[i, j] = col.total_compressed_size
+                values[i, j] = col.num_values
+                null_counts[i, j] = stats.get('null_count', 0) or 0
+                if extract_pages:
+                    num_pages[i, j] = self._estimate_num_pages(col)
                 
-                if col_path not in column_stats:
+                if i == 0:
                     # First time seeing this column
-                    column_stats[col_path] = {
+                    col_path = col.path_in_schema
+                    column_stats.append({
                         'name': col_path,
-                        'physical_type': col.physical_type,
-                        'logical_type': logical_type,
-                        'compression': col.compression,
-                        'uncompressed_size': col.total_uncompressed_size,
-                        'compressed_size': col.total_compressed_size,
-                        'values': col.num_values,
-                        'null_count': stats.get('null_count', 0) or 0,
+                        'physical_type': sys.intern(col.physical_type),
+                        'logical_type': _intern(
+                            self._get_logical_type_from_arrow_schema(col_path, arrow_schema)
+                        ),
+                        'compression': sys.intern(col.compression),
                         'distinct_count': stats.get('distinct_count'),
-                        'min_value': stats.get('min_value'),
-                        'max_value': stats.get('max_value'),
+                        'min_values': [],
+                        'max_values': [],
                         'encodings': set(col.encodings),
-                        'num_pages': num_pages,
-                        'pages': pages,
+                        'page_encoding': col.encodings[0] if col.encodings else "UNKNOWN",
                         'path_in_schema': col_path,
-                        'repetition_type': getattr(col, 'repetition_type', 'UNKNOWN'),
-                        'converted_type': getattr(col, 'converted_type', 'UNKNOWN')
-                    }
+                        'repetition_type': _intern(getattr(col, 'repetition_type', 'UNKNOWN')),
+                        'converted_type': _intern(getattr(col, 'converted_type', 'UNKNOWN'))
+                    })
                 else:
-                    # Aggregate stats across row groups
-                    existing = column_stats[col_path]
-                    existing['uncompressed_size'] += col.total_uncompressed_size
-                    existing['compressed_size'] += col.total_compressed_size
-                    existing['values'] += col.num_values
-                    existing['null_count'] += stats.get('null_count', 0) or 0
-                    existing['num_pages'] += num_pages
-                    existing['pages'].extend(pages)
-                    existing['encodings'].update(col.encodings)
-                    
-                    # Update min/max values across row groups
-                    if stats.get('min_value') is not None:
-                        if existing['min_value'] is None:
-                            existing['min_value'] = stats['min_value']
-                        else:
-                            try:
-                                existing['min_value'] = min(existing['min_value'], stats['min_value'])
-                            except (TypeError, ValueError):
-                                pass  # Skip if values can't be compared
-                    
-                    if stats.get('max_value') is not None:
-                        if existing['max_value'] is None:
-                            existing['max_value'] = stats['max_value']
-                        else:
-                            try:
-                                existing['max_value'] = max(existing['max_value'], stats['max_value'])
-                            except (TypeError, ValueError):
-                                pass  # Skip if values can't be compared
+                    # Merge non-numeric stats across row groups
+                    column_stats[j]['encodings'].update(col.encodings)
+                
+                # Collect min/max values, reduced once per column below
+                if stats.get('min_value') is not None:
+                    column_stats[j]['min_values'].append(stats['min_value'])
+                if stats.get('max_value') is not None:
+                    column_stats[j]['max_values'].append(stats['max_value'])
+        
+        # Aggregate numeric metrics across row groups; pages are only estimated
+        # for chunks with statistics, so mask the sizes the same way
+        has_pages = num_pages > 0
+        uncompressed_totals = uncompressed.sum(axis=0).tolist()
+        compressed_totals = compressed.sum(axis=0).tolist()
+        values_totals = values.sum(axis=0).tolist()
+        null_totals = null_counts.sum(axis=0).tolist()
+        pages_totals = num_pages.sum(axis=0).tolist()
+        paged_uncompressed = np.where(has_pages, uncompressed, 0).sum(axis=0).tolist()
+        paged_compressed = np.where(has_pages, compressed, 0).sum(axis=0).tolist()
+        paged_values = np.where(has_pages, values, 0).sum(axis=0).tolist()
         
         # Convert aggregated stats to ColumnInfo objects
         columns = []
-        for col_path, stats in column_stats.items():
+        for j, stats in enumerate(column_stats):
             # Calculate final compression ratio
-            ratio = stats['compressed_size'] / stats['uncompressed_size'] if stats['uncompressed_size'] > 0 else 0
+            col_uncompressed = uncompressed_totals[j]
+            col_compressed = compressed_totals[j]
+            ratio = col_compressed / col_uncompressed if col_uncompressed > 0 else 0
+            pages = self._summarize_pages(
+                paged_uncompressed[j], paged_compressed[j], paged_values[j],
+                pages_totals[j], stats['page_encoding']
+            )
             
             col_info = ColumnInfo(
                 name=stats['name'],
                 physical_type=stats['physical_type'],
                 logical_type=stats['logical_type'],
                 compression=stats['compression'],
-                uncompressed_size=stats['uncompressed_size'],
-                compressed_size=stats['compressed_size'],
+                uncompressed_size=col_uncompressed,
+                compressed_size=col_compressed,
                 compression_ratio=ratio,
-                values=stats['values'],
-                null_count=stats['null_count'],
+                values=values_totals[j],
+                null_count=null_totals[j],
                 distinct_count=stats['distinct_count'],
-                min_value=stats['min_value'],
-                max_value=stats['max_value'],
-                encodings=list(stats['encodings']),
-                num_pages=stats['num_pages'],
-                pages=stats['pages'],
+                min_value=self._reduce_stat(stats['min_values'], stats['physical_type'], min),
+                max_value=self._reduce_stat(stats['max_values'], stats['physical_type'], max),
+                encodings=_shared_encodings(stats['encodings']),
+                num_pages=pages_totals[j],
+                pages=pages,
                 path_in_schema=stats['path_in_schema'],
                 repetition_type=stats['repetition_type'],
                 converted_type=stats['converted_type']
             )
             columns.append(col_info)
         
-        return columns
+        return columns, sum(uncompressed_totals), sum(compressed_totals)
+
+    def _reduce_stat(self, values: List[Any], physical_type: str, reducer) -> Any:
+        """Reduce per-row-group min or max statistics to a single column value
+        
+        Numeric physical types are reduced with NumPy; anything else falls back
+        to Python comparison, keeping the first row group's value if the
+        statistics can't be compared.
+        """
+        if not values:
+            return None
+        if len(values) == 1:
+            return values[0]
+        
+        if physical_type in _NUMERIC_PHYSICAL_TYPES:
+            array = np.asarray(values)
+            # Logical values such as datetimes or decimals end up as objects
+            if array.dtype != object:
+                return (array.min() if reducer is min else array.max()).item()
+        
+        try:
+            return reducer(values)
+        except (TypeError, ValueError):
+            return values[0]
 
     def _analyze_row_groups(self, metadata) -> List[RowGroupInfo]:
         """Analyze individual row groups"""
@@ -576,42 +1018,54 @@ class ParquetAnalyzer:
 
     def _extract_page_info(self, col) -> Tuple[List[PageInfo], int]:
         """Extract page-level information from a column"""
-        pages = []
-        num_pages = 0
+        num_pages = self._estimate_num_pages(col)
+        if num_pages == 0:
+            return [], 0
         
+        encoding = col.encodings[0] if col.encodings else "UNKNOWN"
+        pages = self._summarize_pages(
+            col.total_uncompressed_size, col.total_compressed_size, col.num_values, num_pages, encoding
+        )
+        return pages, num_pages
+
+    def _estimate_num_pages(self, col) -> int:
+        """Estimate the number of data pages in a column chunk"""
         # PyArrow doesn't expose detailed page statistics directly
         # We estimate based on metadata and typical page sizes
-        if hasattr(col, 'statistics') and col.statistics:
-            # Estimate page count based on data size
-            estimated_page_size = 1024 * 1024  # 1MB typical page size
-            num_pages = max(1, col.total_uncompressed_size // estimated_page_size)
-            
-            # Create estimated page info
-            avg_uncompressed_per_page = col.total_uncompressed_size // num_pages
-            avg_compressed_per_page = col.total_compressed_size // num_pages
-            avg_values_per_page = col.num_values // num_pages
-            
-            for page_idx in range(num_pages):
-                page_ratio = avg_compressed_per_page / avg_uncompressed_per_page if avg_uncompressed_per_page > 0 else 0
-                page_info = PageInfo(
-                    page_type="DATA_PAGE",
-                    uncompressed_size=avg_uncompressed_per_page,
-                    compressed_size=avg_compressed_per_page,
-                    num_values=avg_values_per_page,
-                    encoding=col.encodings[0] if col.encodings else "UNKNOWN",
-                    compression_ratio=page_ratio
-                )
-                pages.append(page_info)
+        # is_stats_set avoids building a Statistics object just to test for one
+        if not col.is_stats_set:
+            return 0
         
-        return pages, num_pages
+        # Round partial pages up
+        return max(1, -(-col.total_uncompressed_size // ESTIMATED_PAGE_SIZE))
+
+    def _summarize_pages(self, uncompressed_size: int, compressed_size: int, num_values: int,
+                         num_pages: int, encoding: str) -> List[PageInfo]:
+        """Describe the average page of a column as a single PageInfo"""
+        if num_pages <= 0:
+            return []
+        
+        avg_uncompressed_per_page = uncompressed_size // num_pages
+        avg_compressed_per_page = compressed_size // num_pages
+        page_ratio = avg_compressed_per_page / avg_uncompressed_per_page if avg_uncompressed_per_page > 0 else 0
+        
+        return [PageInfo(
+            page_type="DATA_PAGE",
+            uncompressed_size=avg_uncompressed_per_page,
+            compressed_size=avg_compressed_per_page,
+            num_values=num_values // num_pages,
+            encoding=encoding,
+            compression_ratio=page_ratio
+        )]
 
     def _extract_column_statistics(self, col) -> Dict[str, Any]:
         """Extract statistics from a column"""
         stats = {}
         
-        if col.statistics:
-            column_stats = col.statistics
-            
+        # Each access to col.statistics builds a new wrapper object, so read it once
+        column_stats = col.statistics
+        
+        if column_stats:
             if column_stats.has_null_count:
                 stats['null_count'] = column_stats.null_count
             
@@ -630,12 +1084,6 @@ class ParquetAnalyzer:
                             max_val = max_val.decode('utf-8') if max_val else None
                         except:
                             pass
-                    elif col.physical_type in ['INT64'] and 'timestamp' in col.path_in_schema.lower():
-                        try:
-                            min_val = datetime.fromtimestamp(min_val / 1000).strftime('%Y-%m-%d %H:%M:%S')
-                            max_val = datetime.fromtimestamp(max_val / 1000).strftime('%Y-%m-%d %H:%M:%S')
-                        except:
-                            pass
                     
                     stats['min_value'] = min_val
                     stats['max_value'] = max_val
@@ -664,63 +1112,58 @@ class ParquetAnalyzer:
         Returns:
             Dictionary with comparison results, or None if parquet-tools not available
         """
+        parquet_tools = _parquet_tools_path()
+        if parquet_tools is None:
+            return {
+                'available': False,
+                'error': "parquet-tools not found"
+            }
+        
+        import subprocess
+        
         try:
-            import subprocess
-            import tempfile
-            
-            # Try to run parquet-tools
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-                temp_file = f.name
-            
-            try:
-                # Run parquet-tools meta command
-                result = subprocess.run(
-                    ['parquet-tools', 'meta', file_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if result.returncode == 0:
-                    return {
-                        'available': True,
-                        'output': result.stdout,
-                        'error': result.stderr if result.stderr else None
-                    }
-                else:
-                    return {
-                        'available': False,
-                        'error': f"parquet-tools failed: {result.stderr}"
-                    }
+            # Run parquet-tools meta command
+            result = subprocess.run(
+                [parquet_tools, 'meta', file_path],
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
             
-            except subprocess.TimeoutExpired:
+            if result.returncode == 0:
                 return {
-                    'available': False,
-                    'error': "parquet-tools timeout"
+                    'available': True,
+                    'output': result.stdout,
+                    'error': result.stderr if result.stderr else None
                 }
-            except FileNotFoundError:
+            else:
                 return {
                     'available': False,
-                    'error': "parquet-tools not found"
+                    'error': f"parquet-tools failed: {result.stderr}"
                 }
-            finally:
-                try:
-                    os.unlink(temp_file)
-                except:
-                    pass
-                    
-        except ImportError:
+        
+        except subprocess.TimeoutExpired:
             return {
                 'available': False,
-                'error': "subprocess module not available"
+                'error': "parquet-tools timeout"
+            }
+        except FileNotFoundError:
+            return {
+                'available': False,
+                'error': "parquet-tools not found"
             }
 
 
-def create_test_parquet_files():
-    """Create various test Parquet files with different structures"""
-    import tempfile
+def create_test_parquet_files(test_dir: Optional[str] = None) -> Dict[str, str]:
+    """Create various test Parquet files with different structures
     
-    test_dir = Path(tempfile.mkdtemp(prefix="parquet_test_"))
+    The files are written to test_dir, or to a new temporary directory.
+    """
+    if test_dir is None:
+        import tempfile
+        test_dir = tempfile.mkdtemp(prefix="parquet_test_")
+    test_dir = Path(test_dir)
+    test_dir.mkdir(parents=True, exist_ok=True)
     
     # Simple flat structure
     simple_data = {
@@ -730,9 +1173,8 @@ def create_test_parquet_files():
         'salary': [50000.0, 60000.0, 70000.0, 80000.0, 90000.0],
         'active': [True, True, False, True, False]
     }
-    simple_df = pd.DataFrame(simple_data)
     simple_file = test_dir / "simple.parquet"
-    simple_df.to_parquet(simple_file, index=False)
+    pq.write_table(pa.Table.from_pydict(simple_data), simple_file)
     
     # Nested structure
     nested_data = {
@@ -748,20 +1190,20 @@ def create_test_parquet_files():
             []
         ]
     }
-    nested_df = pd.DataFrame(nested_data)
     nested_file = test_dir / "nested.parquet"
-    nested_df.to_parquet(nested_file, index=False)
+    pq.write_table(pa.Table.from_pydict(nested_data), nested_file)
     
-    # Large file with multiple row groups
-    large_data = {
-        'id': list(range(100000)),
-        'value': [i * 1.5 for i in range(100000)],
-        'category': (['A', 'B', 'C'] * 33334)[:100000],  # Ensure exact length
-        'timestamp': pd.date_range('2023-01-01', periods=100000, freq='1min')
-    }
-    large_df = pd.DataFrame(large_data)
+    # Larger file with two row groups, built from NumPy arrays
+    num_rows = 65536
+    ids = np.arange(num_rows, dtype=np.int64)
+    large_table = pa.table({
+        'id': ids,
+        'value': ids * 1.5,
+        'category': pa.array(np.array(['A', 'B', 'C'])[ids % 3]),
+        'timestamp': np.datetime64('2023-01-01', 'ns') + ids.astype('timedelta64[m]'),
+    })
     large_file = test_dir / "large.parquet"
-    large_df.to_parquet(large_file, index=False, row_group_size=10000)
+    pq.write_table(large_table, large_file, row_group_size=32768, data_page_size=65536)
     
     return {
         'simple': str(simple_file),
@@ -4,6 +4,8 @@ Command-line interface for Parquet Analyzer.
 """
 
 import argparse
+import os
+import stat
 import sys
 from pathlib import Path
 from typing import Optional
@@ -12,6 +14,15 @@ from .tui import ParquetTUI
 from .analyzer import ParquetAnalyzer
 
 
+def print_summary(analysis) -> None:
+    """Print the short --analyze-only summary of a single analysis."""
+    print(f"File: {analysis.file_path}")
+    print(f"Size: {analysis.file_size_bytes / (1024*1024):.2f} MB")
+    print(f"Rows: {analysis.total_rows:,}")
+    print(f"Columns: {analysis.num_physical_columns}")
+    print(f"Compression: {analysis.total_compressed / analysis.total_uncompressed:.1%}")
+
+
 def main(args: Optional[list] = None) -> int:
     """Main entry point for the CLI."""
     parser = argparse.ArgumentParser(
@@ -22,7 +33,8 @@ def main(args: Optional[list] = None) -> int:
     parser.add_argument(
         "file",
         nargs="?",
-        help="Path to Parquet file to analyze (optional - you can browse files in the TUI)"
+        help="Path to Parquet file to analyze (optional - you can browse files in the TUI). "
+             "With --analyze-only this may also be a directory of Parquet files"
     )
     
     parser.add_argument(
@@ -47,20 +59,30 @@ def main(args: Optional[list] = None) -> int:
             print("Error: --analyze-only requires a file path", file=sys.stderr)
             return 1
         
-        if not Path(file_path).exists():
+        # One stat answers both whether the path exists and whether it's a
+        # directory, and is reused by analyze_file
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             print(f"Error: File '{file_path}' not found", file=sys.stderr)
             return 1
         
         # Just analyze and print results
         try:
             analyzer = ParquetAnalyzer()
-            analysis = analyzer.analyze_file(file_path)
+            if stat.S_ISDIR(st.st_mode):
+                paths = sorted(str(p) for p in Path(file_path).glob("*.parquet"))
+                if not paths:
+                    print(f"Error: No Parquet files found in '{file_path}'", file=sys.stderr)
+                    return 1
+                analyses = analyzer.analyze_files(paths)
+            else:
+                analyses = [analyzer.analyze_file(file_path, stat_result=st)]
             
-            print(f"File: {analysis.file_path}")
-            print(f"Size: {analysis.file_size_bytes / (1024*1024):.2f} MB")
-            print(f"Rows: {analysis.total_rows:,}")
-            print(f"Columns: {analysis.num_physical_columns}")
-            print(f"Compression: {analysis.total_compressed / analysis.total_uncompressed:.1%}")
+            for i, analysis in enumerate(analyses):
+                if i:
+                    print()
+                print_summary(analysis)
             
             return 0
         except Exception as e:
@@ -7,17 +7,28 @@ Uses the refactored ParquetAnalyzer for better testability
 
 import sys
 import os
+import re
+import contextlib
+import functools
+import select
+import signal
+import time
+from operator import attrgetter
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from datetime import datetime
 import glob
+from itertools import islice
 
 try:
+    import numpy as np
     import pandas as pd
     import pyarrow.parquet as pq
     import pyarrow as pa
-    from rich.console import Console
+    from rich.console import Console, ConsoleDimensions, Group
     from rich.layout import Layout
     from rich.panel import Panel
     from rich.table import Table
@@ -41,57 +52,654 @@ except ImportError as e:
 from .analyzer import ParquetAnalyzer, ParquetAnalysis
 
 
+@contextlib.contextmanager
+def cbreak_terminal(fd: int):
+    """Keep the terminal in cbreak mode (unbuffered, no echo) for the duration
+    
+    Unlike raw mode, output processing stays on, so the TUI can keep printing
+    normally while keys are read.
+    """
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+# One key: an ESC [ X sequence (arrow keys) or any single character
+_KEY_PATTERN = re.compile(r'\x1b\[.|.', re.DOTALL)
+
+
+def split_keys(text: str) -> List[str]:
+    """Split terminal input into keys, keeping ESC [ X sequences (arrow keys) whole"""
+    return _KEY_PATTERN.findall(text)
+
+
+def read_keys(fd: int) -> List[str]:
+    """Block until input is available, then return every key that is pending
+    
+    Bursts such as held-down arrow keys or pasted text come back from a single
+    call, so the caller can apply them all and render once.
+    
+    Raises:
+        EOFError: If stdin was closed
+    """
+    data = os.read(fd, 64)
+    if not data:
+        raise EOFError
+    while True:
+        # An escape sequence may be split across reads; give the rest of it a
+        # moment to arrive, otherwise only take what is already pending
+        timeout = 0.05 if data.endswith((b'\x1b', b'\x1b[')) else 0
+        if not select.select([fd], [], [], timeout)[0]:
+            break
+        chunk = os.read(fd, 64)
+        if not chunk:
+            break
+        data += chunk
+    return split_keys(data.decode('utf-8', errors='ignore'))
+
+
+# Minimum time between renders while keys keep arriving (60 fps)
+FRAME_INTERVAL = 1 / 60
+
+
+def frame_deferred(fd: int, last_render: float) -> bool:
+    """Whether a pending render should wait for input arriving within the current frame
+    
+    Waits out the rest of the frame started at last_render (a time.monotonic()
+    value) and returns True as soon as more input is available, so the caller
+    can process it and render the combined result once.
+    """
+    remaining = FRAME_INTERVAL - (time.monotonic() - last_render)
+    if remaining <= 0:
+        return False
+    return bool(select.select([fd], [], [], remaining)[0])
+
+
+def write_frame(console: Console, frame: str, previous: Optional[List[str]] = None,
+                full: bool = False) -> List[str]:
+    """Write a rendered frame, repainting only the lines that differ from previous
+    
+    previous is the list this function returned for the last frame written,
+    or None to redraw the whole screen. A full redraw clears the screen first.
+    The partial path is only taken when the frame has the same shape as the
+    previous one and fits on screen, so that line numbers map directly to
+    terminal rows.
+    """
+    lines = frame.split("\n")
+    if (full or previous is None or len(lines) != len(previous)
+            or len(lines) > console.size.height):
+        console.clear()
+        console.file.write(frame)
+    else:
+        out = []
+        for row, (line, old_line) in enumerate(zip(lines, previous), start=1):
+            if line != old_line:
+                out.append(f"\x1b[{row};1H{line}\x1b[K")
+        # Leave the cursor where a full redraw would have left it
+        out.append(f"\x1b[{len(lines)};1H")
+        console.file.write("".join(out))
+    console.file.flush()
+    return lines
+
+
+_KB = 1 << 10
+_MB = 1 << 20
+
+
+def format_size(size_bytes: int) -> str:
+    """Format a byte count compactly, e.g. 1.5MB, 12KB or 512B"""
+    if size_bytes >= _MB:
+        return f"{size_bytes / _MB:.1f}MB"
+    if size_bytes >= _KB:
+        return f"{size_bytes / _KB:.0f}KB"
+    return f"{size_bytes}B"
+
+
+# Tail of a parquet file hinted into the page cache on highlight; large
+# enough for the footer of most files
+FOOTER_PREFETCH_BYTES = 256 * 1024
+
+
+def warm_footer(path: str, size: int):
+    """Ask the OS to start reading the tail of a file into the page cache
+    
+    posix_fadvise(WILLNEED) only schedules readahead and returns at once,
+    so this is cheap enough to call on every selection change. It is a
+    no-op where posix_fadvise is unavailable or the hint fails.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        offset = max(0, size - FOOTER_PREFETCH_BYTES)
+        os.posix_fadvise(fd, offset, size - offset, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# File browser keys that move the selection, and by how much
+SELECTOR_MOVES = {
+    '\x1b[A': -1, 'k': -1, 'K': -1,
+    '\x1b[B': 1, 'j': 1, 'J': 1,
+}
+
+
+# Data preview cells that recur on every page, with their markup parsed once
+NULL_CELL = Text.from_markup("[dim]NULL[/dim]")
+ERROR_CELL = Text.from_markup("[red]Error[/red]")
+
+
+def _truncate(text: str, width: int) -> str:
+    """Cut text longer than width down to width characters, ending in an ellipsis"""
+    if len(text) <= width:
+        return text
+    return text[:max(3, width - 3)] + "..."
+
+
+# Sort key for columns and row group columns by compression ratio
+_BY_RATIO = attrgetter('compression_ratio')
+
+
+def _order_by_ratio(columns) -> List[int]:
+    """Indices of columns by descending compression ratio, ties kept in order
+    
+    The same order as sorted(columns, key=_BY_RATIO, reverse=True), with the
+    sort done by NumPy over an array of the ratios.
+    """
+    ratios = np.fromiter(map(_BY_RATIO, columns), dtype=np.float64, count=len(columns))
+    return np.argsort(-ratios, kind="stable").tolist()
+
+
+def _clip_stat(text: str) -> str:
+    """Cut a formatted min/max statistic to 15 characters plus an ellipsis for the detail panels"""
+    return text[:15] + "..." if len(text) > 15 else text
+
+
+# Keys worth showing when summarizing nested records, in order of preference
+_PREVIEW_KEYS = ('data', 'maxPrice', 'minPrice', 'isBid', 'exchange', 'pair', 'lastPrice', 'timestamp')
+_ARRAY_PREVIEW_KEYS = _PREVIEW_KEYS[:-1]
+
+
+def _summarize_dicts(items, col_width: int, keys: Tuple[str, ...], list_values: bool = False) -> Optional[str]:
+    """Summarize the dicts among the first two items as Rich markup, or None if there are none
+    
+    Each dict shows up to two of the given keys it has, or failing that its
+    first two key names. With list_values, short numeric lists and
+    price/quantity pairs stored under a key are shown too.
+    """
+    # Use available column width minus brackets and dim formatting
+    max_content_len = max(10, col_width - 6)  # Reserve space for [dim] and []
+    content_parts = []
+    content_len = -1
+    for item in items[:2]:  # Show first 2 items
+        if content_len > max_content_len:
+            # What is already there gets truncated anyway, which narrow
+            # columns reach after the first item
+            break
+        if isinstance(item, dict):
+            shown_parts = []
+            for key in keys:
+                if key in item:
+                    val = item[key]
+                    if isinstance(val, (int, float)):
+                        shown_parts.append(f"{key}:{val:.2g}")
+                    elif isinstance(val, bool):
+                        shown_parts.append(f"{key}:{val}")
+                    elif isinstance(val, str) and len(val) < 8:
+                        shown_parts.append(f"{key}:{val}")
+                    elif key == 'data' and hasattr(val, '__len__') and len(val) > 0:
+                        # Handle the special 'data' field with price/quantity arrays
+                        try:
+                            first_pair = val[0]
+                            if hasattr(first_pair, '__len__') and len(first_pair) == 2:
+                                # Show first price/quantity pair
+                                if hasattr(first_pair, '__getitem__'):
+                                    price, qty = first_pair[0], first_pair[1]
+                                    shown_parts.append(f"data:[{price:.1f},{qty:.2f}...]")
+                        except:
+                            # Fallback for data field
+                            shown_parts.append(f"data:[{len(val)}]")
+                    elif list_values and isinstance(val, list) and len(val) > 0:
+                        if len(val) <= 3 and all(isinstance(x, (int, float)) for x in val):
+                            # Show numeric arrays directly
+                            vals_str = ','.join(f"{x:.2g}" for x in val)
+                            shown_parts.append(f"{key}:[{vals_str}]")
+                        elif len(val) <= 3 and all(isinstance(x, list) and len(x) == 2 for x in val):
+                            # Show price/quantity pairs
+                            pairs_str = ','.join(f"[{x[0]:.1f},{x[1]:.2f}]" for x in val[:2])
+                            shown_parts.append(f"{key}:[{pairs_str}...]")
+                    if len(shown_parts) >= 2:
+                        break
+            
+            if shown_parts:
+                content_parts.append('{' + ','.join(shown_parts) + '}')
+            else:
+                # Fallback to showing key names
+                item_keys = list(islice(item, 2))
+                content_parts.append('{' + ','.join(item_keys) + '...}')
+            content_len += 1 + len(content_parts[-1])
+    
+    if not content_parts:
+        return None
+    
+    content_str = ' '.join(content_parts)
+    content_str = _truncate(content_str, max_content_len)
+    return f"[dim][{content_str}][/dim]"
+
+
+def _cell_is_null(value) -> bool:
+    """Whether a data preview value is shown as NULL, including arrays of only nulls"""
+    # Handle pandas NA values (but be careful with arrays)
+    try:
+        is_na = pd.isna(value)
+        # If pd.isna returns an array, check if any/all are NA
+        if hasattr(is_na, '__len__') and not isinstance(is_na, str):
+            # This is an array of boolean values
+            return bool(is_na.all()) if len(is_na) > 0 else False
+        # This is a single boolean value
+        return bool(is_na)
+    except (ValueError, TypeError):
+        return False
+
+
+def format_cell(value, col_width: int) -> str:
+    """Format one data preview value as Rich markup, keeping it within col_width where possible"""
+    try:
+        if _cell_is_null(value):
+            return "[dim]NULL[/dim]"
+    except AttributeError:
+        return f"[dim]{type(value).__name__}[/dim]"
+    return _format_non_null_cell(value, col_width)
+
+
+def _format_number(value, col_width: int) -> str:
+    """Format a non-null Python number"""
+    if isinstance(value, float):
+        return f"{value:.3g}"
+    return str(value)
+
+
+def _format_nested(value, col_width: int) -> str:
+    """Format a list or dict value"""
+    # Try to provide more meaningful information about nested structures
+    if isinstance(value, list) and len(value) > 0:
+        first_item = value[0]
+        if isinstance(first_item, dict):
+            # Show meaningful content from nested objects
+            formatted_value = _summarize_dicts(value, col_width, _PREVIEW_KEYS)
+            if formatted_value is None:
+                formatted_value = f"[dim]list[{len(value)}×dict][/dim]"
+        elif isinstance(first_item, list):
+            # Handle nested lists - check for price/quantity patterns
+            if len(first_item) == 2 and all(isinstance(x, (int, float)) for x in first_item):
+                # Looks like price/quantity pairs
+                pairs = []
+                for item in value[:3]:
+                    if isinstance(item, list) and len(item) == 2:
+                        pairs.append(f"[{item[0]:.1f},{item[1]:.2f}]")
+                if len(value) > 3:
+                    pairs.append("...")
+                formatted_value = f"[dim][{','.join(pairs)}][/dim]"
+            else:
+                inner_len = len(first_item) if hasattr(first_item, '__len__') else '?'
+                formatted_value = f"[dim]list[{len(value)}×{inner_len}][/dim]"
+        else:
+            # Array of simple values
+            if all(isinstance(x, (int, float)) for x in value):
+                vals = [f"{x:.2g}" for x in value[:4]]
+                if len(value) > 4:
+                    vals.append("...")
+                formatted_value = f"[dim][{','.join(vals)}][/dim]"
+            else:
+                vals = [str(x)[:6] for x in value[:3]]
+                if len(value) > 3:
+                    vals.append("...")
+                formatted_value = f"[dim][{','.join(vals)}][/dim]"
+    elif isinstance(value, dict):
+        # Show dictionary content with values when possible
+        items_to_show = []
+        # Only the first few entries can be shown, so only those are listed
+        for key, val in islice(value.items(), 3):
+            if isinstance(val, (int, float)):
+                items_to_show.append(f"{key}:{val:.2g}")
+            elif isinstance(val, str) and len(val) < 6:
+                items_to_show.append(f"{key}:{val}")
+            else:
+                items_to_show.append(key)
+        
+        if items_to_show:
+            content = ','.join(items_to_show)
+            if len(value) > 3:
+                content += "..."
+            # Use available column width for dictionary content
+            max_dict_len = max(8, col_width - 4)  # Reserve space for {} and dim formatting
+            content = _truncate(content, max_dict_len)
+            formatted_value = f"[dim]{{{content}}}[/dim]"
+        else:
+            # Fallback to just keys
+            keys = list(islice(value, 3))
+            key_str = ','.join(keys)
+            if len(value) > 3:
+                key_str += "..."
+            formatted_value = f"[dim]{{{key_str}}}[/dim]"
+    else:
+        formatted_value = f"[dim]{type(value).__name__}[{len(value) if hasattr(value, '__len__') else '?'}][/dim]"
+    
+    return formatted_value
+
+
+def _all_numbers(values) -> bool:
+    """Whether every element is an int or float, decided from the dtype for typed NumPy arrays"""
+    if isinstance(values, np.ndarray) and values.dtype.kind != "O" and len(values) > 0:
+        # Of the NumPy scalar types only float64 subclasses float
+        return values.dtype.type is np.float64
+    return all(isinstance(x, (int, float)) for x in values)
+
+
+@functools.lru_cache(maxsize=256)
+def _array_shape_markup(shape: Tuple[int, ...]) -> str:
+    """Markup for an array shown by its shape, e.g. array[2×3]
+    
+    Columns of fixed-shape arrays repeat the same few shapes on every row.
+    """
+    return f"[dim]array[{'×'.join(map(str, shape))}][/dim]"
+
+
+def _format_array(value, col_width: int) -> str:
+    """Format a NumPy array or other array-like value"""
+    if len(value.shape) == 0:
+        # Zero-dimensional arrays print like scalars
+        return _truncate(str(value), col_width)
+    # This is likely a numpy array (not a scalar)
+    try:
+        if len(value.shape) == 1:
+            # 1D array - check what's inside
+            if len(value) <= 5 and len(value) > 0:
+                # Small array - show actual content
+                first_item = value[0] if len(value) > 0 else None
+                if isinstance(first_item, dict):
+                    # Array of dictionaries - show meaningful content
+                    formatted_value = _summarize_dicts(value, col_width, _ARRAY_PREVIEW_KEYS, list_values=True)
+                    if formatted_value is None:
+                        formatted_value = f"[dim][dict×{len(value)}][/dim]"
+                elif isinstance(first_item, list):
+                    # Array of lists - show some content
+                    if len(first_item) == 2 and all(isinstance(x, (int, float)) for x in first_item):
+                        # Looks like price/quantity pairs
+                        pairs = []
+                        for item in value[:3]:
+                            if isinstance(item, list) and len(item) == 2:
+                                pairs.append(f"[{item[0]:.1f},{item[1]:.2f}]")
+                        formatted_value = f"[dim][{','.join(pairs)}...][/dim]"
+                    else:
+                        inner_len = len(first_item) if hasattr(first_item, '__len__') else '?'
+                        formatted_value = f"[dim]list[{len(value)}×{inner_len}][/dim]"
+                else:
+                    # Array of simple values - show them directly
+                    if _all_numbers(value):
+                        vals = [f"{x:.2g}" for x in value[:4]]
+                        if len(value) > 4:
+                            vals.append("...")
+                        formatted_value = f"[dim][{','.join(vals)}][/dim]"
+                    else:
+                        vals = [str(x)[:6] for x in value[:3]]  
+                        if len(value) > 3:
+                            vals.append("...")
+                        formatted_value = f"[dim][{','.join(vals)}][/dim]"
+            else:
+                formatted_value = _array_shape_markup(value.shape)
+        else:
+            formatted_value = _array_shape_markup(value.shape)
+    except:
+        formatted_value = f"[dim]{type(value).__name__}[/dim]"
+    
+    return formatted_value
+
+
+# NumPy's own scalar types (np.ScalarType also lists the Python builtins)
+_NUMPY_SCALAR_TYPES = frozenset(t for t in np.ScalarType if issubclass(t, np.generic))
+
+
+# Formatters for values of exactly these types, as found in object columns
+_CELL_FORMATTERS = {
+    int: _format_number,
+    float: _format_number,
+    bool: _format_number,
+    complex: _format_number,
+    str: _truncate,
+    list: _format_nested,
+    dict: _format_nested,
+    np.ndarray: _format_array,
+}
+
+
+def _format_non_null_cell(value, col_width: int) -> str:
+    """Format a data preview value already known not to be null
+    
+    Values of the common plain types are formatted straight from
+    _CELL_FORMATTERS; anything else goes through the type checks below.
+    """
+    formatter = _CELL_FORMATTERS.get(type(value))
+    try:
+        if formatter is not None:
+            return formatter(value, col_width)
+        
+        # Handle simple numeric types
+        if isinstance(value, (int, float, complex)) and not pd.isna(value):
+            formatted_value = _format_number(value, col_width)
+        # Handle string types
+        elif isinstance(value, str):
+            formatted_value = _truncate(value, col_width)
+        # Handle complex/nested data (lists, dicts, etc.)
+        elif isinstance(value, (list, dict)):
+            formatted_value = _format_nested(value, col_width)
+        # Handle numpy arrays and pandas Series (but not scalar numpy types)
+        elif hasattr(value, '__array__') and hasattr(value, 'shape') and len(getattr(value, 'shape', [])) > 0:
+            formatted_value = _format_array(value, col_width)
+        # Handle numpy scalar types (int64, float64, etc.)
+        elif type(value) in _NUMPY_SCALAR_TYPES and not hasattr(value, 'shape'):
+            # This is a numpy scalar, treat it as a regular number/value
+            if hasattr(value, 'item'):
+                # Convert numpy scalar to Python type
+                python_val = value.item()
+                if isinstance(python_val, float):
+                    formatted_value = f"{python_val:.3g}"
+                else:
+                    formatted_value = str(python_val)
+            else:
+                formatted_value = str(value)
+        # Handle other types (datetime, etc.)
+        else:
+            formatted_value = _truncate(str(value), col_width)
+    except (ValueError, TypeError, AttributeError):
+        # Fallback for any problematic values
+        formatted_value = f"[dim]{type(value).__name__}[/dim]"
+    
+    return formatted_value
+
+
+def _format_float_cell(value, col_width: int) -> str:
+    """Format a non-null value from a float column"""
+    return f"{value:.3g}"
+
+
+def _format_preformatted_cell(value, col_width: int) -> str:
+    """Pass through a value formatted ahead of the row loop"""
+    return value
+
+
+def _format_integer_cell(value, col_width: int) -> str:
+    """Format a value from an integer or boolean column"""
+    return str(value)
+
+
+def _holds_only_strings(dtype) -> bool:
+    """Whether a column dtype guarantees str values (apart from nulls)"""
+    return isinstance(dtype, pd.StringDtype)
+
+
+def _is_float64(dtype) -> bool:
+    """Whether a column dtype holds float64 values, which format_cell gives three significant digits"""
+    return getattr(dtype, "kind", None) == "f" and dtype.itemsize == 8
+
+
+def pick_cell_formatter(dtype):
+    """Choose the cell formatter for a column of the given dtype
+    
+    Columns of any dtype but object have their nulls found up front with
+    isna(), so their formatters only see non-null values. Float64, integer
+    and boolean columns hold only values of that kind and skip the type
+    checks entirely. Narrower floats (float32, float16) aren't float
+    instances, so the general ladder prints them with str() rather than
+    with three significant digits. Object columns can hold arrays, whose null handling
+    isna() doesn't match, so they go through format_cell. Pandas string
+    columns report kind "O" too, but hold only str and nulls, so they are
+    just truncated.
+    """
+    if _holds_only_strings(dtype):
+        return _truncate
+    kind = getattr(dtype, "kind", None)
+    if _is_float64(dtype):
+        return _format_float_cell
+    if kind in ("i", "u", "b"):
+        return _format_integer_cell
+    if kind == "O":
+        return format_cell
+    return _format_non_null_cell
+
+
+# Rendered panels kept for recently visited view states (see ParquetTUI._cached_panel)
+PANEL_CACHE_SIZE = 8
+
+# Rows shown per page of the data view
+DATA_PAGE_ROWS = 20
+
+# Row style of the highlighted entry
+SELECTED_STYLE = "bold white on blue"
+
+# Rows reserved for the file browser's help panel
+HELP_PANEL_HEIGHT = 10
+
+
+@dataclass
+class FileEntry:
+    """A file browser row, classified once when the directory is scanned"""
+    __slots__ = ("icon", "name", "path", "is_dir", "is_parquet", "size", "type_str", "style")
+    icon: str
+    name: str
+    path: Optional[Path]
+    is_dir: bool
+    is_parquet: bool
+    size: int
+    type_str: str
+    style: str
+
+
 class FileSelector:
     """Interactive file selector for parquet files"""
     
-    def __init__(self):
-        self.console = Console()
+    def __init__(self, analyzer: Optional[ParquetAnalyzer] = None, console: Optional[Console] = None):
+        self.console = console or Console()
+        self.analyzer = analyzer or ParquetAnalyzer()
         self.current_path = Path.cwd()
         self.selected_index = 0
-        self.files_and_dirs = []
+        self.files_and_dirs: List[FileEntry] = []
         self.show_hidden = False
+        self.parquet_count = 0
+        self._frame_lines: Optional[List[str]] = None
+        self._cwd_title = ""
+        
+        # Background analysis of the highlighted parquet file, as (path, future)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch: Optional[Tuple[str, Future]] = None
         
     def scan_directory(self):
-        """Scan current directory for files and subdirectories"""
+        """Scan current directory for files and subdirectories
+        
+        Each entry is stored as a FileEntry, classified once here so rendering
+        doesn't have to.
+        """
         self.files_and_dirs = []
+        self.parquet_count = 0
+        
+        # Panel title for the directory, shortened to its tail if too long
+        cwd_str = str(self.current_path)
+        self._cwd_title = f"📂 File Browser - {cwd_str}" if len(cwd_str) <= 50 else f"📂 ...{cwd_str[-47:]}"
         
         # Add parent directory option (except for root)
         if self.current_path.parent != self.current_path:
-            self.files_and_dirs.append(("📁", "..", self.current_path.parent, True))
+            self.files_and_dirs.append(
+                FileEntry("📁", "..", self.current_path.parent, True, False, 0, "Parent", "yellow"))
         
         try:
-            # Get all items in current directory
-            items = list(self.current_path.iterdir())
+            # Classify everything in a single scandir pass; DirEntry caches the
+            # file type from the directory listing, so most entries need no stat
+            directories = []
+            parquet_files = []
+            other_files = []
+            show_hidden = self.show_hidden
+            with os.scandir(self.current_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    # Lowercased once, for both the suffix test and the sort key
+                    low = name.lower()
+                    hidden = name.startswith('.')
+                    if entry.is_dir():
+                        if not hidden or show_hidden:
+                            directories.append((low, name, entry))
+                    elif entry.is_file():
+                        # A bare ".parquet" is a hidden file without a suffix
+                        if low.endswith(('.parquet', '.pq')) and low not in ('.parquet', '.pq'):
+                            parquet_files.append((low, name, entry))
+                        elif not hidden or show_hidden:
+                            other_files.append((low, name, entry))
             
             # Sort: directories first, then files
-            directories = [item for item in items if item.is_dir() and (not item.name.startswith('.') or self.show_hidden)]
-            parquet_files = [item for item in items if item.is_file() and item.suffix.lower() in ['.parquet', '.pq']]
-            other_files = [item for item in items if item.is_file() and item.suffix.lower() not in ['.parquet', '.pq'] and (not item.name.startswith('.') or self.show_hidden)]
+            directories.sort(key=lambda item: item[0])
+            parquet_files.sort(key=lambda item: item[0])
+            other_files.sort(key=lambda item: item[0])
             
             # Add directories
-            for dir_path in sorted(directories, key=lambda x: x.name.lower()):
-                self.files_and_dirs.append(("📁", dir_path.name, dir_path, True))
+            for _, name, entry in directories:
+                self.files_and_dirs.append(
+                    FileEntry("📁", name, Path(entry.path), True, False, 0, "Dir", "cyan"))
             
             # Add parquet files (highlighted)
-            for file_path in sorted(parquet_files, key=lambda x: x.name.lower()):
-                size_mb = file_path.stat().st_size / (1024 * 1024) if file_path.exists() else 0
-                display_name = f"{file_path.name} ({size_mb:.1f}MB)"
-                self.files_and_dirs.append(("📊", display_name, file_path, False))
+            for _, name, entry in parquet_files:
+                # One stat for the size; the listing already told us it exists
+                try:
+                    size = entry.stat().st_size
+                except FileNotFoundError:
+                    # Removed since the directory was listed
+                    continue
+                self.parquet_count += 1
+                display_name = f"{name} ({size / (1024 * 1024):.1f}MB)"
+                self.files_and_dirs.append(
+                    FileEntry("📊", display_name, Path(entry.path), False, True, size, "Parquet", "bold green"))
             
             # Add other files (dimmed)
-            for file_path in sorted(other_files, key=lambda x: x.name.lower()):
-                if not file_path.name.startswith('.') or self.show_hidden:
-                    self.files_and_dirs.append(("📄", file_path.name, file_path, False))
+            for _, name, entry in other_files:
+                self.files_and_dirs.append(
+                    FileEntry("📄", name, Path(entry.path), False, False, 0, "File", "dim white"))
                     
         except PermissionError:
-            self.files_and_dirs.append(("❌", "Permission denied", None, False))
+            self.files_and_dirs.append(
+                FileEntry("❌", "Permission denied", None, False, False, 0, "Error", "red"))
         
         # Reset selection if out of bounds
         if self.selected_index >= len(self.files_and_dirs):
             self.selected_index = 0
     
-    def create_file_panel(self) -> Panel:
-        """Create the file browser panel"""
+    def create_file_panel(self, max_rows: Optional[int] = None) -> Panel:
+        """Create the file browser panel, showing at most max_rows entries around the selection"""
         if not self.files_and_dirs:
             return Panel("No files found", title="File Browser")
         
@@ -100,156 +708,234 @@ class FileSelector:
         table.add_column("Name", style="white", no_wrap=False)
         table.add_column("Type", width=8, style="dim")
         
-        for i, (icon, name, path, is_dir) in enumerate(self.files_and_dirs):
-            # Highlight selected item
-            style = "bold white on blue" if i == self.selected_index else None
-            
-            # Determine type and style
-            if path is None:
-                type_str = "Error"
-                name_style = "red"
-            elif name == "..":
-                type_str = "Parent"
-                name_style = "yellow"
-            elif is_dir:
-                type_str = "Dir"
-                name_style = "cyan"
-            elif path and path.suffix.lower() in ['.parquet', '.pq']:
-                type_str = "Parquet"
-                name_style = "bold green"
-            else:
-                type_str = "File"
-                name_style = "dim white"
-            
-            # Apply selection style if this row is selected
-            if style:
-                name_style = style
-            elif not style and name_style != "red":
-                # Apply type-specific styling only if not selected
-                pass
-            
-            table.add_row(icon, name, type_str, style=style)
+        # Ensure selected entry is visible - adjust display window if needed
+        start_index = 0
+        end_index = len(self.files_and_dirs)
+        if max_rows is not None:
+            if self.selected_index >= max_rows:
+                start_index = self.selected_index - max_rows + 1
+            end_index = start_index + max_rows
+        
+        for i in range(start_index, min(end_index, len(self.files_and_dirs))):
+            entry = self.files_and_dirs[i]
+            # Highlight selected item, otherwise style by entry type
+            style = SELECTED_STYLE if i == self.selected_index else entry.style
+            table.add_row(entry.icon, entry.name, entry.type_str, style=style)
+        
+        return Panel(table, title=self._cwd_title, border_style="green")
+    
+    def create_help_panel(self) -> Panel:
+        """Create the file browser help panel, sized to fit HELP_PANEL_HEIGHT"""
+        help_text = """[bold cyan]File Browser:[/bold cyan]
+├─ [bold]↑/↓ or j/k[/bold]: Move the selection
+├─ [bold]Enter[/bold]: Open a directory or select a parquet file
+├─ [bold]Backspace[/bold]: Go to the parent directory
+├─ [bold].[/bold]: Show or hide hidden files
+├─ [bold]r[/bold]: Rescan the current directory
+├─ [bold]q[/bold]: Quit without selecting
+└─ [bold]h[/bold]: Toggle this help"""
         
-        title = f"📂 File Browser - {self.current_path}"
-        if len(str(self.current_path)) > 50:
-            title = f"📂 ...{str(self.current_path)[-47:]}"
+        return Panel(help_text, title="❓ Help", border_style="dim")
+    
+    def write_frame(self, frame: str, full: bool = False):
+        """Write a rendered frame, repainting only the lines that changed since the last one"""
+        self._frame_lines = write_frame(self.console, frame, self._frame_lines, full)
+    
+    def prefetch_selected(self):
+        """Start analyzing the highlighted parquet file in the background
+        
+        The analysis overlaps with the user deciding what to open, so it is
+        often finished by the time Enter is pressed. Only the highlighted file
+        is kept; moving away cancels its analysis if it hasn't started yet.
+        """
+        path = None
+        size = 0
+        if self.selected_index < len(self.files_and_dirs):
+            entry = self.files_and_dirs[self.selected_index]
+            if entry.is_parquet:
+                path = str(entry.path)
+                size = entry.size
+        
+        if self._prefetch is not None:
+            if self._prefetch[0] == path:
+                return
+            self._prefetch[1].cancel()
+            self._prefetch = None
+        
+        if path is not None:
+            # The worker may still be busy with a previous file, so get the
+            # footer read under way now rather than when the analysis starts
+            warm_footer(path, size)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            future = self._executor.submit(self.analyzer.analyze_file, path, True)
+            self._prefetch = (path, future)
+    
+    def take_analysis(self, path: str) -> Optional[Future]:
+        """Hand over the background analysis of path, if one was started
+        
+        The future resolves to the result of analyze_file(path, extract_pages=True).
+        """
+        if self._prefetch is None or self._prefetch[0] != path:
+            return None
+        future = self._prefetch[1]
+        self._prefetch = None
+        return future
+    
+    def select_file(self) -> Optional[str]:
+        """Interactively browse for a parquet file, returning its path or None if cancelled
+        
+        A selector can be opened again; it resumes in the directory it was
+        left in, with a fresh listing.
+        """
+        show_help = False
+        self._frame_lines = None
+        self.scan_directory()
+        # The directory may have lost entries since the last visit
+        self.selected_index = min(self.selected_index, max(0, len(self.files_and_dirs) - 1))
+        self.console.show_cursor(False)
         
+        # Fixed screen regions; the frame always has the terminal's height, so
+        # every update can be written as a diff against the previous frame
+        layout = Layout(name="root")
+        layout.split_column(
+            Layout(name="file_browser", ratio=1),
+            Layout(name="help", size=HELP_PANEL_HEIGHT, visible=False),
+            Layout(name="status", size=2),
+            Layout(name="controls", size=2),
+        )
+        controls = "[bold green]Controls:[/bold green] [cyan]↑/↓ or j/k[/cyan] (navigate) [cyan]Enter[/cyan] (select) [cyan].[/cyan] (hidden) [cyan]q[/cyan] (quit) [cyan]h[/cyan] (help)"
+        layout["controls"].update(controls)
+        
+        def render_selector():
+            """Update the layout regions and write out whatever changed"""
+            # One line short of the screen, so the final newline doesn't scroll it
+            height = self.console.size.height - 1
+            
             # Help if requested
+            layout["help"].visible = show_help
             if show_help:
-                self.console.print(self.create_help_panel())
+                layout["help"].update(self.create_help_panel())
             
-            # Status
-            parquet_count = sum(1 for _, _, path, is_dir in self.files_and_dirs 
-                              if path and not is_dir and path.suffix.lower() in ['.parquet', '.pq'])
+            # Entries that fit the browser region, less the panel and table borders
+            browser_height = height - 4 - (HELP_PANEL_HEIGHT if show_help else 0)
+            layout["file_browser"].update(self.create_file_panel(max_rows=max(1, browser_height - 6)))
             
-            status = f"[bold green]Found {parquet_count} parquet file(s)[/bold green]"
+            # Status
+            status = f"[bold green]Found {self.parquet_count} parquet file(s)[/bold green]"
             if self.selected_index < len(self.files_and_dirs):
-                _, name, path, is_dir = self.files_and_dirs[self.selected_index]
-                if path and not is_dir and path.suffix.lower() in ['.parquet', '.pq']:
-                    status += f" | [bold cyan]Selected: {name}[/bold cyan]"
-            
-            controls = "[bold green]Controls:[/bold green] [cyan]↑/↓ or j/k[/cyan] (navigate) [cyan]Enter[/cyan] (select) [cyan].[/cyan] (hidden) [cyan]q[/cyan] (quit) [cyan]h[/cyan] (help)"
+                entry = self.files_and_dirs[self.selected_index]
+                if entry.is_parquet:
+                    status += f" | [bold cyan]Selected: {entry.name}[/bold cyan]"
+            layout["status"].update(f"\n{status}")
             
-            self.console.print(f"\n{status}")
-            self.console.print(controls)
+            with self.console.capture() as capture:
+                self.console.print(layout, height=height)
+            self.write_frame(capture.get())
         
         try:
-            render_selector()
-            
-            while True:
-                # Get input
-                fd = sys.stdin.fileno()
-                old_settings = termios.tcgetattr(fd)
-                try:
-                    tty.setraw(sys.stdin.fileno())
-                    key = sys.stdin.read(1)
-                finally:
-                    termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-                
+            fd = sys.stdin.fileno()
+            with self.console.screen(), cbreak_terminal(fd):
+                render_selector()
+                self.prefetch_selected()
+                last_render = time.monotonic()
                 needs_update = False
                 
-                if key == 'q' or key == 'Q':
-                    return None
-                elif key == 'h' or key == 'H':
-                    show_help = not show_help
-                    needs_update = True
-                elif key == '.' :
-                    self.show_hidden = not self.show_hidden
-                    self.scan_directory()
-                    needs_update = True
-                elif key == 'r' or key == 'R':
-                    self.scan_directory()
-                    needs_update = True
-                elif key == '\r' or key == '\n':  # Enter
-                    if self.selected_index < len(self.files_and_dirs):
-                        _, name, path, is_dir = self.files_and_dirs[self.selected_index]
-                        
-                        if path is None:
-                            continue
-                        elif name == ".." or is_dir:
-                            # Navigate to directory
-                            self.current_path = path
-                            self.selected_index = 0
+                while True:
+                    # Handle every key that arrived since the last render
+                    for key in read_keys(fd):
+                        # Selection moves are by far the most frequent keys
+                        move = SELECTOR_MOVES.get(key)
+                        if move is not None:
+                            index = max(0, min(self.selected_index + move, len(self.files_and_dirs) - 1))
+                            if index != self.selected_index:
+                                self.selected_index = index
+                                needs_update = True
+                        elif key == 'q' or key == 'Q':
+                            return None
+                        elif key == 'h' or key == 'H':
+                            show_help = not show_help
+                            needs_update = True
+                        elif key == '.' :
+                            self.show_hidden = not self.show_hidden
                             self.scan_directory()
                             needs_update = True
-                        elif path.suffix.lower() in ['.parquet', '.pq']:
-                            # Select parquet file
-                            return str(path)
-                elif key == '\x7f' or key == '\b':  # Backspace
-                    if self.current_path.parent != self.current_path:
-                        self.current_path = self.current_path.parent
-                        self.selected_index = 0
-                        self.scan_directory()
-                        needs_update = True
-                elif key == 'k' or key == 'K':  # Up navigation (fallback)
-                    if self.selected_index > 0:
-                        self.selected_index -= 1
-                        needs_update = True
-                elif key == 'j' or key == 'J':  # Down navigation (fallback)
-                    if self.selected_index < len(self.files_and_dirs) - 1:
-                        self.selected_index += 1
-                        needs_update = True
-                elif key == '\x1b':  # Escape or arrow key sequence
-                    # More robust arrow key detection
-                    sequence = [key]
-                    try:
-                        # Try to read a complete 3-character arrow sequence
-                        char2 = sys.stdin.read(1)
-                        sequence.append(char2)
-                        if char2 == '[':
-                            char3 = sys.stdin.read(1) 
-                            sequence.append(char3)
-                            
-                            # Check for standard arrow keys
-                            if char3 == 'A':  # Up arrow
-                                if self.selected_index > 0:
-                                    self.selected_index -= 1
-                                    needs_update = True
-                            elif char3 == 'B':  # Down arrow  
-                                if self.selected_index < len(self.files_and_dirs) - 1:
-                                    self.selected_index += 1
+                        elif key == 'r' or key == 'R':
+                            self.scan_directory()
+                            needs_update = True
+                        elif key == '\r' or key == '\n':  # Enter
+                            if self.selected_index < len(self.files_and_dirs):
+                                entry = self.files_and_dirs[self.selected_index]
+                        
+                                if entry.path is None:
+                                    continue
+                                elif entry.is_dir:
+                                    # Navigate to directory
+                                    self.current_path = entry.path
+                                    self.selected_index = 0
+                                    self.scan_directory()
                                     needs_update = True
-                            # Other arrow keys (C=right, D=left) are ignored in file browser
-                        # If not a complete arrow sequence, treat as ESC (ignored)
-                    except (OSError, ValueError):
-                        # If we can't read the sequence, just ignore
-                        pass
-                elif ord(key) == 3:  # Ctrl+C
-                    return None
+                                elif entry.is_parquet:
+                                    # Select parquet file
+                                    return str(entry.path)
+                        elif key == '\x7f' or key == '\b':  # Backspace
+                            if self.current_path.parent != self.current_path:
+                                self.current_path = self.current_path.parent
+                                self.selected_index = 0
+                                self.scan_directory()
+                                needs_update = True
+                        elif key.startswith('\x1b'):
+                            # ESC and other escape sequences (left/right arrows) are ignored
+                            pass
                 
-                if needs_update:
-                    render_selector()
+                    # Skip rendering when nothing changed, and defer it while
+                    # more keys arrive within the current frame
+                    if needs_update and not frame_deferred(fd, last_render):
+                        render_selector()
+                        self.prefetch_selected()
+                        last_render = time.monotonic()
+                        needs_update = False
                     
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             return None
         finally:
             self.console.show_cursor(True)
+            if self._executor is not None:
+                # A running analysis finishes in the background for take_analysis
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+# Key bindings shown by the main TUI's help panel
+_HELP_TEXT = """[bold cyan]Navigation:[/bold cyan]
+├─ [bold]f[/bold]: File Browser - Load a different Parquet file
+├─ [bold]1[/bold]: Overview - File summary and basic statistics
+├─ [bold]2[/bold]: Schema - Nested structure and field types  
+├─ [bold]3[/bold]: Row Groups - Compression analysis with navigation
+├─ [bold]4[/bold]: Pages - Page-level data organization
+├─ [bold]5[/bold]: Optimization - Improvement recommendations
+├─ [bold]6[/bold]: Data - Preview actual data content
+├─ [bold]↑/↓ or j/k[/bold]: Navigate columns (Row Groups) / Page through data (Data view)
+├─ [bold]q[/bold]: Quit
+└─ [bold]h[/bold]: Toggle this help
+
+[bold cyan]Views:[/bold cyan]
+├─ [bold]1[/bold]: Overview - File summary and statistics
+├─ [bold]2[/bold]: Data - Preview actual data content (j/k to page)  
+├─ [bold]3[/bold]: Schema - Nested structure analysis  
+├─ [bold]4[/bold]: Compression - Column-by-column analysis (j/k to navigate)
+├─ [bold]5[/bold]: Pages - Page-level data organization
+├─ [bold]6[/bold]: Optimization - Improvement recommendations
+└─ [bold]j/k[/bold]: Navigate columns (in Row Groups view)"""
+
+_CONTROLS_TEXT = "[bold green]Controls:[/bold green] [cyan]f[/cyan] <file> [cyan]1[/cyan] <overview> [cyan]2[/cyan] <data> [cyan]3[/cyan] <schema> [cyan]4[/cyan] <row groups> [cyan]5[/cyan] <pages> [cyan]6[/cyan] <optimization> [cyan]ESC[/cyan] <back/exit> [cyan]↑/↓ or j/k[/cyan] <navigate> [cyan]h[/cyan] <help> [cyan]q[/cyan] <quit>"
 
 
 class ParquetTUI:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, analyzer: Optional[ParquetAnalyzer] = None,
+                 console: Optional[Console] = None):
         self.file_path = file_path
-        self.console = Console()
+        self._console = console or Console()
         self.current_view = "overview"  # overview, data, schema, rowgroups, pages, optimization
         self.selected_column = 0
         self.data_row_offset = 0  # For data view pagination
@@ -260,68 +946,292 @@ class ParquetTUI:
         self.selected_rowgroup_column = 0
         
         self.analysis: Optional[ParquetAnalysis] = None
-        self.analyzer = ParquetAnalyzer()
-        
+        self.analyzer = analyzer or ParquetAnalyzer()
+        # Analysis of file_path already started by the file browser, if any
+        self._pending_analysis: Optional[Future] = None
+        self._file_selector: Optional[FileSelector] = None
+        
+        # Display data derived from the analysis, see _prepare_views
+        self._file_basename = ""
+        self._n_columns = 0
+        self._n_rowgroups = 0
+        self._data_pages = 0
+        self._schema_tree: Optional[Tree] = None
+        self._overview_rows: List[Tuple[str, str]] = []
+        self._columns_by_ratio = []
+        self._rg_row_texts: List[Tuple[Text, ...]] = []
+        self._rg_columns_sorted = []
+        self._rg_column_texts: List[List[Tuple[Text, ...]]] = []
+        # Truncated row group column names by (row group, column width)
+        self._rg_column_names: Dict[Tuple[int, int], List[str]] = {}
+        self._rg_summary_rows: List[List[Tuple[str, str]]] = []
+        # Panel titles per row group, parsed from markup once
+        self._rg_detail_titles: List[Text] = []
+        self._rg_summary_titles: List[Text] = []
+        self._columns_with_pages = []
+        self._avg_page_ratios: List[float] = []
+        self._most_pages_col = None
+        self._least_pages_col = None
+        self._total_pages = 0
+        self._page_size_counts = (0, 0, 0)
+        
+        # The optimization panel only depends on the analysis, kept as (analysis, panel)
+        self._optimization_panel: Optional[Tuple[ParquetAnalysis, Panel]] = None
+        
+        # Data view columns of the file, as (all, nested), and the columns
+        # shown from them by available width, see create_data_panel
+        self._preview_columns: Optional[Tuple[List[str], List[str]]] = None
+        self._column_layout: Dict[int, Tuple[List[str], set, List[str], List[str]]] = {}
+        
+        # Terminal size, cached between window resizes (see terminal_size),
+        # and whether a SIGWINCH arrived since the caches were last reset
+        self._term_size: Optional[ConsoleDimensions] = None
+        self._resized = False
+        
+        # The help and controls never change, so their markup is parsed once.
+        # The controls are highlighted like a printed string would be; panel
+        # contents never are
+        self._help_panel = Panel(Text.from_markup(_HELP_TEXT), title="❓ Help", border_style="dim")
+        self._controls_text = self.console.render_str(_CONTROLS_TEXT)
+        # Static start of the status line by (view, row groups level), see
+        # create_status_text
+        self._status_templates: Dict[Tuple[str, Optional[str]], Text] = {}
+        
+        # Rendered panels by view state, least recently used first
+        self._panel_cache: "OrderedDict[tuple, Panel]" = OrderedDict()
+        
+        # Lines of the last frame written, for redrawing only what changed
+        self._frame_lines: Optional[List[str]] = None
+        
+        # Key loop state, see run
+        self.show_help = False
+        self._running = False
+        
+        # Key handlers by key; each returns whether the view needs a redraw
+        self._key_handlers: Dict[str, Callable[[], bool]] = {
+            'q': self._quit, 'Q': self._quit,
+            'h': self._toggle_help, 'H': self._toggle_help,
+            '1': functools.partial(self._switch_view, "overview"),
+            '2': functools.partial(self._switch_view, "data"),
+            '3': functools.partial(self._switch_view, "schema"),
+            '4': functools.partial(self._switch_view, "rowgroups"),
+            '5': functools.partial(self._switch_view, "pages"),
+            '6': functools.partial(self._switch_view, "optimization"),
+            # vi-style alternatives to the up and down arrows
+            'j': self._nav_down, 'J': self._nav_down,
+            'k': self._nav_up, 'K': self._nav_up,
+            'f': self._open_file_browser, 'F': self._open_file_browser, '0': self._open_file_browser,
+            '\x1b[A': self._arrow(self._nav_up),
+            '\x1b[B': self._arrow(self._nav_down),
+            '\x1b[C': self._arrow(self._drill_in),
+            '\x1b[D': self._arrow(self._drill_out, needs_analysis=False),
+        }
+        
+    @property
+    def terminal_size(self) -> ConsoleDimensions:
+        """The console size, queried once and then again only after a SIGWINCH"""
+        if self._term_size is None:
+            self._term_size = self.console.size
+        return self._term_size
+    
+    @property
+    def console(self) -> Console:
+        return self._console
+    
+    @console.setter
+    def console(self, console: Console):
+        # Whatever was sized for the previous console no longer applies
+        self._console = console
+        self._apply_resize()
+    
+    def _on_resize(self, signum, frame):
+        """SIGWINCH handler: flag the resize for the key loop to apply
+        
+        Signal handlers run between any two bytecodes of the main thread, in
+        the middle of a panel cache lookup or a render, so the caches are only
+        reset from the key loop (see _apply_resize).
+        """
+        self._resized = True
+    
+    def _apply_resize(self):
+        """Drop the cached terminal size and width-dependent text"""
+        # Cleared first, so a resize arriving while the caches are reset
+        # is applied again on the next pass
+        self._resized = False
+        self._term_size = None
+        self._rg_column_names = {}
+        self._panel_cache.clear()
+        # Rows no longer line up with the previous frame's lines
+        self._frame_lines = None
+    
+    def _cached_panel(self, name: str, build) -> Panel:
+        """Return the panel build() makes for the current view state
+        
+        Panels are kept for the last PANEL_CACHE_SIZE states, keyed by name
+        and the navigation state, so keys that don't change what a panel
+        shows (toggling help, going back to a visited page) reuse it.
+        """
+        key = (name, self.compression_level, self.selected_column, self.selected_rowgroup,
+               self.selected_rowgroup_column, self.data_row_offset)
+        cache = self._panel_cache
+        panel = cache.get(key)
+        if panel is None:
+            panel = build()
+            cache[key] = panel
+            if len(cache) > PANEL_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return panel
+    
     def load_parquet_file(self) -> bool:
         """Load and analyze the parquet file using the refactored analyzer"""
         try:
             self.console.print(f"[bold blue]Loading {self.file_path}...[/bold blue]")
             
-            # Use the refactored analyzer
-            self.analysis = self.analyzer.analyze_file(self.file_path)
+            # Use the refactored analyzer; the Pages view needs the page estimates
+            pending, self._pending_analysis = self._pending_analysis, None
+            if pending is not None and not pending.cancelled():
+                self.analysis = pending.result()
+            else:
+                self.analysis = self.analyzer.analyze_file(self.file_path, extract_pages=True)
+            self._prepare_views()
             return True
             
         except Exception as e:
             self.console.print(f"[bold red]Error loading file: {e}[/bold red]")
             return False
     
-    def create_overview_panel(self) -> Panel:
-        """Create the overview panel"""
-        if not self.analysis:
-            return Panel("No data loaded", title="Overview")
-        
-        table = Table(show_header=False, box=box.SIMPLE)
-        table.add_column("Property", style="bold cyan")
-        table.add_column("Value", style="white")
-        
-        # File info
-        table.add_row("File", Path(self.analysis.file_path).name)
-        table.add_row("File Size", f"{self.analysis.file_size_bytes / (1024*1024):.2f} MB")
-        table.add_row("Rows", f"{self.analysis.total_rows:,}")
-        table.add_row("Logical Columns", f"{self.analysis.num_logical_columns}")
-        table.add_row("Physical Columns", f"{self.analysis.num_physical_columns}")
-        table.add_row("Row Groups", f"{self.analysis.num_row_groups}")
-        
-        # Size info
-        uncompressed_mb = self.analysis.total_uncompressed / (1024 * 1024)
-        compressed_mb = self.analysis.total_compressed / (1024 * 1024)
+    def _prepare_views(self):
+        """Precompute the sorted and formatted data the panels display
+        
+        The analysis doesn't change once loaded, so this runs once per file
+        instead of on every keystroke.
+        """
+        analysis = self.analysis
+        self._file_basename = Path(analysis.file_path).name
+        
+        # Counts the key handlers and status line check on every key (data
+        # pages are DATA_PAGE_ROWS rows; _total_pages counts parquet pages)
+        self._n_columns = len(analysis.columns)
+        self._n_rowgroups = len(analysis.row_groups)
+        self._data_pages = (analysis.total_rows + DATA_PAGE_ROWS - 1) // DATA_PAGE_ROWS
+        
+        # Read from the file's schema when the data view is first shown
+        self._preview_columns = None
+        self._column_layout = {}
+        
+        # Overview rows: file info, then size info
+        rows = [
+            ("File", self._file_basename),
+            ("File Size", f"{analysis.file_size_bytes / (1024*1024):.2f} MB"),
+            ("Rows", f"{analysis.total_rows:,}"),
+            ("Logical Columns", f"{analysis.num_logical_columns}"),
+            ("Physical Columns", f"{analysis.num_physical_columns}"),
+            ("Row Groups", f"{analysis.num_row_groups}"),
+        ]
         
         # Safe division for compression ratio
-        if self.analysis.total_uncompressed > 0:
-            overall_ratio = self.analysis.total_compressed / self.analysis.total_uncompressed
+        if analysis.total_uncompressed > 0:
+            overall_ratio = analysis.total_compressed / analysis.total_uncompressed
             ratio_text = f"{overall_ratio:.1%}"
         else:
             ratio_text = "N/A"
         
-        table.add_row("Uncompressed", f"{uncompressed_mb:.2f} MB")
-        table.add_row("Compressed", f"{compressed_mb:.2f} MB")
-        table.add_row("Compression Ratio", ratio_text)
+        rows.append(("Uncompressed", f"{analysis.total_uncompressed / (1024 * 1024):.2f} MB"))
+        rows.append(("Compressed", f"{analysis.total_compressed / (1024 * 1024):.2f} MB"))
+        rows.append(("Compression Ratio", ratio_text))
         
         # Creator info
-        if self.analysis.created_by:
-            table.add_row("Created By", self.analysis.created_by)
-        
-        return Panel(table, title="Parquet File Overview", border_style="blue")
+        if analysis.created_by:
+            rows.append(("Created By", analysis.created_by))
+        self._overview_rows = rows
+        
+        self._schema_tree = self._build_schema_tree()
+        
+        # Columns and row group columns sorted by compression ratio (worst first)
+        columns_order = _order_by_ratio(analysis.columns)
+        self._columns_by_ratio = [analysis.columns[i] for i in columns_order]
+        self._rg_columns_sorted = [
+            [rg.columns[i] for i in _order_by_ratio(rg.columns)] for rg in analysis.row_groups
+        ]
+        
+        # Row group browser cells, with markup parsed once rather than on
+        # every render of the table
+        self._rg_row_texts = [
+            tuple(Text.from_markup(cell) for cell in (
+                str(rg.index),
+                f"{rg.num_rows:,}",
+                format_size(rg.total_uncompressed_size),
+                format_size(rg.total_compressed_size),
+                f"{rg.compression_ratio:.1%}",
+                rg.get_min_max_hint(),
+            ))
+            for rg in analysis.row_groups
+        ]
+        
+        # Row group column detail cells (all but the width-dependent name),
+        # in the same order as _rg_columns_sorted
+        self._rg_column_texts = [
+            [self._rowgroup_column_texts(col) for col in columns]
+            for columns in self._rg_columns_sorted
+        ]
+        self._rg_column_names = {}
+        self._panel_cache.clear()
+        self._rg_summary_rows = [self._rowgroup_summary_rows(rg) for rg in analysis.row_groups]
+        self._rg_detail_titles = [
+            Text.from_markup(f"🗜️ Row Group {rg.index} - Column Details ({rg.num_rows:,} rows)")
+            for rg in analysis.row_groups
+        ]
+        self._rg_summary_titles = [
+            Text.from_markup(f"🗂️ Row Group {rg.index} Summary - SIDE PANEL") for rg in analysis.row_groups
+        ]
+        
+        # Columns with page estimates, and the statistics the Pages view reports
+        with_pages = [i for i, col in enumerate(analysis.columns) if col.pages and col.num_pages > 0]
+        cols_with_pages = [analysis.columns[i] for i in with_pages]
+        self._columns_with_pages = cols_with_pages
+        # Mean page compression ratio of each column (NaN without pages), in
+        # the same order as _columns_by_ratio
+        avg_page_ratios = np.full(len(analysis.columns), np.nan)
+        if cols_with_pages:
+            count = len(cols_with_pages)
+            page_counts = np.fromiter((len(c.pages) for c in cols_with_pages), dtype=np.int64, count=count)
+            page_ratios = np.fromiter(
+                (p.compression_ratio for c in cols_with_pages for p in c.pages),
+                dtype=np.float64, count=int(page_counts.sum()),
+            )
+            starts = np.concatenate(([0], np.cumsum(page_counts)[:-1]))
+            avg_page_ratios[with_pages] = np.add.reduceat(page_ratios, starts) / page_counts
+            
+            num_pages = np.fromiter((c.num_pages for c in cols_with_pages), dtype=np.int64, count=count)
+            uncompressed = np.fromiter((c.uncompressed_size for c in cols_with_pages), dtype=np.int64, count=count)
+            avg_page_size = uncompressed // num_pages
+            
+            self._total_pages = int(num_pages.sum())
+            self._most_pages_col = cols_with_pages[int(num_pages.argmax())]
+            self._least_pages_col = cols_with_pages[int(num_pages.argmin())]
+            # Large (>1MB), medium (256KB-1MB) and small (<256KB) average page sizes
+            self._page_size_counts = (
+                int((avg_page_size > 1 << 20).sum()),
+                int(((avg_page_size >= 1 << 18) & (avg_page_size <= 1 << 20)).sum()),
+                int((avg_page_size < 1 << 18).sum()),
+            )
+        else:
+            self._most_pages_col = self._least_pages_col = None
+            self._total_pages = 0
+            self._page_size_counts = (0, 0, 0)
+        self._avg_page_ratios = avg_page_ratios[columns_order].tolist()
     
-    def create_schema_panel(self) -> Panel:
-        """Create the schema tree panel using the new schema structure"""
-        if not self.analysis:
-            return Panel("No data loaded", title="Schema")
-        
+    def _build_schema_tree(self) -> Tree:
+        """Build the schema tree, walking nested fields with an explicit stack"""
         tree = Tree("🗂️ Schema")
         
-        def add_schema_field_to_tree(parent_node, field, depth=0):
-            """Recursively add schema fields to the tree structure"""
+        # Children are pushed in reverse so they are added in schema order
+        stack = [(tree, field) for field in reversed(self.analysis.schema_fields)]
+        while stack:
+            parent_node, field = stack.pop()
+            
             # Create field display text
             field_text = f"[bold]{field.name}[/bold] ({field.type_str})"
             if field.nullable:
@@ -337,15 +1247,30 @@ class ParquetTUI:
             if field.physical_type:
                 field_node.add(f"Physical: [bold yellow]{field.physical_type}[/bold yellow]")
             
-            # Recursively add children
-            for child in field.children:
-                add_schema_field_to_tree(field_node, child, depth + 1)
+            stack.extend((field_node, child) for child in reversed(field.children))
+        
+        return tree
+    
+    def create_overview_panel(self) -> Panel:
+        """Create the overview panel"""
+        if not self.analysis:
+            return Panel("No data loaded", title="Overview")
+        
+        table = Table(show_header=False, box=box.SIMPLE)
+        table.add_column("Property", style="bold cyan")
+        table.add_column("Value", style="white")
+        
+        for name, value in self._overview_rows:
+            table.add_row(name, value)
         
-        # Process each top-level field
-        for field in self.analysis.schema_fields:
-            add_schema_field_to_tree(tree, field)
+        return Panel(table, title="Parquet File Overview", border_style="blue")
+    
+    def create_schema_panel(self) -> Panel:
+        """Create the schema tree panel using the new schema structure"""
+        if not self.analysis:
+            return Panel("No data loaded", title="Schema")
         
-        return Panel(tree, title="🏗️ Schema Structure", border_style="green")
+        return Panel(self._schema_tree, title="🏗️ Schema Structure", border_style="green")
     
     def create_compression_panel(self) -> Panel:
         """Create the row groups analysis panel with hierarchical navigation"""
@@ -353,7 +1278,7 @@ class ParquetTUI:
             return Panel("No data loaded", title="Row Groups")
         
         if self.compression_level == "file":
-            return Panel(f"File: {Path(self.analysis.file_path).name}\nRows: {self.analysis.total_rows:,}\nColumns: {self.analysis.num_logical_columns}\nRow Groups: {self.analysis.num_row_groups}", title="PARQUET FILE OVERVIEW", border_style="green")
+            return Panel(f"File: {self._file_basename}\nRows: {self.analysis.total_rows:,}\nColumns: {self.analysis.num_logical_columns}\nRow Groups: {self.analysis.num_row_groups}", title="PARQUET FILE OVERVIEW", border_style="green")
         elif self.compression_level == "rowgroups":
             return self._create_rowgroups_browser_panel()
         elif self.compression_level == "rowgroup_detail":
@@ -367,8 +1292,8 @@ class ParquetTUI:
             return Panel("No row group data available", title="Row Groups")
         
         # Get terminal size for responsive layout
-        terminal_width = self.console.size.width
-        terminal_height = self.console.size.height
+        terminal_width = self.terminal_size.width
+        terminal_height = self.terminal_size.height
         
         # Reserve space for UI
         reserved_space = 12
@@ -390,27 +1315,10 @@ class ParquetTUI:
         # Show row groups (potentially paginated)
         displayed_rgs = self.analysis.row_groups[:max_rows] if len(self.analysis.row_groups) > max_rows else self.analysis.row_groups
         
-        for i, rg in enumerate(displayed_rgs):
+        for i in range(len(displayed_rgs)):
             is_selected = i == self.selected_rowgroup
             style = "bold white on blue" if is_selected else None
-            
-            def format_size(size_bytes):
-                mb = size_bytes / (1024 * 1024)
-                if mb >= 1:
-                    return f"{mb:.1f}MB"
-                else:
-                    kb = size_bytes / 1024
-                    return f"{kb:.0f}KB" if kb >= 1 else f"{size_bytes}B"
-            
-            table.add_row(
-                str(rg.index),
-                f"{rg.num_rows:,}",
-                format_size(rg.total_uncompressed_size),
-                format_size(rg.total_compressed_size),
-                f"{rg.compression_ratio:.1%}",
-                rg.get_min_max_hint(),
-                style=style
-            )
+            table.add_row(*self._rg_row_texts[i], style=style)
         
         title = f"🗜️ Row Group Browser - MAIN PANEL ({len(self.analysis.row_groups)} row groups)"
         if len(self.analysis.row_groups) > max_rows:
@@ -432,8 +1340,8 @@ class ParquetTUI:
         rg = self.analysis.row_groups[self.selected_rowgroup]
         
         # Get terminal size
-        terminal_width = self.console.size.width
-        terminal_height = self.console.size.height
+        terminal_width = self.terminal_size.width
+        terminal_height = self.terminal_size.height
         col_width = max(15, (terminal_width - 90) // 2)
         
         reserved_space = 12
@@ -452,74 +1360,93 @@ class ParquetTUI:
         # Ensure selected_rowgroup_column is within bounds
         self.selected_rowgroup_column = max(0, min(self.selected_rowgroup_column, len(rg.columns) - 1))
         
-        # Sort columns by compression ratio (worst first)
-        sorted_columns = sorted(rg.columns, key=lambda x: x.compression_ratio, reverse=True)
+        # Columns sorted by compression ratio (worst first)
+        sorted_columns = self._rg_columns_sorted[self.selected_rowgroup]
+        column_texts = self._rg_column_texts[self.selected_rowgroup]
+        
+        # Column names truncated to fit, computed once per row group and width
+        names_key = (self.selected_rowgroup, col_width)
+        column_names = self._rg_column_names.get(names_key)
+        if column_names is None:
+            column_names = [
+                "..." + col.name[-(col_width-6):] if len(col.name) > col_width - 3 else col.name
+                for col in sorted_columns
+            ]
+            self._rg_column_names[names_key] = column_names
         # Ensure selected column is visible - adjust display window if needed
         start_index = 0
         if self.selected_rowgroup_column >= max_rows:
             start_index = max(0, self.selected_rowgroup_column - max_rows + 1)
         
-        displayed_columns = sorted_columns[start_index:start_index + max_rows]
-        
-        for i, col in enumerate(displayed_columns):
+        for actual_index in range(start_index, min(start_index + max_rows, len(sorted_columns))):
             # Highlight selected column - check if this column index matches selection
-            actual_index = start_index + i
             is_selected = actual_index == self.selected_rowgroup_column
             style = "bold white on blue" if is_selected else None
             
-            # Truncate column name
-            if len(col.name) > col_width - 3:
-                col_name = "..." + col.name[-(col_width-6):]
-            else:
-                col_name = col.name
-            
-            # Format min/max values
-            min_max_str = "No range data"
-            if col.min_value is not None and col.max_value is not None:
-                min_str = str(col.min_value)[:15]
-                max_str = str(col.max_value)[:15]
-                min_max_str = f"{min_str} → {max_str}"
-            
-            def format_size(size_bytes):
-                mb = size_bytes / (1024 * 1024)
-                kb = size_bytes / 1024
-                if mb >= 1:
-                    return f"{mb:.1f}MB"
-                elif kb >= 1:
-                    return f"{kb:.0f}KB"
-                else:
-                    return f"{size_bytes}B"
-            
-            table.add_row(
-                col_name,
-                col.physical_type[:6],
-                format_size(col.uncompressed_size),
-                format_size(col.compressed_size),
-                f"{col.compression_ratio:.1%}",
-                min_max_str,
-                style=style
-            )
+            table.add_row(column_names[actual_index], *column_texts[actual_index], style=style)
         
-        title = f"🗜️ Row Group {rg.index} - Column Details ({rg.num_rows:,} rows)"
+        title = self._rg_detail_titles[self.selected_rowgroup]
         footer_text = "[bold cyan]Navigation:[/bold cyan] ↑/↓ (columns) ← (back to row groups) ESC (file level)"
         table.caption = footer_text
         
         return Panel(table, title=title, border_style="magenta")
     
+    @staticmethod
+    def _rowgroup_summary_rows(rg) -> List[Tuple[str, str]]:
+        """Format the (property, value) rows of a row group's summary panel"""
+        rows = [
+            ("🗂️ Row Group", f"#{rg.index}"),
+            ("📊 Rows", f"{rg.num_rows:,}"),
+            ("🔢 Columns", f"{len(rg.columns)}"),
+            ("📏 Uncompr", format_size(rg.total_uncompressed_size)),
+            ("📦 Compr", format_size(rg.total_compressed_size)),
+            ("📈 Ratio", f"{rg.compression_ratio:.1%}"),
+            ("💰 Saved", format_size(rg.total_uncompressed_size - rg.total_compressed_size)),
+        ]
+        
+        # Show best and worst columns in this row group
+        if rg.columns:
+            best_col = min(rg.columns, key=_BY_RATIO)
+            # Last of the worst on ties, as a stable ascending sort would give
+            worst_col = max(reversed(rg.columns), key=_BY_RATIO)
+            rows.append(("🎯 Best Col", f"{best_col.name[:12]}... ({best_col.compression_ratio:.1%})"))
+            rows.append(("⚠️ Worst Col", f"{worst_col.name[:12]}... ({worst_col.compression_ratio:.1%})"))
+        
+        # Show hint about min/max
+        rows.append(("📋 Ranges", _truncate(rg.get_min_max_hint(), 40)))
+        return rows
+    
+    @staticmethod
+    def _rowgroup_column_texts(col) -> Tuple[Text, ...]:
+        """Format the detail cells of a row group column, except its name"""
+        min_max_str = "No range data"
+        if col.min_value is not None and col.max_value is not None:
+            min_str = col.format_stat(col.min_value)[:15]
+            max_str = col.format_stat(col.max_value)[:15]
+            min_max_str = f"{min_str} → {max_str}"
+        
+        return tuple(Text.from_markup(cell) for cell in (
+            col.physical_type[:6],
+            format_size(col.uncompressed_size),
+            format_size(col.compressed_size),
+            f"{col.compression_ratio:.1%}",
+            min_max_str,
+        ))
+    
     def create_pages_panel(self) -> Panel:
         """Create the page-level analysis panel"""
         if not self.analysis:
             return Panel("No data loaded", title="Page Analysis")
         
         # Get terminal size for responsive layout
-        terminal_width = self.console.size.width
+        terminal_width = self.terminal_size.width
         
         # Create summary statistics
-        total_pages = sum(col.num_pages for col in self.analysis.columns if col.pages)
+        total_pages = self._total_pages
         avg_pages_per_col = total_pages / len(self.analysis.columns) if self.analysis.columns else 0
         
         # Find columns with most/least pages
-        columns_with_pages = [col for col in self.analysis.columns if col.pages and col.num_pages > 0]
+        columns_with_pages = self._columns_with_pages
         
         if not columns_with_pages:
             return Panel(
@@ -543,7 +1470,7 @@ class ParquetTUI:
         content.append(f"└─ Columns analyzed: [bold]{len(columns_with_pages)}[/bold]\n")
         
         # Column with most pages
-        most_pages_col = max(columns_with_pages, key=lambda x: x.num_pages)
+        most_pages_col = self._most_pages_col
         content.append("[bold green]📈 MOST FRAGMENTED COLUMN[/bold green]")
         content.append(f"├─ Column: [bold]{most_pages_col.name[:40]}[/bold]")
         content.append(f"├─ Estimated pages: [bold]{most_pages_col.num_pages}[/bold]")
@@ -551,7 +1478,7 @@ class ParquetTUI:
         content.append(f"└─ Page efficiency: [bold]{most_pages_col.compression_ratio:.1%}[/bold]\n")
         
         # Column with least pages (most efficient)
-        least_pages_col = min(columns_with_pages, key=lambda x: x.num_pages)
+        least_pages_col = self._least_pages_col
         content.append("[bold blue]🎯 MOST EFFICIENT COLUMN[/bold blue]")
         content.append(f"├─ Column: [bold]{least_pages_col.name[:40]}[/bold]")
         content.append(f"├─ Estimated pages: [bold]{least_pages_col.num_pages}[/bold]")
@@ -561,23 +1488,21 @@ class ParquetTUI:
         # Page size distribution
         content.append("[bold magenta]📏 PAGE SIZE DISTRIBUTION[/bold magenta]")
         
-        # Categorize columns by estimated page size
-        large_page_cols = [col for col in columns_with_pages if col.uncompressed_size // col.num_pages > 1024*1024]  # >1MB
-        medium_page_cols = [col for col in columns_with_pages if 256*1024 <= col.uncompressed_size // col.num_pages <= 1024*1024]  # 256KB-1MB
-        small_page_cols = [col for col in columns_with_pages if col.uncompressed_size // col.num_pages < 256*1024]  # <256KB
+        # Columns by estimated page size, counted in _prepare_views
+        large_pages, medium_pages, small_pages = self._page_size_counts
         
-        content.append(f"├─ Large pages (>1MB): [bold]{len(large_page_cols)}[/bold] columns")
-        content.append(f"├─ Medium pages (256KB-1MB): [bold]{len(medium_page_cols)}[/bold] columns")
-        content.append(f"└─ Small pages (<256KB): [bold]{len(small_page_cols)}[/bold] columns\n")
+        content.append(f"├─ Large pages (>1MB): [bold]{large_pages}[/bold] columns")
+        content.append(f"├─ Medium pages (256KB-1MB): [bold]{medium_pages}[/bold] columns")
+        content.append(f"└─ Small pages (<256KB): [bold]{small_pages}[/bold] columns\n")
         
         # Recommendations
         content.append("[bold yellow]💡 PAGE OPTIMIZATION TIPS[/bold yellow]")
         
-        if len(small_page_cols) > len(large_page_cols):
+        if small_pages > large_pages:
             content.append("├─ ⚠️ Many small pages detected")
             content.append("│  └─ Consider larger row groups or page sizes")
         
-        if len(large_page_cols) > 0:
+        if large_pages > 0:
             content.append("├─ ✅ Some large pages found")
             content.append("│  └─ Good for compression efficiency")
         
@@ -591,14 +1516,24 @@ class ParquetTUI:
         return Panel(text_content, title="📄 Page-Level Analysis", border_style="magenta")
     
     def create_optimization_panel(self) -> Panel:
-        """Create the optimization recommendations panel"""
+        """Create the optimization recommendations panel
+        
+        The panel is built once per analysis and reused on later renders.
+        """
         if not self.analysis or not self.analysis.columns:
             return Panel("No data loaded", title="Optimization")
         
-        # Find columns for different optimization strategies
-        worst_ratio_col = max(self.analysis.columns, key=lambda x: x.compression_ratio)
-        largest_col = max(self.analysis.columns, key=lambda x: x.compressed_size)
-        double_cols = [col for col in self.analysis.columns if col.physical_type == "DOUBLE"]
+        if self._optimization_panel is not None and self._optimization_panel[0] is self.analysis:
+            return self._optimization_panel[1]
+        
+        # Columns for the different optimization strategies, grouped at load time
+        double_cols = self.analysis.double_cols
+        price_cols = self.analysis.price_cols
+        nested_cols = self.analysis.nested_cols
+        
+        # Estimated savings, each reduced once and reused for the totals
+        double_savings = sum(col.compressed_size for col in double_cols) * 0.4  # 40% savings from DOUBLE->FLOAT32
+        price_savings = sum(col.compressed_size for col in price_cols) * 0.6
         
         content = []
         
@@ -640,7 +1575,6 @@ class ParquetTUI:
         content.append("[bold blue]🔧 DATA TYPE OPTIMIZATIONS:[/bold blue]")
         
         if double_cols:
-            double_savings = sum(col.compressed_size * 0.4 for col in double_cols)  # 40% savings from DOUBLE->FLOAT32
             content.append(f"├─ Convert DOUBLE to FLOAT32 ({len(double_cols)} columns)")
             content.append(f"│  └─ Potential savings: ~{double_savings/(1024*1024):.1f}MB")
             
@@ -651,9 +1585,7 @@ class ParquetTUI:
                     content.append(f"│     • {col_name}")
         
         # Financial data specific optimizations
-        price_cols = [col for col in self.analysis.columns if 'price' in col.name.lower()]
         if price_cols:
-            price_savings = sum(col.compressed_size * 0.6 for col in price_cols)
             content.append(f"├─ Price data → Integer basis points")
             content.append(f"│  └─ High impact: ~{price_savings/(1024*1024):.1f}MB savings")
         
@@ -667,7 +1599,6 @@ class ParquetTUI:
         content.append("[bold magenta]🏗️ STRUCTURAL IMPROVEMENTS:[/bold magenta]")
         
         # Look for nested structures
-        nested_cols = [col for col in self.analysis.columns if '.' in col.name]
         if nested_cols:
             content.append(f"├─ Flatten nested structures ({len(nested_cols)} nested columns)")
             content.append("│  └─ Can improve compression and query performance")
@@ -682,8 +1613,8 @@ class ParquetTUI:
         
         # Total potential savings
         total_algorithm_savings = zstd_savings
-        total_datatype_savings = sum(col.compressed_size * 0.4 for col in double_cols) if double_cols else 0
-        total_price_savings = sum(col.compressed_size * 0.6 for col in price_cols) if price_cols else 0
+        total_datatype_savings = double_savings
+        total_price_savings = price_savings
         total_potential = total_algorithm_savings + total_datatype_savings + total_price_savings
         
         content.append(f"[bold yellow]💎 TOTAL POTENTIAL SAVINGS:[/bold yellow]")
@@ -707,27 +1638,67 @@ class ParquetTUI:
         
         text_content = "\n".join(content)
         
-        return Panel(text_content, title="🚀 Optimization Recommendations", border_style="magenta")
+        panel = Panel(text_content, title="🚀 Optimization Recommendations", border_style="magenta")
+        self._optimization_panel = (self.analysis, panel)
+        return panel
 
+    @staticmethod
+    def _select_display_columns(all_cols: List[str], complex_cols: List[str], max_possible_cols: int) -> List[str]:
+        """Pick the data preview columns: one simple column for context, then complex ones, then the rest"""
+        nested = set(complex_cols)
+        simple_cols = [col for col in all_cols if col not in nested]
+        
+        # Select columns to display - mix of simple and complex
+        display_cols = []
+        
+        # Always show at least one simple column for context (like ID)
+        if simple_cols:
+            display_cols.append(simple_cols[0])
+        
+        # Prioritize complex columns as they're more interesting
+        for col in complex_cols:
+            if len(display_cols) < max_possible_cols:
+                display_cols.append(col)
+            else:
+                break
+        
+        # Fill remaining slots with simple columns
+        for col in simple_cols[1:]:  # Skip first simple column if already added
+            if len(display_cols) < max_possible_cols:
+                display_cols.append(col)
+            else:
+                break
+        
+        # If we still only have one column, take more columns to use space better
+        if len(display_cols) == 1 and len(all_cols) > 1:
+            # Add more columns up to a reasonable limit
+            all_remaining = [col for col in all_cols if col not in display_cols]
+            for col in all_remaining:
+                if len(display_cols) < min(4, len(all_cols)):  # Cap at 4 columns max
+                    display_cols.append(col)
+                else:
+                    break
+        return display_cols
+    
     def create_data_panel(self) -> Panel:
         """Create the data preview panel"""
         if not self.analysis:
             return Panel("No data loaded", title="Data Preview")
         
         try:
-            # Get paginated data sample  
-            analyzer = ParquetAnalyzer()
-            rows_per_page = 20  # Show 20 rows at a time
-            df = analyzer.get_data_sample_paginated(self.file_path, max_rows=rows_per_page, offset=self.data_row_offset)
+            # The TUI's own analyzer, whose ParquetFile handles are cached
+            # across pages
+            analyzer = self.analyzer
+            rows_per_page = DATA_PAGE_ROWS
             
             # Get total row count for pagination info
             total_rows = self.analysis.total_rows
             current_page = (self.data_row_offset // rows_per_page) + 1
-            total_pages = (total_rows + rows_per_page - 1) // rows_per_page  # Ceiling division
+            total_pages = self._data_pages
             
             # Get terminal size for responsive display
-            terminal_width = self.console.size.width
-            terminal_height = self.console.size.height
+            terminal_width = self.terminal_size.width
+            terminal_height = self.terminal_size.height
             
             # Reserve space for UI elements
             reserved_space = 15  # Conservative estimate for borders, title, controls
@@ -737,61 +1708,41 @@ class ParquetTUI:
             # Create table for data display
             table = Table(show_header=True, header_style="bold cyan", box=box.ROUNDED)
             
-            # Prioritize showing complex/interesting columns alongside simple ones
-            simple_cols = []
-            complex_cols = []
-            
-            for col in df.columns:
-                dtype_str = str(df[col].dtype)
-                if dtype_str == 'object':
-                    # Check if this column has complex nested data
-                    sample_val = df[col].iloc[0] if len(df) > 0 else None
-                    if isinstance(sample_val, (list, dict)) or (hasattr(sample_val, '__array__') and hasattr(sample_val, 'shape') and len(getattr(sample_val, 'shape', [])) > 0):
-                        complex_cols.append(col)
-                    else:
-                        simple_cols.append(col)
-                else:
-                    simple_cols.append(col)
+            # Prioritize showing complex/interesting columns alongside simple
+            # ones; columns are picked from the schema, so only those shown
+            # have to be read
+            if self._preview_columns is None:
+                self._preview_columns = analyzer.get_preview_columns(self.file_path)
+            all_cols, complex_cols = self._preview_columns
             
             # Determine initial column selection
             available_col_width = terminal_width - 15  # Reserve space for borders and padding
             min_col_width = 8  # Minimum usable column width
             
-            # Start with a reasonable number of columns to try
-            max_possible_cols = max(1, available_col_width // min_col_width)
-            
-            # Select columns to display - mix of simple and complex
-            display_cols = []
-            
-            # Always show at least one simple column for context (like ID)
-            if simple_cols:
-                display_cols.append(simple_cols[0])
-            
-            # Prioritize complex columns as they're more interesting
-            for col in complex_cols:
-                if len(display_cols) < max_possible_cols:
-                    display_cols.append(col)
-                else:
-                    break
-            
-            # Fill remaining slots with simple columns
-            for col in simple_cols[1:]:  # Skip first simple column if already added
-                if len(display_cols) < max_possible_cols:
-                    display_cols.append(col)
-                else:
-                    break
+            # The selected columns and their grouping depend only on the
+            # schema and the width, so they are worked out once per width
+            layout = self._column_layout.get(available_col_width)
+            if layout is None:
+                # Start with a reasonable number of columns to try
+                max_possible_cols = max(1, available_col_width // min_col_width)
+                display_cols = self._select_display_columns(all_cols, complex_cols, max_possible_cols)
+                nested = set(complex_cols)
+                layout = (
+                    display_cols,
+                    nested,
+                    [col for col in display_cols if col in nested],
+                    [col for col in display_cols if col not in nested],
+                )
+                self._column_layout[available_col_width] = layout
+            display_cols, nested, complex_display_cols, simple_display_cols = layout
             
-            # If we still only have one column, take more columns to use space better
-            if len(display_cols) == 1 and len(df.columns) > 1:
-                # Add more columns up to a reasonable limit
-                all_remaining = [col for col in df.columns if col not in display_cols]
-                for col in all_remaining:
-                    if len(display_cols) < min(4, len(df.columns)):  # Cap at 4 columns max
-                        display_cols.append(col)
-                    else:
-                        break
+            truncated_cols = len(all_cols) > len(display_cols)
             
-            truncated_cols = len(df.columns) > len(display_cols)
+            # Get paginated data sample of just the displayed columns
+            df = analyzer.get_data_sample_paginated(
+                self.file_path, max_rows=rows_per_page, offset=self.data_row_offset,
+                columns=display_cols or None,
+            )
             
             # Calculate dynamic column widths based on content and available space
             def calculate_content_width(col_name, sample_data, is_complex=False, min_width=8):
@@ -804,9 +1755,9 @@ class ParquetTUI:
                     base_complex_width = 25  # Start with a good width for complex data
                     # Check content width from sample rows
                     content_widths = []
-                    for i in range(min(3, len(sample_data))):  # Check first 3 rows
+                    # Check first 3 rows, as one array rather than an iloc lookup each
+                    for value in sample_data.head(3).to_numpy():
                         try:
-                            value = sample_data.iloc[i]
                             # Estimate display width for complex content
                             if isinstance(value, (list, dict)) or hasattr(value, '__array__'):
                                 # Complex content needs more space to be useful
@@ -821,20 +1772,34 @@ class ParquetTUI:
                     return int(max(min_width, min(ideal_width, 60)))  # Cap at 60 chars and ensure integer
                 else:
                     # Simple columns - more conservative sizing
-                    content_widths = []
-                    for i in range(min(5, len(sample_data))):  # Check first 5 rows
-                        try:
-                            value = sample_data.iloc[i]
-                            if pd.isna(value):
-                                content_widths.append(4)  # "NULL"
-                            elif isinstance(value, (int, float)):
-                                content_widths.append(min(len(str(value)), 12))
-                            elif isinstance(value, str):
-                                content_widths.append(min(len(value), 20))
-                            else:
+                    sample = sample_data.head(5)  # Check first 5 rows
+                    kind = sample.dtype.kind
+                    if kind != 'O':
+                        # Typed columns are sized without looking at values one by
+                        # one: nulls take 4 ("NULL"), floats their printed length up
+                        # to 12, and anything else (NumPy integers, booleans,
+                        # datetimes) 10
+                        is_na = sample.isna().to_numpy()
+                        if kind == 'f':
+                            lengths = sample.fillna(0).astype(str).str.len().to_numpy()
+                            widths = np.where(is_na, 4, np.minimum(lengths, 12))
+                        else:
+                            widths = np.where(is_na, 4, 10)
+                        content_widths = widths.tolist()
+                    else:
+                        content_widths = []
+                        for value in sample.to_numpy():
+                            try:
+                                if pd.isna(value):
+                                    content_widths.append(4)  # "NULL"
+                                elif isinstance(value, (int, float)):
+                                    content_widths.append(min(len(str(value)), 12))
+                                elif isinstance(value, str):
+                                    content_widths.append(min(len(value), 20))
+                                else:
+                                    content_widths.append(10)
+                            except:
                                 content_widths.append(10)
-                        except:
-                            content_widths.append(10)
                     
                     avg_content_width = sum(content_widths) / len(content_widths) if content_widths else 10
                     ideal_width = max(header_width, avg_content_width)
@@ -845,7 +1810,7 @@ class ParquetTUI:
             total_ideal_width = 0
             
             for col in display_cols:
-                is_complex = col in complex_cols
+                is_complex = col in nested
                 ideal_width = calculate_content_width(col, df[col], is_complex)
                 column_widths[col] = ideal_width
                 total_ideal_width += ideal_width
@@ -860,7 +1825,7 @@ class ParquetTUI:
                     if not isinstance(current_width, (int, float)):
                         current_width = min_col_width
                     
-                    if col in complex_cols:
+                    if col in nested:
                         # Complex columns get less aggressive scaling
                         adjusted_scale = max(0.7, scale_factor)  # Don't scale below 70%
                         column_widths[col] = max(min_col_width, int(current_width * adjusted_scale))
@@ -872,7 +1837,6 @@ class ParquetTUI:
                 current_total = sum(column_widths.values())
                 if current_total > available_col_width:
                     excess = current_total - available_col_width
-                    simple_display_cols = [col for col in display_cols if col not in complex_cols]
                     if simple_display_cols and len(simple_display_cols) > 0:
                         reduction_per_simple = max(1, excess // len(simple_display_cols))
                         for col in simple_display_cols:
@@ -880,8 +1844,6 @@ class ParquetTUI:
             elif total_ideal_width < available_col_width and len(display_cols) > 0:
                 # Distribute extra space, favoring complex columns
                 extra_space = available_col_width - total_ideal_width
-                complex_display_cols = [col for col in display_cols if col in complex_cols]
-                simple_display_cols = [col for col in display_cols if col not in complex_cols]
                 
                 if complex_display_cols and len(complex_display_cols) > 0:
                     # Give 70% of extra space to complex columns
@@ -905,317 +1867,87 @@ class ParquetTUI:
             
             # Add columns to table with calculated widths
             for col in display_cols:
-                # Truncate column names if needed for header
+                # Truncate column names if needed for header (widths are at
+                # least min_col_width, so the ellipsis always fits)
                 col_width = column_widths[col]
-                if len(col) > col_width:
-                    col_display = col[:col_width-3] + "..." if col_width > 3 else col[:col_width]
-                else:
-                    col_display = col
+                col_display = _truncate(col, col_width)
                 
                 table.add_column(col_display, style="white", width=col_width, no_wrap=True)
             
             # Add rows to table (limit to display size)
             display_rows = min(len(df), max_display_rows)
             
-            for i in range(display_rows):
-                row_data = []
-                for col in display_cols:
+            # Slice the displayed rows out once, as plain arrays per column
+            shown = df.head(display_rows)
+            # Each column is classified once here; the summary below reuses the
+            # dtype strings and whether the first value holds nested data
+            columns = []
+            dtype_strs = {}
+            complex_cols = []
+            for col in display_cols:
+                series = shown[col]
+                kind = series.dtype.kind
+                # NumPy-backed columns iterate fastest as arrays; the others
+                # (datetimes and the like) keep their pandas scalar types
+                values = series.to_numpy() if kind in "fiubO" else series.array
+                # Null bitmaps for every column but object ones (see pick_cell_formatter)
+                if kind == "O" and not _holds_only_strings(series.dtype):
+                    na_mask = None
+                else:
+                    na_mask = series.isna().to_numpy()
+                formatter = pick_cell_formatter(series.dtype)
+                # Typed columns are formatted a whole visible slice at a time
+                # inside NumPy, giving the same strings as _format_float_cell
+                # and _format_integer_cell per value
+                if _is_float64(series.dtype):
+                    values = np.char.mod("%.3g", values).tolist()
+                    formatter = _format_preformatted_cell
+                elif kind in "iub":
+                    values = values.astype(str).tolist()
+                    formatter = _format_preformatted_cell
+                columns.append((values, na_mask, formatter, column_widths[col]))
+                
+                dtype_strs[col] = dtype_str = str(series.dtype)
+                if dtype_str == 'object' and display_rows:
+                    sample_val = values[0]
+                    if isinstance(sample_val, (list, dict)) or hasattr(sample_val, '__array__'):
+                        complex_cols.append(col)
+            
+            # Cells are filled a column at a time into preallocated lists, so
+            # each column's formatter and null mask are looked up once
+            column_cells = []
+            for values, na_mask, formatter, col_width in columns:
+                cells = [NULL_CELL] * display_rows
+                # Null cells keep the NULL_CELL they start with
+                present = range(display_rows) if na_mask is None else np.flatnonzero(~na_mask).tolist()
+                for i in present:
                     try:
-                        value = df.iloc[i][col]
-                        
-                        # Format the value for display with dynamic width awareness
-                        col_width = column_widths[col]
-                        try:
-                            # Handle pandas NA values (but be careful with arrays)
-                            try:
-                                is_na = pd.isna(value)
-                                # If pd.isna returns an array, check if any/all are NA
-                                if hasattr(is_na, '__len__') and not isinstance(is_na, str):
-                                    # This is an array of boolean values
-                                    is_actually_na = is_na.all() if len(is_na) > 0 else False
-                                else:
-                                    # This is a single boolean value
-                                    is_actually_na = bool(is_na)
-                            except (ValueError, TypeError):
-                                is_actually_na = False
-                            
-                            if is_actually_na:
-                                formatted_value = "[dim]NULL[/dim]"
-                            # Handle simple numeric types
-                            elif isinstance(value, (int, float, complex)) and not pd.isna(value):
-                                if isinstance(value, float):
-                                    formatted_value = f"{value:.3g}"
-                                else:
-                                    formatted_value = str(value)
-                            # Handle string types
-                            elif isinstance(value, str):
-                                if len(value) > col_width:
-                                    formatted_value = value[:max(3, col_width-3)] + "..."
-                                else:
-                                    formatted_value = value
-                            # Handle complex/nested data (lists, dicts, etc.)
-                            elif isinstance(value, (list, dict)):
-                                # Try to provide more meaningful information about nested structures
-                                if isinstance(value, list) and len(value) > 0:
-                                    first_item = value[0]
-                                    if isinstance(first_item, dict):
-                                        # Show meaningful content from nested objects
-                                        content_parts = []
-                                        for item in value[:2]:  # Show first 2 items
-                                            if isinstance(item, dict):
-                                                # Look for interesting keys
-                                                interesting_keys = ['data', 'maxPrice', 'minPrice', 'isBid', 'exchange', 'pair', 'lastPrice', 'timestamp']
-                                                shown_parts = []
-                                                for key in interesting_keys:
-                                                    if key in item:
-                                                        val = item[key]
-                                                        if isinstance(val, (int, float)):
-                                                            shown_parts.append(f"{key}:{val:.2g}")
-                                                        elif isinstance(val, bool):
-                                                            shown_parts.append(f"{key}:{val}")
-                                                        elif isinstance(val, str) and len(val) < 8:
-                                                            shown_parts.append(f"{key}:{val}")
-                                                        elif key == 'data' and hasattr(val, '__len__') and len(val) > 0:
-                                                            # Handle the special 'data' field with price/quantity arrays
-                                                            try:
-                                                                first_pair = val[0]
-                                                                if hasattr(first_pair, '__len__') and len(first_pair) == 2:
-                                                                    # Show first price/quantity pair
-                                                                    if hasattr(first_pair, '__getitem__'):
-                                                                        price, qty = first_pair[0], first_pair[1]
-                                                                        shown_parts.append(f"data:[{price:.1f},{qty:.2f}...]")
-                                                            except:
-                                                                # Fallback for data field
-                                                                shown_parts.append(f"data:[{len(val)}]")
-                                                        if len(shown_parts) >= 2:
-                                                            break
-                                                
-                                                if shown_parts:
-                                                    content_parts.append('{' + ','.join(shown_parts) + '}')
-                                                else:
-                                                    # Fallback to showing key names
-                                                    keys = list(item.keys())[:2]
-                                                    content_parts.append('{' + ','.join(keys) + '...}')
-                                        
-                                        if content_parts:
-                                            content_str = ' '.join(content_parts)
-                                            # Use available column width minus brackets and dim formatting
-                                            max_content_len = max(10, col_width - 6)  # Reserve space for [dim] and []
-                                            if len(content_str) > max_content_len:
-                                                content_str = content_str[:max_content_len-3] + "..."
-                                            formatted_value = f"[dim][{content_str}][/dim]"
-                                        else:
-                                            formatted_value = f"[dim]list[{len(value)}×dict][/dim]"
-                                    elif isinstance(first_item, list):
-                                        # Handle nested lists - check for price/quantity patterns
-                                        if len(first_item) == 2 and all(isinstance(x, (int, float)) for x in first_item):
-                                            # Looks like price/quantity pairs
-                                            pairs = []
-                                            for item in value[:3]:
-                                                if isinstance(item, list) and len(item) == 2:
-                                                    pairs.append(f"[{item[0]:.1f},{item[1]:.2f}]")
-                                            if len(value) > 3:
-                                                pairs.append("...")
-                                            formatted_value = f"[dim][{','.join(pairs)}][/dim]"
-                                        else:
-                                            inner_len = len(first_item) if hasattr(first_item, '__len__') else '?'
-                                            formatted_value = f"[dim]list[{len(value)}×{inner_len}][/dim]"
-                                    else:
-                                        # Array of simple values
-                                        if all(isinstance(x, (int, float)) for x in value):
-                                            vals = [f"{x:.2g}" for x in value[:4]]
-                                            if len(value) > 4:
-                                                vals.append("...")
-                                            formatted_value = f"[dim][{','.join(vals)}][/dim]"
-                                        else:
-                                            vals = [str(x)[:6] for x in value[:3]]
-                                            if len(value) > 3:
-                                                vals.append("...")
-                                            formatted_value = f"[dim][{','.join(vals)}][/dim]"
-                                elif isinstance(value, dict):
-                                    # Show dictionary content with values when possible
-                                    items_to_show = []
-                                    for key, val in list(value.items())[:3]:
-                                        if isinstance(val, (int, float)):
-                                            items_to_show.append(f"{key}:{val:.2g}")
-                                        elif isinstance(val, str) and len(val) < 6:
-                                            items_to_show.append(f"{key}:{val}")
-                                        else:
-                                            items_to_show.append(key)
-                                    
-                                    if items_to_show:
-                                        content = ','.join(items_to_show)
-                                        if len(value) > 3:
-                                            content += "..."
-                                        # Use available column width for dictionary content
-                                        max_dict_len = max(8, col_width - 4)  # Reserve space for {} and dim formatting
-                                        if len(content) > max_dict_len:
-                                            content = content[:max_dict_len-3] + "..."
-                                        formatted_value = f"[dim]{{{content}}}[/dim]"
-                                    else:
-                                        # Fallback to just keys
-                                        keys = list(value.keys())[:3]
-                                        key_str = ','.join(keys)
-                                        if len(value) > 3:
-                                            key_str += "..."
-                                        formatted_value = f"[dim]{{{key_str}}}[/dim]"
-                                else:
-                                    formatted_value = f"[dim]{type(value).__name__}[{len(value) if hasattr(value, '__len__') else '?'}][/dim]"
-                            # Handle numpy arrays and pandas Series (but not scalar numpy types)
-                            elif hasattr(value, '__array__') and hasattr(value, 'shape') and len(getattr(value, 'shape', [])) > 0:
-                                # This is likely a numpy array (not a scalar)
-                                try:
-                                    if len(value.shape) == 1:
-                                        # 1D array - check what's inside
-                                        if len(value) <= 5 and len(value) > 0:
-                                            # Small array - show actual content
-                                            first_item = value[0] if len(value) > 0 else None
-                                            if isinstance(first_item, dict):
-                                                # Array of dictionaries - show meaningful content
-                                                content_parts = []
-                                                for item in value[:2]:  # Show first 2 items
-                                                    if isinstance(item, dict):
-                                                        # Look for interesting keys (prices, data, etc.)
-                                                        interesting_keys = ['data', 'maxPrice', 'minPrice', 'isBid', 'exchange', 'pair', 'lastPrice']
-                                                        shown_parts = []
-                                                        for key in interesting_keys:
-                                                            if key in item:
-                                                                val = item[key]
-                                                                if isinstance(val, (int, float)):
-                                                                    shown_parts.append(f"{key}:{val:.2g}")
-                                                                elif isinstance(val, bool):
-                                                                    shown_parts.append(f"{key}:{val}")
-                                                                elif isinstance(val, str) and len(val) < 8:
-                                                                    shown_parts.append(f"{key}:{val}")
-                                                                elif key == 'data' and hasattr(val, '__len__') and len(val) > 0:
-                                                                    # Handle the special 'data' field with price/quantity arrays
-                                                                    try:
-                                                                        # Check if this is an array of price/quantity pairs
-                                                                        first_pair = val[0]
-                                                                        if hasattr(first_pair, '__len__') and len(first_pair) == 2:
-                                                                            # Show first price/quantity pair
-                                                                            if hasattr(first_pair, '__getitem__'):
-                                                                                price, qty = first_pair[0], first_pair[1]
-                                                                                shown_parts.append(f"data:[{price:.1f},{qty:.2f}...]")
-                                                                    except:
-                                                                        # Fallback for data field
-                                                                        shown_parts.append(f"data:[{len(val)}]")
-                                                                elif isinstance(val, list) and len(val) > 0:
-                                                                    if len(val) <= 3 and all(isinstance(x, (int, float)) for x in val):
-                                                                        # Show numeric arrays directly
-                                                                        vals_str = ','.join(f"{x:.2g}" for x in val)
-                                                                        shown_parts.append(f"{key}:[{vals_str}]")
-                                                                    elif len(val) <= 3 and all(isinstance(x, list) and len(x) == 2 for x in val):
-                                                                        # Show price/quantity pairs
-                                                                        pairs_str = ','.join(f"[{x[0]:.1f},{x[1]:.2f}]" for x in val[:2])
-                                                                        shown_parts.append(f"{key}:[{pairs_str}...]")
-                                                                if len(shown_parts) >= 2:
-                                                                    break
-                                                        
-                                                        if shown_parts:
-                                                            content_parts.append('{' + ','.join(shown_parts) + '}')
-                                                        else:
-                                                            # Fallback to showing a few key names
-                                                            keys = list(item.keys())[:2]
-                                                            content_parts.append('{' + ','.join(keys) + '...}')
-                                                
-                                                if content_parts:
-                                                    content_str = ' '.join(content_parts)
-                                                    # Use available column width for numpy array content
-                                                    max_numpy_len = max(10, col_width - 6)  # Reserve space for [dim] and []
-                                                    if len(content_str) > max_numpy_len:
-                                                        content_str = content_str[:max_numpy_len-3] + "..."
-                                                    formatted_value = f"[dim][{content_str}][/dim]"
-                                                else:
-                                                    formatted_value = f"[dim][dict×{len(value)}][/dim]"
-                                            elif isinstance(first_item, list):
-                                                # Array of lists - show some content
-                                                if len(first_item) == 2 and all(isinstance(x, (int, float)) for x in first_item):
-                                                    # Looks like price/quantity pairs
-                                                    pairs = []
-                                                    for item in value[:3]:
-                                                        if isinstance(item, list) and len(item) == 2:
-                                                            pairs.append(f"[{item[0]:.1f},{item[1]:.2f}]")
-                                                    formatted_value = f"[dim][{','.join(pairs)}...][/dim]"
-                                                else:
-                                                    inner_len = len(first_item) if hasattr(first_item, '__len__') else '?'
-                                                    formatted_value = f"[dim]list[{len(value)}×{inner_len}][/dim]"
-                                            else:
-                                                # Array of simple values - show them directly
-                                                if all(isinstance(x, (int, float)) for x in value):
-                                                    vals = [f"{x:.2g}" for x in value[:4]]
-                                                    if len(value) > 4:
-                                                        vals.append("...")
-                                                    formatted_value = f"[dim][{','.join(vals)}][/dim]"
-                                                else:
-                                                    vals = [str(x)[:6] for x in value[:3]]  
-                                                    if len(value) > 3:
-                                                        vals.append("...")
-                                                    formatted_value = f"[dim][{','.join(vals)}][/dim]"
-                                        else:
-                                            formatted_value = f"[dim]array[{len(value)}][/dim]"
-                                    else:
-                                        shape_str = '×'.join(map(str, value.shape))
-                                        formatted_value = f"[dim]array[{shape_str}][/dim]"
-                                except:
-                                    formatted_value = f"[dim]{type(value).__name__}[/dim]"
-                            # Handle numpy scalar types (int64, float64, etc.)
-                            elif str(type(value)).startswith("<class 'numpy.") and not hasattr(value, 'shape'):
-                                # This is a numpy scalar, treat it as a regular number/value
-                                if hasattr(value, 'item'):
-                                    # Convert numpy scalar to Python type
-                                    python_val = value.item()
-                                    if isinstance(python_val, float):
-                                        formatted_value = f"{python_val:.3g}"
-                                    else:
-                                        formatted_value = str(python_val)
-                                else:
-                                    formatted_value = str(value)
-                            # Handle other types (datetime, etc.)
-                            else:
-                                str_value = str(value)
-                                if len(str_value) > col_width:
-                                    formatted_value = str_value[:max(3, col_width-3)] + "..."
-                                else:
-                                    formatted_value = str_value
-                        except (ValueError, TypeError, AttributeError):
-                            # Fallback for any problematic values
-                            formatted_value = f"[dim]{type(value).__name__}[/dim]"
-                        
-                        row_data.append(formatted_value)
-                        
+                        cells[i] = formatter(values[i], col_width)
                     except Exception as e:
                         # Ultimate fallback
-                        row_data.append(f"[red]Error[/red]")
-                
+                        cells[i] = ERROR_CELL
+                column_cells.append(cells)
+            
+            for row_data in (zip(*column_cells) if column_cells else [()] * display_rows):
                 table.add_row(*row_data)
             
             # Create summary info
             info_lines = []
             info_lines.append(f"📊 Showing {display_rows} of {len(df):,} rows")
-            info_lines.append(f"📈 Displaying {len(display_cols)} of {len(df.columns)} columns")
+            info_lines.append(f"📈 Displaying {len(display_cols)} of {len(all_cols)} columns")
             
             if truncated_cols:
-                info_lines.append(f"⚠️  {len(df.columns) - len(display_cols)} columns hidden (terminal width)")
+                info_lines.append(f"⚠️  {len(all_cols) - len(display_cols)} columns hidden (terminal width)")
             
             if len(df) > max_display_rows:
                 info_lines.append(f"⚠️  {len(df) - display_rows:,} rows hidden (terminal height)")
             
             # Add schema info for complex columns
-            complex_cols = []
-            for col in display_cols:
-                dtype_str = str(df[col].dtype)
-                if dtype_str == 'object':
-                    # Check if this column has complex nested data
-                    sample_val = df[col].iloc[0] if len(df) > 0 else None
-                    if isinstance(sample_val, (list, dict)) or hasattr(sample_val, '__array__'):
-                        complex_cols.append(col)
-            
             if complex_cols:
                 info_lines.append("")
                 info_lines.append("� Complex Columns (use Schema view for details):")
                 for col in complex_cols[:3]:  # Show first few complex columns
-                    col_display = col if len(col) <= 25 else col[:22] + "..."
+                    col_display = _truncate(col, 25)
                     info_lines.append(f"   {col_display}: nested structure")
                 if len(complex_cols) > 3:
                     info_lines.append(f"   ... and {len(complex_cols) - 3} more complex columns")
@@ -1226,7 +1958,7 @@ class ParquetTUI:
                 info_lines.append("")
                 info_lines.append("📋 Simple Column Types:")
                 for col in simple_cols[:5]:  # Show types for first few columns
-                    dtype = str(df[col].dtype)
+                    dtype = dtype_strs[col]
                     if dtype.startswith('<M8'):
                         dtype = 'datetime'
                     elif dtype == 'object':
@@ -1236,7 +1968,7 @@ class ParquetTUI:
             # Create title with pagination info
             start_row = self.data_row_offset + 1
             end_row = min(self.data_row_offset + len(df), total_rows)
-            title_info = f"📋 Data Preview (rows {start_row:,}-{end_row:,} of {total_rows:,}, page {current_page}/{total_pages}, {len(display_cols)}/{len(df.columns)} cols)"
+            title_info = f"📋 Data Preview (rows {start_row:,}-{end_row:,} of {total_rows:,}, page {current_page}/{total_pages}, {len(display_cols)}/{len(all_cols)} cols)"
             
             return Panel(table, title=title_info, border_style="green")
             
@@ -1251,101 +1983,119 @@ class ParquetTUI:
             )
             return Panel(error_msg, title="📋 Data Preview - Error", border_style="red")
     
-    def create_column_detail_panel(self) -> Panel:
-        """Create detailed view of selected column"""
-        if not self.analysis or self.selected_column >= len(self.analysis.columns):
-            return Panel("No column selected", title="Column Details")
-        
-        col = sorted(self.analysis.columns, key=lambda x: x.compression_ratio, reverse=True)[self.selected_column]
-        
-        table = Table(show_header=False, box=box.SIMPLE, padding=(0, 1))
-        table.add_column("Property", style="bold cyan", no_wrap=True)
-        table.add_column("Value", style="white", no_wrap=False)
+    @staticmethod
+    def _column_detail_rows(col, avg_page_ratio: float) -> List[Tuple[str, str]]:
+        """Format the (property, value) rows of a column's detail panel
         
+        avg_page_ratio is the mean compression ratio of the column's pages,
+        precomputed in _prepare_views.
+        """
         # Compact name display
-        name_display = col.name if len(col.name) <= 25 else col.name[:22] + "..."
-        table.add_row("📝 Name", name_display)
-        table.add_row("🔤 Physical", col.physical_type)
-        table.add_row("🏷️ Logical", col.logical_type)
-        table.add_row("🗜️ Compress", col.compression)
+        name_display = _truncate(col.name, 25)
         
         # Compact encodings
         encodings = ", ".join(col.encodings[:2]) if col.encodings else "N/A"
         if len(col.encodings) > 2:
             encodings += f" +{len(col.encodings)-2} more"
-        table.add_row("� Encodings", encodings)
         
-        table.add_row("�📊 Values", f"{col.values:,}")
+        rows = [
+            ("📝 Name", name_display),
+            ("🔤 Physical", col.physical_type),
+            ("🏷️ Logical", col.logical_type),
+            ("🗜️ Compress", col.compression),
+            ("� Encodings", encodings),
+            ("�📊 Values", f"{col.values:,}"),
+        ]
         
         if col.null_count is not None:
-            table.add_row("❌ Nulls", f"{col.null_count:,}")
+            rows.append(("❌ Nulls", f"{col.null_count:,}"))
         if col.distinct_count is not None:
-            table.add_row("🔢 Distinct", f"{col.distinct_count:,}")
-        
-        # Compact size info helper function
-        def format_bytes(b):
-            mb = b / (1024 * 1024)
-            kb = b / 1024
-            if mb >= 1:
-                return f"{mb:.1f}MB"
-            elif kb >= 1:
-                return f"{kb:.0f}KB"
-            else:
-                return f"{b}B"
+            rows.append(("🔢 Distinct", f"{col.distinct_count:,}"))
         
         # Page information
         if col.pages and col.num_pages > 0:
-            table.add_row("📄 Pages", f"{col.num_pages}")
+            rows.append(("📄 Pages", f"{col.num_pages}"))
             avg_page_size = col.uncompressed_size // col.num_pages
-            table.add_row("📏 Avg Page", format_bytes(avg_page_size))
+            rows.append(("📏 Avg Page", format_size(avg_page_size)))
             
             # Show page efficiency
             if col.pages:
-                avg_page_ratio = sum(p.compression_ratio for p in col.pages) / len(col.pages)
-                table.add_row("📈 Page Eff", f"{avg_page_ratio:.1%}")
+                rows.append(("📈 Page Eff", f"{avg_page_ratio:.1%}"))
         else:
-            table.add_row("📄 Pages", "Est. N/A")
+            rows.append(("📄 Pages", "Est. N/A"))
         
-        table.add_row("📏 Uncompr", format_bytes(col.uncompressed_size))
-        table.add_row("📦 Compr", format_bytes(col.compressed_size))
-        table.add_row("📈 Ratio", f"{col.compression_ratio:.1%}")
-        table.add_row("💰 Saved", format_bytes(col.uncompressed_size - col.compressed_size))
+        rows += [
+            ("📏 Uncompr", format_size(col.uncompressed_size)),
+            ("📦 Compr", format_size(col.compressed_size)),
+            ("📈 Ratio", f"{col.compression_ratio:.1%}"),
+            ("💰 Saved", format_size(col.uncompressed_size - col.compressed_size)),
+        ]
         
         # Min/Max if available (compact format)
         if col.min_value is not None and col.max_value is not None:
-            min_str = str(col.min_value)[:15] + "..." if len(str(col.min_value)) > 15 else str(col.min_value)
-            max_str = str(col.max_value)[:15] + "..." if len(str(col.max_value)) > 15 else str(col.max_value)
-            table.add_row("📉 Min", min_str)
-            table.add_row("📈 Max", max_str)
+            rows.append(("📉 Min", _clip_stat(col.format_stat(col.min_value))))
+            rows.append(("📈 Max", _clip_stat(col.format_stat(col.max_value))))
+        return rows
+    
+    def create_column_detail_panel(self) -> Panel:
+        """Create detailed view of selected column"""
+        if not self.analysis or self.selected_column >= len(self.analysis.columns):
+            return Panel("No column selected", title="Column Details")
+        
+        col = self._columns_by_ratio[self.selected_column]
+        
+        table = Table(show_header=False, box=box.SIMPLE, padding=(0, 1))
+        table.add_column("Property", style="bold cyan", no_wrap=True)
+        table.add_column("Value", style="white", no_wrap=False)
+        
+        avg_page_ratio = self._avg_page_ratios[self.selected_column]
+        for label, value in self._column_detail_rows(col, avg_page_ratio):
+            table.add_row(label, value)
         
         # Compact title
         title = f"🔍 Details: {col.name[:20]}..." if len(col.name) > 20 else f"🔍 Details: {col.name}"
         return Panel(table, title=title, border_style="yellow")
     
     def create_help_panel(self) -> Panel:
-        """Create help panel"""
-        help_text = """[bold cyan]Navigation:[/bold cyan]
-├─ [bold]f[/bold]: File Browser - Load a different Parquet file
-├─ [bold]1[/bold]: Overview - File summary and basic statistics
-├─ [bold]2[/bold]: Schema - Nested structure and field types  
-├─ [bold]3[/bold]: Row Groups - Compression analysis with navigation
-├─ [bold]4[/bold]: Pages - Page-level data organization
-├─ [bold]5[/bold]: Optimization - Improvement recommendations
-├─ [bold]6[/bold]: Data - Preview actual data content
-├─ [bold]↑/↓ or j/k[/bold]: Navigate columns (Row Groups) / Page through data (Data view)
-├─ [bold]q[/bold]: Quit
-└─ [bold]h[/bold]: Toggle this help
-
-[bold cyan]Views:[/bold cyan]
-├─ [bold]1[/bold]: Overview - File summary and statistics
-├─ [bold]2[/bold]: Data - Preview actual data content (j/k to page)  
-├─ [bold]3[/bold]: Schema - Nested structure analysis  
-├─ [bold]4[/bold]: Compression - Column-by-column analysis (j/k to navigate)
-├─ [bold]5[/bold]: Pages - Page-level data organization
-├─ [bold]6[/bold]: Optimization - Improvement recommendations
-└─ [bold]j/k[/bold]: Navigate columns (in Row Groups view)"""
-        
-        return Panel(help_text, title="❓ Help", border_style="dim")
+        """Return the help panel, built once in __init__"""
+        return self._help_panel
+    
+    def create_status_text(self) -> Text:
+        """Create the status line shown below the current view
+        
+        The view and level part is parsed from markup once; the position
+        within the view is appended as plain styled text. The result is
+        highlighted the way a printed string would be.
+        """
+        level = self.compression_level if self.current_view == "rowgroups" else None
+        key = (self.current_view, level)
+        template = self._status_templates.get(key)
+        if template is None:
+            markup = f"\n[bold green]View:[/bold green] [cyan]{self.current_view.title()}[/cyan]"
+            if level is not None:
+                markup += f" | [bold green]Level:[/bold green] [cyan]{level}[/cyan]"
+            template = self._status_templates[key] = Text.from_markup(markup)
+        
+        label = position = None
+        if level == "file":
+            label, position = "Column:", f"{self.selected_column + 1}/{self._n_columns}"
+        elif level == "rowgroups":
+            label, position = "Row Group:", f"{self.selected_rowgroup + 1}/{self._n_rowgroups}"
+        elif level == "rowgroup_detail":
+            rg = self.analysis.row_groups[self.selected_rowgroup] if self.analysis and self.analysis.row_groups else None
+            if rg:
+                label, position = f"RG{self.selected_rowgroup}:", f"{self.selected_rowgroup_column + 1}/{len(rg.columns)}"
+        elif self.current_view == "data":
+            current_page = (self.data_row_offset // DATA_PAGE_ROWS) + 1
+            label, position = "Page:", f"{current_page}/{self._data_pages}"
+        
+        status = template.copy()
+        if label is not None:
+            status.append(" | ")
+            status.append(label, style="bold green")
+            status.append(" ")
+            status.append(position, style="cyan")
+        return self.console.highlighter(status)
     
     def create_rowgroup_summary_panel(self) -> Panel:
         """Create summary panel for selected row group"""
@@ -1355,45 +2105,45 @@ class ParquetTUI:
         if self.selected_rowgroup >= len(self.analysis.row_groups):
             return Panel("Invalid row group selected", title="Row Group Summary")
         
-        rg = self.analysis.row_groups[self.selected_rowgroup]
-        
         table = Table(show_header=False, box=box.SIMPLE, padding=(0, 1))
         table.add_column("Property", style="bold cyan", no_wrap=True)
         table.add_column("Value", style="white", no_wrap=False)
         
-        def format_bytes(b):
-            mb = b / (1024 * 1024)
-            kb = b / 1024
-            if mb >= 1:
-                return f"{mb:.1f}MB"
-            elif kb >= 1:
-                return f"{kb:.0f}KB"
-            else:
-                return f"{b}B"
+        for label, value in self._rg_summary_rows[self.selected_rowgroup]:
+            table.add_row(label, value)
         
-        table.add_row("🗂️ Row Group", f"#{rg.index}")
-        table.add_row("📊 Rows", f"{rg.num_rows:,}")
-        table.add_row("🔢 Columns", f"{len(rg.columns)}")
-        table.add_row("📏 Uncompr", format_bytes(rg.total_uncompressed_size))
-        table.add_row("📦 Compr", format_bytes(rg.total_compressed_size))
-        table.add_row("📈 Ratio", f"{rg.compression_ratio:.1%}")
-        table.add_row("💰 Saved", format_bytes(rg.total_uncompressed_size - rg.total_compressed_size))
+        return Panel(table, title=self._rg_summary_titles[self.selected_rowgroup], border_style="blue")
+    
+    @staticmethod
+    def _rowgroup_column_detail_rows(file_col, selected_rg_col) -> List[Tuple[str, str]]:
+        """Format the (property, value) rows for a row group column, with file-level context"""
+        # Compact name display
+        name_display = _truncate(file_col.name, 25)
         
-        # Show best and worst columns in this row group
-        sorted_cols = sorted(rg.columns, key=lambda x: x.compression_ratio)
-        if sorted_cols:
-            best_col = sorted_cols[0]
-            worst_col = sorted_cols[-1]
-            table.add_row("🎯 Best Col", f"{best_col.name[:12]}... ({best_col.compression_ratio:.1%})")
-            table.add_row("⚠️ Worst Col", f"{worst_col.name[:12]}... ({worst_col.compression_ratio:.1%})")
+        # Compact encodings
+        encodings = ", ".join(file_col.encodings[:2]) if file_col.encodings else "N/A"
+        if len(file_col.encodings) > 2:
+            encodings += f" +{len(file_col.encodings)-2} more"
         
-        # Show hint about min/max
-        hint = rg.get_min_max_hint()
-        if len(hint) > 40:
-            hint = hint[:37] + "..."
-        table.add_row("📋 Ranges", hint)
+        rows = [
+            ("📝 Name", name_display),
+            ("� Physical", file_col.physical_type),
+            ("🏷️ Logical", file_col.logical_type),
+            ("🗜️ Compress", selected_rg_col.compression),  # Use row group specific compression
+            ("�️ Encodings", encodings),
+        ]
+        
+        # Show row group specific min/max if available
+        if selected_rg_col.min_value is not None and selected_rg_col.max_value is not None:
+            rows.append(("📉 Min", _clip_stat(selected_rg_col.format_stat(selected_rg_col.min_value))))
+            rows.append(("📈 Max", _clip_stat(selected_rg_col.format_stat(selected_rg_col.max_value))))
         
-        return Panel(table, title=f"🗂️ Row Group {rg.index} Summary - SIDE PANEL", border_style="blue")
+        # Show file-level stats for context
+        if file_col.null_count is not None:
+            rows.append(("❌ Nulls", f"{file_col.null_count:,}"))
+        if file_col.distinct_count is not None:
+            rows.append(("� Distinct", f"{file_col.distinct_count:,}"))
+        return rows
     
     def create_rowgroup_column_detail_panel(self) -> Panel:
         """Create detailed view of selected column in selected row group"""
@@ -1409,15 +2159,11 @@ class ParquetTUI:
             return Panel("No column selected", title="Column Details")
         
         # Sort columns by compression ratio (worst first) to match main display
-        sorted_rg_columns = sorted(rg.columns, key=lambda x: x.compression_ratio, reverse=True)
+        sorted_rg_columns = self._rg_columns_sorted[self.selected_rowgroup]
         selected_rg_col = sorted_rg_columns[self.selected_rowgroup_column]
         
         # Find the corresponding file-level column for detailed info
-        file_col = None
-        for col in self.analysis.columns:
-            if col.name == selected_rg_col.name:
-                file_col = col
-                break
+        file_col = self.analysis.columns_by_name.get(selected_rg_col.name)
         
         if file_col is None:
             return Panel(f"Column '{selected_rg_col.name}' not found in file analysis", title="Column Details")
@@ -1427,31 +2173,8 @@ class ParquetTUI:
         table.add_column("Property", style="bold cyan", no_wrap=True)
         table.add_column("Value", style="white", no_wrap=False)
         
-        # Compact name display
-        name_display = file_col.name if len(file_col.name) <= 25 else file_col.name[:22] + "..."
-        table.add_row("📝 Name", name_display)
-        table.add_row("� Physical", file_col.physical_type)
-        table.add_row("🏷️ Logical", file_col.logical_type)
-        table.add_row("🗜️ Compress", selected_rg_col.compression)  # Use row group specific compression
-        
-        # Compact encodings
-        encodings = ", ".join(file_col.encodings[:2]) if file_col.encodings else "N/A"
-        if len(file_col.encodings) > 2:
-            encodings += f" +{len(file_col.encodings)-2} more"
-        table.add_row("�️ Encodings", encodings)
-        
-        # Show row group specific min/max if available
-        if selected_rg_col.min_value is not None and selected_rg_col.max_value is not None:
-            min_str = str(selected_rg_col.min_value)[:15] + "..." if len(str(selected_rg_col.min_value)) > 15 else str(selected_rg_col.min_value)
-            max_str = str(selected_rg_col.max_value)[:15] + "..." if len(str(selected_rg_col.max_value)) > 15 else str(selected_rg_col.max_value)
-            table.add_row("📉 Min", min_str)
-            table.add_row("📈 Max", max_str)
-        
-        # Show file-level stats for context
-        if file_col.null_count is not None:
-            table.add_row("❌ Nulls", f"{file_col.null_count:,}")
-        if file_col.distinct_count is not None:
-            table.add_row("� Distinct", f"{file_col.distinct_count:,}")
+        for label, value in self._rowgroup_column_detail_rows(file_col, selected_rg_col):
+            table.add_row(label, value)
         
         return Panel(table, title="🔍 Column Detail", border_style="cyan")
     
@@ -1515,26 +2238,30 @@ class ParquetTUI:
         # Get current directory
         current_dir = Path(self.file_path).parent if self.file_path else Path.cwd()
         
-        # Simple file browser implementation
+        # Simple file browser implementation; the listing is only rebuilt
+        # when the directory changes, not after every invalid entry
+        listed_dir = None
         while True:
             try:
-                # List files in current directory
-                files = []
-                
-                # Add parent directory option if not at root
-                if current_dir != current_dir.parent:
-                    files.append(("📁 ..", current_dir.parent, True))
-                
-                # Add subdirectories and parquet files
-                try:
-                    for item in sorted(current_dir.iterdir()):
-                        if item.is_dir():
-                            files.append((f"📁 {item.name}", item, True))
-                        elif item.suffix.lower() in ['.parquet', '.pq']:
-                            files.append((f"📄 {item.name}", item, False))
-                except PermissionError:
-                    self.console.print(f"[red]Permission denied: {current_dir}[/red]")
-                    break
+                if listed_dir != current_dir:
+                    # List files in current directory
+                    files = []
+                    
+                    # Add parent directory option if not at root
+                    if current_dir != current_dir.parent:
+                        files.append(("📁 ..", current_dir.parent, True))
+                    
+                    # Add subdirectories and parquet files
+                    try:
+                        for item in sorted(current_dir.iterdir()):
+                            if item.is_dir():
+                                files.append((f"📁 {item.name}", item, True))
+                            elif item.suffix.lower() in ['.parquet', '.pq']:
+                                files.append((f"📄 {item.name}", item, False))
+                    except PermissionError:
+                        self.console.print(f"[red]Permission denied: {current_dir}[/red]")
+                        break
+                    listed_dir = current_dir
                 
                 if not files:
                     self.console.print("[yellow]No parquet files or directories found[/yellow]")
@@ -1565,9 +2292,8 @@ class ParquetTUI:
                         _, selected_path, is_dir = files[index]
                         
                         if is_dir:
+                            # Redrawn below, together with the other outcomes
                             current_dir = selected_path
-                            self.console.clear()
-                            self.console.print("[bold blue]📁 Select a Parquet file[/bold blue]\n")
                         else:
                             # Selected a parquet file
                             self.console.show_cursor(False)
@@ -1594,319 +2320,317 @@ class ParquetTUI:
         self.console.show_cursor(False)
         return None
 
+    def _quit(self) -> bool:
+        """Stop the key loop after the current key"""
+        self._running = False
+        return False
+    
+    def _toggle_help(self) -> bool:
+        self.show_help = not self.show_help
+        return True
+    
+    def _switch_view(self, view: str) -> bool:
+        """Switch to another view, starting it from its first entry"""
+        if self.current_view == view:
+            return False
+        self.current_view = view
+        if view == "rowgroups":
+            self.compression_level = "rowgroups"  # Start with browser
+            self.selected_rowgroup = 0
+        else:
+            self.selected_column = 0
+            if view == "data":
+                self.data_row_offset = 0  # Reset to first page
+        return True
+    
+    def move_selection(self, delta: int) -> bool:
+        """Move the selection of the current Row Groups level by delta entries
+        
+        The selection stops at the first and last entry. Returns whether it
+        moved.
+        """
+        if not self.analysis:
+            return False
+        level = self.compression_level
+        if level == "file":
+            count = self._n_columns
+            current = self.selected_column
+        elif level == "rowgroups":
+            count = self._n_rowgroups
+            current = self.selected_rowgroup
+        elif level == "rowgroup_detail":
+            count = len(self.analysis.row_groups[self.selected_rowgroup].columns)
+            current = self.selected_rowgroup_column
+        else:
+            return False
+        
+        selected = min(max(current + delta, 0), count - 1)
+        if count == 0 or selected == current:
+            return False
+        if level == "file":
+            self.selected_column = selected
+        elif level == "rowgroups":
+            self.selected_rowgroup = selected
+        else:
+            self.selected_rowgroup_column = selected
+        return True
+    
+    def _nav_down(self) -> bool:
+        """Select the next entry (Row Groups view) or page down (Data view)"""
+        if self.current_view == "rowgroups" and self.analysis:
+            return self.move_selection(1)
+        elif self.current_view == "data" and self.analysis:
+            return self._move_data_page(1)
+        return False
+    
+    def _nav_up(self) -> bool:
+        """Select the previous entry (Row Groups view) or page up (Data view)"""
+        if self.current_view == "rowgroups" and self.analysis:
+            return self.move_selection(-1)
+        elif self.current_view == "data" and self.analysis:
+            return self._move_data_page(-1)
+        return False
+    
+    @staticmethod
+    def _clamp_offset(offset: int, total: int, page: int) -> int:
+        """Clamp a data view row offset so that it starts a page within total rows"""
+        if total <= page:
+            return 0
+        return min(max(offset, 0), total - page)
+    
+    def _move_data_page(self, pages: int) -> bool:
+        """Move the data view by whole pages, stopping at the first and last"""
+        offset = self._clamp_offset(self.data_row_offset + pages * DATA_PAGE_ROWS,
+                                    self.analysis.total_rows, DATA_PAGE_ROWS)
+        if offset == self.data_row_offset:
+            return False
+        self.data_row_offset = offset
+        return True
+    
+    def _drill_in(self) -> bool:
+        """Go one level deeper in the Row Groups view"""
+        if self.compression_level == "file":
+            # Drill down to row groups browser
+            self.compression_level = "rowgroups"
+            self.selected_rowgroup = 0
+            return True
+        if self.compression_level == "rowgroups":
+            # Drill down to row group detail
+            self.compression_level = "rowgroup_detail"
+            self.selected_rowgroup_column = 0
+            return True
+        return False
+    
+    def _drill_out(self) -> bool:
+        """Go one level back up in the Row Groups view"""
+        if self.compression_level == "rowgroup_detail":
+            # Go back to row groups browser
+            self.compression_level = "rowgroups"
+        elif self.compression_level == "rowgroups":
+            # Go back to file level
+            self.compression_level = "file"
+        elif self.compression_level == "file":
+            # Go back to main view
+            self.current_view = "main"
+        return True
+    
+    def _go_back(self) -> bool:
+        """ESC: return to the overview, or quit from it"""
+        if self.current_view == "overview":
+            return self._quit()
+        self.current_view = "overview"
+        self.selected_column = 0
+        self.data_row_offset = 0
+        return True
+    
+    def _arrow(self, action, needs_analysis: bool = True):
+        """Key handler running action in the Row Groups view; elsewhere arrows act as ESC"""
+        def handler() -> bool:
+            if self.current_view == "rowgroups" and (self.analysis or not needs_analysis):
+                return action()
+            return self._go_back()
+        return handler
+    
+    @property
+    def file_selector(self) -> FileSelector:
+        """The file browser, created on first use and kept for the session"""
+        if self._file_selector is None:
+            self._file_selector = FileSelector(self.analyzer, self.console)
+        return self._file_selector
+    
+    def _open_file_browser(self) -> bool:
+        """Load a new file using the same selector as initial load"""
+        file_selector = self.file_selector
+        new_file = file_selector.select_file()
+        # The selector leaves the alternate screen and shows the cursor on its
+        # way out; take both back and redraw in full, even if the view itself
+        # is unchanged
+        self.console.set_alt_screen(True)
+        self.console.show_cursor(False)
+        self._frame_lines = None
+        if new_file and new_file != self.file_path:
+            self.file_path = new_file
+            self._pending_analysis = file_selector.take_analysis(new_file)
+            # If loading fails, the error is shown and the current file stays
+            if self.load_parquet_file():
+                self.current_view = "overview"
+                self.selected_column = 0
+        return True
+    
     def run(self):
         """Run the TUI application with minimal flickering"""
         # If no file provided or file doesn't exist, start with file browser
         if not self.file_path or not Path(self.file_path).exists():
-            file_selector = FileSelector()
+            file_selector = self.file_selector
             selected_file = file_selector.select_file()
             if not selected_file:
                 return  # User cancelled
             self.file_path = selected_file
+            self._pending_analysis = file_selector.take_analysis(selected_file)
         
         if not self.load_parquet_file():
             return
         
-        show_help = False
+        self.show_help = False
         
-        # Hide cursor and enable alternate screen
-        self.console.show_cursor(False)
+        # Keep the cached terminal size current (SIGWINCH is POSIX only)
+        previous_winch_handler = None
+        if hasattr(signal, "SIGWINCH"):
+            previous_winch_handler = signal.signal(signal.SIGWINCH, self._on_resize)
         
         def render_current_view():
-            """Render the current view without flickering"""
-            # Use alternate screen buffer to avoid scrollback issues
-            self.console.clear()
+            """Render the current view without flickering
+            
+            The whole frame is collected into one Group and captured, then
+            written as a diff against the previous frame: navigation usually
+            changes a highlighted row and the status line, so only those
+            lines are repainted.
+            """
+            frame = []
             
             # Main content
             if self.current_view == "overview":
-                panel = self.create_overview_panel()
-                self.console.print(panel)
+                panel = self._cached_panel("overview", self.create_overview_panel)
+                frame.append(panel)
             elif self.current_view == "schema":
-                panel = self.create_schema_panel()
-                self.console.print(panel)
+                panel = self._cached_panel("schema", self.create_schema_panel)
+                frame.append(panel)
             elif self.current_view == "rowgroups":
-                # Print compression panel directly instead of using Layout to save vertical space
-                compression_panel = self.create_compression_panel()
-                self.console.print(compression_panel)
+                # Stack compression panel directly instead of using Layout to save vertical space
+                compression_panel = self._cached_panel("compression", self.create_compression_panel)
+                frame.append(compression_panel)
                 
                 # Show appropriate detail panel based on compression level
                 if self.compression_level == "file":
                     # File level: show file column detail
                     if self.analysis and self.analysis.columns:
-                        sorted_columns = sorted(self.analysis.columns, key=lambda x: x.compression_ratio, reverse=True)
+                        sorted_columns = self._columns_by_ratio
                         selected_col = sorted_columns[min(self.selected_column, len(sorted_columns) - 1)]
-                        detail_content = f"[bold cyan]{selected_col.name}[/bold cyan]\n"
-                        detail_content += f"Physical Type: {selected_col.physical_type}\n"
-                        detail_content += f"Logical Type: {selected_col.logical_type}\n"
-                        detail_content += f"Encodings: {', '.join(selected_col.encodings)}\n"
+                        lines = [
+                            f"[bold cyan]{selected_col.name}[/bold cyan]",
+                            f"Physical Type: {selected_col.physical_type}",
+                            f"Logical Type: {selected_col.logical_type}",
+                            f"Encodings: {', '.join(selected_col.encodings)}",
+                        ]
                         if selected_col.min_value is not None:
-                            detail_content += f"Min: {selected_col.min_value}\n"
+                            lines.append(f"Min: {selected_col.format_stat(selected_col.min_value)}")
                         if selected_col.max_value is not None:
-                            detail_content += f"Max: {selected_col.max_value}\n"
+                            lines.append(f"Max: {selected_col.format_stat(selected_col.max_value)}")
                         if selected_col.null_count is not None:
-                            detail_content += f"Nulls: {selected_col.null_count}\n"
+                            lines.append(f"Nulls: {selected_col.null_count}")
+                        # Every line ends in a newline, the last one included
+                        lines.append("")
+                        detail_content = "\n".join(lines)
                         
                         detail_panel = Panel(detail_content, title="🔍 Column Detail", border_style="blue")
-                        self.console.print(detail_panel)
+                        frame.append(detail_panel)
                 elif self.compression_level == "rowgroups":
                     # Row groups level: show row group summary
-                    detail_panel = self.create_rowgroup_summary_panel()
-                    self.console.print(detail_panel)
+                    detail_panel = self._cached_panel("rowgroup_summary", self.create_rowgroup_summary_panel)
+                    frame.append(detail_panel)
                 elif self.compression_level == "rowgroup_detail":
                     # Row group detail: show column detail for selected row group column
-                    detail_panel = self.create_rowgroup_column_detail_panel()
-                    self.console.print(detail_panel)
+                    detail_panel = self._cached_panel("rowgroup_column_detail", self.create_rowgroup_column_detail_panel)
+                    frame.append(detail_panel)
             elif self.current_view == "pages":
-                panel = self.create_pages_panel()
-                self.console.print(panel)
+                panel = self._cached_panel("pages", self.create_pages_panel)
+                frame.append(panel)
             elif self.current_view == "optimization":
-                panel = self.create_optimization_panel()
-                self.console.print(panel)
+                panel = self._cached_panel("optimization", self.create_optimization_panel)
+                frame.append(panel)
             elif self.current_view == "data":
-                panel = self.create_data_panel()
-                self.console.print(panel)
+                panel = self._cached_panel("data", self.create_data_panel)
+                frame.append(panel)
             
             # Help panel if requested
-            if show_help:
-                self.console.print("\n")
-                self.console.print(self.create_help_panel())
+            if self.show_help:
+                frame.append("\n")
+                frame.append(self.create_help_panel())
             
             # Status and controls at bottom
-            status_text = f"[bold green]View:[/bold green] [cyan]{self.current_view.title()}[/cyan]"
-            if self.current_view == "rowgroups":
-                status_text += f" | [bold green]Level:[/bold green] [cyan]{self.compression_level}[/cyan]"
-                if self.compression_level == "file":
-                    status_text += f" | [bold green]Column:[/bold green] [cyan]{self.selected_column + 1}/{len(self.analysis.columns)}[/cyan]"
-                elif self.compression_level == "rowgroups":
-                    status_text += f" | [bold green]Row Group:[/bold green] [cyan]{self.selected_rowgroup + 1}/{len(self.analysis.row_groups)}[/cyan]"
-                elif self.compression_level == "rowgroup_detail":
-                    rg = self.analysis.row_groups[self.selected_rowgroup] if self.analysis and self.analysis.row_groups else None
-                    if rg:
-                        status_text += f" | [bold green]RG{self.selected_rowgroup}:[/bold green] [cyan]{self.selected_rowgroup_column + 1}/{len(rg.columns)}[/cyan]"
-            elif self.current_view == "data":
-                rows_per_page = 20
-                current_page = (self.data_row_offset // rows_per_page) + 1
-                total_pages = (self.analysis.total_rows + rows_per_page - 1) // rows_per_page
-                status_text += f" | [bold green]Page:[/bold green] [cyan]{current_page}/{total_pages}[/cyan]"
-            
-            controls_text = "[bold green]Controls:[/bold green] [cyan]f[/cyan] <file> [cyan]1[/cyan] <overview> [cyan]2[/cyan] <data> [cyan]3[/cyan] <schema> [cyan]4[/cyan] <row groups> [cyan]5[/cyan] <pages> [cyan]6[/cyan] <optimization> [cyan]ESC[/cyan] <back/exit> [cyan]↑/↓ or j/k[/cyan] <navigate> [cyan]h[/cyan] <help> [cyan]q[/cyan] <quit>"
+            frame.append(self.create_status_text())
+            frame.append(self._controls_text)
             
-            self.console.print(f"\n{status_text}")
-            self.console.print(controls_text)
+            # Rendered off to the side, then written out with a single write
+            with self.console.capture() as capture:
+                self.console.print(Group(*frame))
+            self._frame_lines = write_frame(self.console, capture.get(), self._frame_lines)
+        
+        def view_state():
+            """Everything the rendered frame depends on, to compare between renders"""
+            return (self.file_path, self.current_view, self.compression_level, self.selected_column,
+                    self.selected_rowgroup, self.selected_rowgroup_column, self.data_row_offset,
+                    self.show_help, self.terminal_size)
         
         try:
-            # Initial render
-            render_current_view()
-            
-            while True:
-                # Get single character input
-                fd = sys.stdin.fileno()
-                old_settings = termios.tcgetattr(fd)
-                try:
-                    tty.setraw(sys.stdin.fileno())
-                    key = sys.stdin.read(1)
-                finally:
-                    termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-                
-                # Track if we need to re-render
-                needs_update = False
-                
-                # Handle key presses
-                if key == 'q' or key == 'Q':
-                    break
-                elif key == 'h' or key == 'H':
-                    show_help = not show_help
-                    needs_update = True
-                elif key == '1':
-                    if self.current_view != "overview":
-                        self.current_view = "overview"
-                        self.selected_column = 0
-                        needs_update = True
-                elif key == '2':
-                    if self.current_view != "data":
-                        self.current_view = "data"
-                        self.selected_column = 0
-                        self.data_row_offset = 0  # Reset to first page
-                        needs_update = True
-                elif key == '3':
-                    if self.current_view != "schema":
-                        self.current_view = "schema"
-                        self.selected_column = 0
-                        needs_update = True
-                elif key == '4':
-                    if self.current_view != "rowgroups":
-                        self.current_view = "rowgroups"
-                        self.compression_level = "rowgroups"  # Start with browser
-                        self.selected_rowgroup = 0
-                        needs_update = True
-                elif key == '5':
-                    if self.current_view != "pages":
-                        self.current_view = "pages"
-                        self.selected_column = 0
-                        needs_update = True
-                elif key == '6':
-                    if self.current_view != "optimization":
-                        self.current_view = "optimization"
-                        self.selected_column = 0
-                        needs_update = True
-                elif key == 'j' or key == 'J':
-                    # Alternative navigation: j = down (vi-style)
-                    if self.current_view == "rowgroups" and self.analysis:
-                        if self.compression_level == "file":
-                            max_column_index = len(self.analysis.columns) - 1
-                            if self.selected_column < max_column_index:
-                                self.selected_column += 1
-                                needs_update = True
-                        elif self.compression_level == "rowgroups":
-                            max_rg_index = len(self.analysis.row_groups) - 1
-                            if self.selected_rowgroup < max_rg_index:
-                                self.selected_rowgroup += 1
-                                needs_update = True
-                        elif self.compression_level == "rowgroup_detail":
-                            rg = self.analysis.row_groups[self.selected_rowgroup]
-                            max_col_index = len(rg.columns) - 1
-                            if self.selected_rowgroup_column < max_col_index:
-                                self.selected_rowgroup_column += 1
-                                needs_update = True
-                    elif self.current_view == "data" and self.analysis:
-                        # Page down in data view
-                        rows_per_page = 20
-                        max_offset = max(0, self.analysis.total_rows - rows_per_page)
-                        if self.data_row_offset < max_offset:
-                            self.data_row_offset = min(self.data_row_offset + rows_per_page, max_offset)
+            fd = sys.stdin.fileno()
+            self._running = True
+            # Track if we need to re-render
+            needs_update = False
+            # Redraw in the alternate screen with the cursor hidden, so frames
+            # overwrite each other instead of piling up in the scrollback
+            with self.console.screen(hide_cursor=True), cbreak_terminal(fd):
+                # Initial render
+                render_current_view()
+                last_render = time.monotonic()
+                last_state = view_state()
+                while self._running:
+                    # Handle every key that arrived since the last render,
+                    # then render once for the whole batch
+                    for key in read_keys(fd):
+                        handler = self._key_handlers.get(key)
+                        if handler is None and key.startswith('\x1b'):
+                            # Any other escape sequence is a plain ESC
+                            handler = self._go_back
+                        if handler is not None and handler():
                             needs_update = True
-                elif key == 'k' or key == 'K':
-                    # Alternative navigation: k = up (vi-style)
-                    if self.current_view == "rowgroups" and self.analysis:
-                        if self.compression_level == "file":
-                            if self.selected_column > 0:
-                                self.selected_column -= 1
-                                needs_update = True
-                        elif self.compression_level == "rowgroups":
-                            if self.selected_rowgroup > 0:
-                                self.selected_rowgroup -= 1
-                                needs_update = True
-                        elif self.compression_level == "rowgroup_detail":
-                            if self.selected_rowgroup_column > 0:
-                                self.selected_rowgroup_column -= 1
-                                needs_update = True
-                    elif self.current_view == "data" and self.analysis:
-                        # Page up in data view
-                        rows_per_page = 20
-                        if self.data_row_offset > 0:
-                            self.data_row_offset = max(0, self.data_row_offset - rows_per_page)
-                            needs_update = True
-                elif key == 'f' or key == 'F' or key == '0':
-                    # File browser - load a new file using the same selector as initial load
-                    file_selector = FileSelector()
-                    new_file = file_selector.select_file()
-                    if new_file and new_file != self.file_path:
-                        self.file_path = new_file
-                        if self.load_parquet_file():
-                            self.current_view = "overview"
-                            self.selected_column = 0
-                            needs_update = True
-                        else:
-                            # If loading failed, show error and continue with current file
-                            needs_update = True
-                elif key == '\x1b':  # Escape or arrow key sequence
-                    # More robust arrow key detection
-                    arrow_handled = False
-                    try:
-                        # Try to read a complete 3-character arrow sequence
-                        char2 = sys.stdin.read(1)
-                        if char2 == '[':
-                            char3 = sys.stdin.read(1)
-                            
-                            # Check for standard arrow keys
-                            if char3 == 'A':  # Up arrow
-                                if self.current_view == "rowgroups" and self.analysis:
-                                    if self.compression_level == "file":
-                                        if self.selected_column > 0:
-                                            self.selected_column -= 1
-                                            needs_update = True
-                                    elif self.compression_level == "rowgroups":
-                                        if self.selected_rowgroup > 0:
-                                            self.selected_rowgroup -= 1
-                                            needs_update = True
-                                    elif self.compression_level == "rowgroup_detail":
-                                        if self.selected_rowgroup_column > 0:
-                                            self.selected_rowgroup_column -= 1
-                                            needs_update = True
-                                    arrow_handled = True
-                            elif char3 == 'B':  # Down arrow
-                                if self.current_view == "rowgroups" and self.analysis:
-                                    if self.compression_level == "file":
-                                        max_column_index = len(self.analysis.columns) - 1
-                                        if self.selected_column < max_column_index:
-                                            self.selected_column += 1
-                                            needs_update = True
-                                    elif self.compression_level == "rowgroups":
-                                        max_rg_index = len(self.analysis.row_groups) - 1
-                                        if self.selected_rowgroup < max_rg_index:
-                                            self.selected_rowgroup += 1
-                                            needs_update = True
-                                    elif self.compression_level == "rowgroup_detail":
-                                        rg = self.analysis.row_groups[self.selected_rowgroup]
-                                        max_col_index = len(rg.columns) - 1
-                                        if self.selected_rowgroup_column < max_col_index:
-                                            self.selected_rowgroup_column += 1
-                                            needs_update = True
-                                    arrow_handled = True
-                            elif char3 == 'C':  # Right arrow
-                                if self.current_view == "rowgroups" and self.analysis:
-                                    if self.compression_level == "file":
-                                        # Drill down to row groups browser
-                                        self.compression_level = "rowgroups"
-                                        self.selected_rowgroup = 0
-                                        needs_update = True
-                                    elif self.compression_level == "rowgroups":
-                                        # Drill down to row group detail
-                                        self.compression_level = "rowgroup_detail"
-                                        self.selected_rowgroup_column = 0
-                                        needs_update = True
-                                    arrow_handled = True
-                            elif char3 == 'D':  # Left arrow
-                                if self.current_view == "rowgroups":
-                                    if self.compression_level == "rowgroup_detail":
-                                        # Go back to row groups browser
-                                        self.compression_level = "rowgroups"
-                                        needs_update = True
-                                    elif self.compression_level == "rowgroups":
-                                        # Go back to file level
-                                        self.compression_level = "file"
-                                        needs_update = True
-                                    elif self.compression_level == "file":
-                                        # Go back to main view
-                                        self.current_view = "main"
-                                        needs_update = True
-                                    arrow_handled = True
-                        # If not a complete arrow sequence, will fall through to ESC handling
-                    except (OSError, ValueError):
-                        # If we can't read the sequence, treat as ESC
-                        pass
-                    
-                    # If arrow key wasn't handled, treat as ESC (back/exit)
-                    if not arrow_handled:
-                        if self.current_view == "overview":
+                        if not self._running:
                             break
-                        else:
-                            self.current_view = "overview"
-                            self.selected_column = 0
-                            self.data_row_offset = 0
-                            needs_update = True
-                elif ord(key) == 3:  # Ctrl+C
-                    break
+                    
+                    # Caches sized for the old window are dropped before the
+                    # next render, which then draws the whole screen anew
+                    if self._resized:
+                        self._apply_resize()
+                        needs_update = True
                 
-                # Only re-render if something actually changed
-                if needs_update:
-                    render_current_view()
+                    # Only re-render if something actually changed, at most
+                    # once per frame while keys keep arriving
+                    if self._running and needs_update and not frame_deferred(fd, last_render):
+                        # Keys can cancel each other out within a batch (help
+                        # toggled twice, down then up), leaving the frame as is,
+                        # unless the screen was drawn over and needs it in full
+                        state = view_state()
+                        if state != last_state or self._frame_lines is None:
+                            render_current_view()
+                            last_render = time.monotonic()
+                            last_state = state
+                        needs_update = False
                         
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             pass
         finally:
-            # Restore cursor
-            self.console.show_cursor(True)
+            if previous_winch_handler is not None:
+                signal.signal(signal.SIGWINCH, previous_winch_handler)
         
         self.console.print("\n[bold blue]Thanks for using Parquet TUI![/bold blue]")
 
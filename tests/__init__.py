@@ -1 +1,6 @@
 """Test package for parquet-analyzer."""
+
+import pathlib
+
+TESTS_DIR = pathlib.Path(__file__).resolve().parent
+EXAMPLES_DIR = TESTS_DIR.parent / "examples"
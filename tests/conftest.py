@@ -0,0 +1,21 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+from parquet_analyzer.analyzer import create_test_parquet_files
+from tests.test_data.create_orderbook_test import create_complex_orderbook_test
+
+
+@pytest.fixture(scope="session")
+def orderbook_parquet(tmp_path_factory):
+    """Path of the complex order book test file, written once per test session"""
+    path = tmp_path_factory.mktemp("orderbook") / "test_complex_orderbook.parquet"
+    return create_complex_orderbook_test(str(path))
+
+
+@pytest.fixture(scope="session")
+def parquet_test_files(tmp_path_factory):
+    """Paths of the simple, nested and large test files, written once per test session"""
+    return create_test_parquet_files(tmp_path_factory.mktemp("pq"))
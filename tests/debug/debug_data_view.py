@@ -13,7 +13,7 @@ def test_data_view_rendering():
     
     try:
         console = Console()
-        tui = ParquetTUI(file_path)
+        tui = ParquetTUI(file_path, console=console)
         
         if not tui.load_parquet_file():
             print("Failed to load parquet file")
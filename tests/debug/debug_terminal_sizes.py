@@ -14,8 +14,7 @@ def test_with_small_terminal():
     try:
         # Create console with very small size to trigger edge cases
         console = Console(width=20, height=10)
-        tui = ParquetTUI(file_path)
-        tui.console = console  # Override console
+        tui = ParquetTUI(file_path, console=console)
         
         if not tui.load_parquet_file():
             print("Failed to load parquet file")
@@ -43,8 +42,7 @@ def test_with_various_sizes():
         print(f"\nTesting with terminal size: {width}x{height}")
         try:
             console = Console(width=width, height=height)
-            tui = ParquetTUI(file_path)
-            tui.console = console
+            tui = ParquetTUI(file_path, console=console)
             
             if not tui.load_parquet_file():
                 print("Failed to load parquet file")
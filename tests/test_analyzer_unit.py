@@ -0,0 +1,303 @@
+"""
+Unit tests for the core ParquetAnalyzer engine
+"""
+
+import pytest
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from parquet_analyzer.analyzer import ParquetAnalyzer
+
+
+def write_table(path, num_rows, **kwargs):
+    """Write a small flat table with num_rows rows to path"""
+    table = pa.table({
+        'id': list(range(num_rows)),
+        'name': [f"row_{i}" for i in range(num_rows)],
+    })
+    pq.write_table(table, path, **kwargs)
+    return str(path)
+
+
+class TestParquetFileCache:
+    """The cached ParquetFile handle must follow changes to the file"""
+
+    def test_rewritten_file_is_reopened(self, tmp_path):
+        path = write_table(tmp_path / "data.parquet", 10)
+        analyzer = ParquetAnalyzer()
+        assert analyzer.analyze_file(path).total_rows == 10
+
+        write_table(tmp_path / "data.parquet", 25)
+        assert analyzer.analyze_file(path).total_rows == 25
+        assert len(analyzer.get_data_sample(path)) == 25
+
+    def test_evicted_handles_are_closed(self, tmp_path, monkeypatch):
+        from parquet_analyzer import analyzer as analyzer_module
+
+        monkeypatch.setattr(analyzer_module, "META_CACHE_SIZE", 1)
+        ParquetAnalyzer.cache_clear()
+        analyzer = ParquetAnalyzer()
+        first = analyzer._open(write_table(tmp_path / "first.parquet", 5))
+        second = analyzer._open(write_table(tmp_path / "second.parquet", 5))
+
+        assert first.closed and not second.closed
+        ParquetAnalyzer.cache_clear()
+        assert second.closed
+
+
+class TestAnalysisCache:
+    """Unchanged files are analyzed once, whichever analyzer asks"""
+
+    def test_unchanged_file_is_reused(self, tmp_path):
+        path = write_table(tmp_path / "data.parquet", 10)
+        analysis = ParquetAnalyzer().analyze_file(path)
+
+        assert ParquetAnalyzer().analyze_file(path) is analysis
+        assert ParquetAnalyzer().analyze_file(path, extract_pages=True) is not analysis
+
+        write_table(tmp_path / "data.parquet", 25)
+        assert ParquetAnalyzer().analyze_file(path).total_rows == 25
+
+    def test_given_stat_is_the_cache_key(self, tmp_path):
+        import os
+
+        path = write_table(tmp_path / "data.parquet", 10)
+        analysis = ParquetAnalyzer().analyze_file(path)
+
+        assert ParquetAnalyzer().analyze_file(path, stat_result=os.stat(path)) is analysis
+
+    def test_relative_paths_are_keyed_absolute(self, tmp_path, monkeypatch):
+        path = write_table(tmp_path / "data.parquet", 10)
+        analysis = ParquetAnalyzer().analyze_file(path)
+
+        monkeypatch.chdir(tmp_path)
+        relative = ParquetAnalyzer().analyze_file("data.parquet")
+
+        assert relative.file_path == "data.parquet"
+        assert relative.columns is analysis.columns
+        assert analysis.file_path == path
+        assert ParquetAnalyzer().analyze_file(path) is analysis
+
+    def test_cache_clear(self, tmp_path):
+        path = write_table(tmp_path / "data.parquet", 10)
+        analysis = ParquetAnalyzer().analyze_file(path)
+
+        ParquetAnalyzer.cache_clear()
+        assert ParquetAnalyzer().analyze_file(path) is not analysis
+
+
+class TestNameLookups:
+    """Columns and schema fields can be looked up by name"""
+
+    def test_lookups_match_lists(self, tmp_path):
+        analysis = ParquetAnalyzer().analyze_file(write_table(tmp_path / "data.parquet", 10))
+
+        assert analysis.columns_by_name['name'] is analysis.columns[1]
+        assert analysis.schema_fields_by_name['id'] is analysis.schema_fields[0]
+        assert analysis.columns_by_name is analysis.columns_by_name
+        assert 'missing' not in analysis.columns_by_name
+
+
+class TestSchemaFieldCache:
+    """Files sharing a schema reuse the converted schema fields"""
+
+    def test_same_schema_is_converted_once(self, tmp_path):
+        first = write_table(tmp_path / "first.parquet", 5)
+        second = write_table(tmp_path / "second.parquet", 50)
+        analyzer = ParquetAnalyzer()
+
+        first_fields = analyzer.analyze_file(first).schema_fields
+        second_fields = analyzer.analyze_file(second).schema_fields
+
+        assert [f.name for f in first_fields] == ['id', 'name']
+        assert all(a is b for a, b in zip(first_fields, second_fields))
+        assert first_fields is not second_fields
+
+    def test_cache_is_bounded_and_cleared(self, tmp_path, monkeypatch):
+        from parquet_analyzer import analyzer as analyzer_module
+
+        monkeypatch.setattr(analyzer_module, "META_CACHE_SIZE", 1)
+        ParquetAnalyzer.cache_clear()
+        analyzer = ParquetAnalyzer()
+        path = write_table(tmp_path / "data.parquet", 5)
+        fields = analyzer.analyze_file(path).schema_fields
+        other = tmp_path / "other.parquet"
+        pq.write_table(pa.table({'value': [1.5]}), other)
+        analyzer.analyze_file(str(other))
+
+        assert len(analyzer_module._SCHEMA_CACHE) == 1
+        evicted = analyzer._extract_schema_fields(pq.read_schema(path))
+        assert evicted[0] is not fields[0]
+        ParquetAnalyzer.cache_clear()
+        assert not analyzer_module._SCHEMA_CACHE
+
+
+class TestToJson:
+    """to_json gives the standard library's document, whatever is installed"""
+
+    def test_json_matches_dict(self, tmp_path):
+        import json
+
+        path = tmp_path / "data.parquet"
+        pq.write_table(pa.table({'id': [1, 2], 'prix_€': [0.5, 1.5]}), path)
+        analysis = ParquetAnalyzer().analyze_file(str(path))
+
+        for indent in (2, None):
+            expected = json.dumps(analysis.to_dict(), indent=indent, default=str)
+            assert analysis.to_json(indent=indent) == expected
+        assert '"prix_\\u20ac"' in analysis.to_json()
+
+
+class TestPageExtraction:
+    """Page estimates are only computed when asked for"""
+
+    def test_pages_skipped_by_default(self, tmp_path):
+        path = write_table(tmp_path / "data.parquet", 10)
+        analysis = ParquetAnalyzer().analyze_file(path)
+
+        assert all(col.num_pages == 0 and col.pages == [] for col in analysis.columns)
+
+    def test_pages_estimated_on_request(self, tmp_path):
+        path = write_table(tmp_path / "data.parquet", 10, row_group_size=5)
+        analysis = ParquetAnalyzer().analyze_file(path, extract_pages=True)
+
+        for col in analysis.columns:
+            # One estimated page per row group, summarized as a single average page
+            assert col.num_pages == 2
+            assert len(col.pages) == 1
+            assert col.pages[0].num_values == 5
+
+
+class TestSlottedDataclasses:
+    """Analysis objects carry no per-instance __dict__"""
+
+    def test_column_info_has_no_dict(self, tmp_path):
+        path = write_table(tmp_path / "data.parquet", 10)
+        analysis = ParquetAnalyzer().analyze_file(path)
+
+        assert not hasattr(analysis, "__dict__")
+        for col in analysis.columns:
+            assert not hasattr(col, "__dict__")
+        with pytest.raises(AttributeError):
+            analysis.columns[0].unknown_attribute = 1
+
+
+class TestColumnStatistics:
+    """Min/max statistics are merged across row groups"""
+
+    def test_min_max_span_row_groups(self, tmp_path):
+        path = write_table(tmp_path / "data.parquet", 10, row_group_size=3)
+        analysis = ParquetAnalyzer().analyze_file(path)
+        columns = {col.name: col for col in analysis.columns}
+
+        assert (columns['id'].min_value, columns['id'].max_value) == (0, 9)
+        assert isinstance(columns['id'].min_value, int)
+        assert (columns['name'].min_value, columns['name'].max_value) == ("row_0", "row_9")
+
+
+class TestAnalyzeFiles:
+    """Batch analysis keeps results in input order"""
+
+    def test_results_follow_input_order(self, tmp_path):
+        paths = [write_table(tmp_path / f"data_{n}.parquet", n) for n in (3, 1, 2)]
+        analyses = ParquetAnalyzer().analyze_files(paths, max_workers=3)
+
+        assert [a.file_path for a in analyses] == paths
+        assert [a.total_rows for a in analyses] == [3, 1, 2]
+
+    def test_errors_propagate(self, tmp_path):
+        paths = [write_table(tmp_path / "data.parquet", 1), str(tmp_path / "missing.parquet")]
+
+        with pytest.raises(FileNotFoundError):
+            ParquetAnalyzer().analyze_files(paths)
+
+
+class TestDataSample:
+    """Data samples only read the rows they need"""
+
+    def test_sample_is_truncated(self, tmp_path):
+        path = write_table(tmp_path / "data.parquet", 100, row_group_size=30)
+        df = ParquetAnalyzer().get_data_sample(path, max_rows=50)
+
+        assert len(df) == 50
+        assert df['id'].tolist() == list(range(50))
+
+    def test_small_file_is_read_whole(self, tmp_path):
+        path = write_table(tmp_path / "data.parquet", 10)
+        df = ParquetAnalyzer().get_data_sample(path, max_rows=50)
+
+        assert df['name'].tolist() == [f"row_{i}" for i in range(10)]
+
+    def test_sample_selected_columns(self, tmp_path):
+        path = write_table(tmp_path / "data.parquet", 100, row_group_size=30)
+        df = ParquetAnalyzer().get_data_sample(path, max_rows=40, columns=['name'])
+
+        assert list(df.columns) == ['name']
+        assert df['name'].tolist() == [f"row_{i}" for i in range(40)]
+
+    def test_page_spans_row_groups(self, tmp_path):
+        path = write_table(tmp_path / "data.parquet", 100, row_group_size=30)
+        df = ParquetAnalyzer().get_data_sample_paginated(path, max_rows=20, offset=50, columns=['id'])
+
+        assert list(df.columns) == ['id']
+        assert df['id'].tolist() == list(range(50, 70))
+
+    def test_page_skips_empty_row_groups(self, tmp_path):
+        table = pa.table({'id': list(range(20))})
+        path = str(tmp_path / "data.parquet")
+        with pq.ParquetWriter(path, table.schema) as writer:
+            for start, length in ((0, 0), (0, 10), (10, 0), (10, 10)):
+                writer.write_table(table.slice(start, length))
+
+        df = ParquetAnalyzer().get_data_sample_paginated(path, max_rows=5, offset=8)
+
+        assert df['id'].tolist() == list(range(8, 13))
+
+    def test_page_past_end_is_empty(self, tmp_path):
+        path = write_table(tmp_path / "data.parquet", 100, row_group_size=30)
+        df = ParquetAnalyzer().get_data_sample_paginated(path, max_rows=20, offset=100)
+
+        assert len(df) == 0
+        assert list(df.columns) == ['id', 'name']
+
+    def test_preview_columns_flag_nested_data(self, tmp_path):
+        table = pa.table({'id': [1], 'tags': [['a', 'b']], 'point': [{'x': 1}]})
+        pq.write_table(table, tmp_path / "nested.parquet")
+
+        names, nested = ParquetAnalyzer().get_preview_columns(str(tmp_path / "nested.parquet"))
+
+        assert names == ['id', 'tags', 'point']
+        assert nested == ['tags', 'point']
+
+
+class TestSharedColumnMetadata:
+    """Columns with the same metadata share the same objects"""
+
+    def test_encodings_are_shared_tuples(self, tmp_path):
+        table = pa.table({f"c{i}": list(range(10)) for i in range(5)})
+        pq.write_table(table, tmp_path / "wide.parquet")
+        analysis = ParquetAnalyzer().analyze_file(str(tmp_path / "wide.parquet"))
+
+        first = analysis.columns[0]
+        assert isinstance(first.encodings, tuple)
+        assert list(first.encodings) == sorted(first.encodings)
+        for col in analysis.columns[1:]:
+            assert col.encodings is first.encodings
+            assert col.physical_type is first.physical_type
+
+
+class TestColumnGroups:
+    """Columns are grouped for the optimization recommendations at load time"""
+
+    def test_groups_follow_column_metadata(self, tmp_path):
+        table = pa.table({
+            'bid_price': [1.5, 2.5],
+            'qty': [1, 2],
+            'quote': [{'ask': 1.0}, {'ask': 2.0}],
+        })
+        pq.write_table(table, tmp_path / "quotes.parquet")
+        analysis = ParquetAnalyzer().analyze_file(str(tmp_path / "quotes.parquet"))
+
+        assert [col.name for col in analysis.double_cols] == ['bid_price', 'quote.ask']
+        assert [col.name for col in analysis.price_cols] == ['bid_price']
+        assert [col.name for col in analysis.nested_cols] == ['quote.ask']
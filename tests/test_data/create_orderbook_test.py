@@ -3,86 +3,109 @@
 Create a test file with complex nested structures similar to order book data
 """
 
-import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 import numpy as np
 
-def create_complex_orderbook_test():
-    """Create a Parquet file with complex nested order book-like structures"""
+def create_complex_orderbook_test(out_path='test_complex_orderbook.parquet', num_rows=5):
+    """Create a Parquet file with complex nested order book-like structures, returning its path
     
-    # Create sample order book data
-    data = []
+    The columns are built directly as Arrow arrays, so larger files (num_rows)
+    cost array operations rather than a Python loop per row.
+    """
+    ids = np.arange(num_rows, dtype=np.int64)
+    base_ts = 1640995200000 + ids * 1000
     
-    for i in range(5):
-        # Create complex nested structure similar to your example
-        order_book_sides = [
-            {
-                'exchange': f'exchange_{i%3}',
-                'pair': 'BTC/USD',
-                'exchangeTimestamp': 1640995200000 + i*1000,
-                'exchangeTimestampNanoseconds': i * 1000000,
-                'isBid': i % 2 == 0,
-                'timestamp': 1640995200000 + i*1000,
-                'receivedTimestamp': 1640995200000 + i*1000 + 100,
-                'receivedTimestampNanoseconds': (i+1) * 1000000,
-                'metadata': {
-                    'firstUpdateId': i * 100,
-                    'version': 1,
-                    'lastId': i * 100 + 50
-                },
-                'sequence': i * 10,
-                'data': [
-                    [100.5 + i, 0.1 + i*0.01],  # [price, quantity] pairs
-                    [100.6 + i, 0.2 + i*0.01],
-                    [100.7 + i, 0.15 + i*0.01]
-                ],
-                'maxPrice': 100.7 + i,
-                'minPrice': 100.5 + i,
-                'maxPriceNumOrders': 10 + i,
-                'minPriceNumOrders': 5 + i,
-                'maxPriceVolume': 1.5 + i*0.1,
-                'minPriceVolume': 0.8 + i*0.1
-            }
-            for _ in range(2)  # Two sides per order book
-        ]
-        
-        data.append({
-            'id': i,
-            'symbol': 'BTC/USD',
-            'timestamp': pd.Timestamp(2023, 1, 1) + pd.Timedelta(minutes=i),
-            'orderBookSides': order_book_sides,
-            'marketData': {
-                'lastPrice': 100.0 + i,
-                'volume24h': 1000000 + i*1000,
-                'high24h': 101.0 + i,
-                'low24h': 99.0 + i
-            }
-        })
+    # Two sides per order book with the same values, so each book's side is
+    # built once and both list slots point at it
+    sides_per_book = 2
+    side_row = ids
+    side_ts = base_ts
     
-    df = pd.DataFrame(data)
+    # [price, quantity] pairs, three per side
+    pair_offsets = np.array([0.0, 0.1, 0.2])
+    quantity_offsets = np.array([0.1, 0.2, 0.15])
+    prices = (100.5 + side_row[:, None] + pair_offsets).ravel()
+    quantities = (quantity_offsets + side_row[:, None] * 0.01).ravel()
+    levels = np.column_stack([prices, quantities]).ravel()
+    # Every pair is a 2-element list, every side a 3-pair list
+    pair_lists = pa.ListArray.from_arrays(pa.array(np.arange(0, len(levels) + 1, 2, dtype=np.int32)), pa.array(levels))
+    side_data = pa.ListArray.from_arrays(pa.array(np.arange(0, len(pair_lists) + 1, 3, dtype=np.int32)), pair_lists)
     
-    # Write to parquet
-    table = pa.Table.from_pandas(df)
-    pq.write_table(table, 'test_complex_orderbook.parquet')
+    metadata = pa.StructArray.from_arrays(
+        [pa.array(side_row * 100), pa.array(np.ones(len(side_row), dtype=np.int64)), pa.array(side_row * 100 + 50)],
+        names=['firstUpdateId', 'version', 'lastId'],
+    )
+    sides = pa.StructArray.from_arrays(
+        [
+            pa.array(np.char.add('exchange_', (side_row % 3).astype(str)).tolist()),
+            pa.array(['BTC/USD'] * len(side_row)),
+            pa.array(side_ts),
+            pa.array(side_row * 1000000),
+            pa.array(side_row % 2 == 0),
+            pa.array(side_ts),
+            pa.array(side_ts + 100),
+            pa.array((side_row + 1) * 1000000),
+            metadata,
+            pa.array(side_row * 10),
+            side_data,
+            pa.array(100.7 + side_row),
+            pa.array(100.5 + side_row),
+            pa.array(10 + side_row),
+            pa.array(5 + side_row),
+            pa.array(1.5 + side_row * 0.1),
+            pa.array(0.8 + side_row * 0.1),
+        ],
+        names=[
+            'exchange', 'pair', 'exchangeTimestamp', 'exchangeTimestampNanoseconds', 'isBid',
+            'timestamp', 'receivedTimestamp', 'receivedTimestampNanoseconds', 'metadata',
+            'sequence', 'data', 'maxPrice', 'minPrice', 'maxPriceNumOrders',
+            'minPriceNumOrders', 'maxPriceVolume', 'minPriceVolume',
+        ],
+    )
+    order_book_sides = pa.ListArray.from_arrays(
+        pa.array(np.arange(0, sides_per_book * num_rows + 1, sides_per_book, dtype=np.int32)),
+        sides.take(pa.array(np.repeat(ids, sides_per_book))))
     
-    print("Created test_complex_orderbook.parquet with complex nested structures")
-    print(f"Columns: {list(df.columns)}")
-    print(f"Shape: {df.shape}")
+    market_data = pa.StructArray.from_arrays(
+        [pa.array(100.0 + ids), pa.array(1000000 + ids * 1000), pa.array(101.0 + ids), pa.array(99.0 + ids)],
+        names=['lastPrice', 'volume24h', 'high24h', 'low24h'],
+    )
+    
+    # One minute apart from 2023-01-01
+    timestamps = np.datetime64('2023-01-01T00:00:00', 'us') + ids.astype('timedelta64[m]')
+    
+    table = pa.table({
+        'id': ids,
+        'symbol': pa.array(['BTC/USD'] * num_rows),
+        'timestamp': pa.array(timestamps),
+        'orderBookSides': order_book_sides,
+        'marketData': market_data,
+    })
+    
+    # Write to parquet; small row groups so that even the default five rows
+    # span several of them for the row group views and pagination
+    pq.write_table(table, out_path, compression='zstd', compression_level=3, use_dictionary=True,
+                   row_group_size=2, data_page_size=64 * 1024, write_statistics=True)
+    
+    print(f"Created {out_path} with complex nested structures")
+    print(f"Columns: {table.column_names}")
+    print(f"Shape: {table.shape}")
+    print(f"Row groups: {pq.ParquetFile(out_path).metadata.num_row_groups}")
     
     # Show structure
     print("\nColumn types:")
-    for col in df.columns:
-        print(f"  {col}: {df[col].dtype}")
+    for field in table.schema:
+        print(f"  {field.name}: {field.type}")
     
-    print("\nSample of complex data:")
-    sample = df.iloc[0]
-    print(f"orderBookSides type: {type(sample['orderBookSides'])}")
-    if isinstance(sample['orderBookSides'], list) and len(sample['orderBookSides']) > 0:
-        first_side = sample['orderBookSides'][0]
+    if num_rows:
+        print("\nSample of complex data:")
+        first_side = table.column('orderBookSides')[0][0].as_py()
         print(f"First order book side keys: {list(first_side.keys())}")
         print(f"Metadata keys: {list(first_side['metadata'].keys())}")
         print(f"Data structure: {type(first_side['data'])}, length: {len(first_side['data'])}")
+    
+    return out_path
 
 if __name__ == "__main__":
     create_complex_orderbook_test()
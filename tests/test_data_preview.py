@@ -0,0 +1,79 @@
+"""
+Unit tests for the data preview cell formatters
+"""
+
+import numpy as np
+import pandas as pd
+
+from parquet_analyzer.tui import format_cell, pick_cell_formatter
+
+
+class StrSubclass(str):
+    """A str that misses the exact-type fast path"""
+
+
+class TestFormatCell:
+    """Cells are formatted by value type"""
+
+    def test_nulls(self):
+        assert format_cell(None, 10) == "[dim]NULL[/dim]"
+        assert format_cell(float("nan"), 10) == "[dim]NULL[/dim]"
+        assert format_cell(np.array([None, None], dtype=object), 10) == "[dim]NULL[/dim]"
+
+    def test_numbers(self):
+        assert format_cell(3.14159, 10) == "3.14"
+        assert format_cell(42, 10) == "42"
+        assert format_cell(True, 10) == "True"
+        assert format_cell(np.int64(7), 10) == "7"
+        assert format_cell(np.float32(1 / 3), 12) == "0.33333334"
+
+    def test_strings_are_truncated(self):
+        assert format_cell("short", 10) == "short"
+        assert format_cell("a" * 20, 10) == "a" * 7 + "..."
+
+    def test_fast_path_matches_general_path(self):
+        for text in ("short", "a" * 20):
+            assert format_cell(text, 10) == format_cell(StrSubclass(text), 10)
+
+    def test_nested_values(self):
+        assert format_cell([1, 2.5], 20) == "[dim][1,2.5][/dim]"
+        assert format_cell({"a": 1, "b": "x"}, 20) == "[dim]{a:1,b:x}[/dim]"
+        assert format_cell([{"maxPrice": 1.5, "pair": "BTC"}], 40) == "[dim][{maxPrice:1.5,pair:BTC}][/dim]"
+
+    def test_arrays(self):
+        assert format_cell(np.array([1.0, 2.0]), 20) == "[dim][1,2][/dim]"
+        assert format_cell(np.arange(10), 20) == "[dim]array[10][/dim]"
+        assert format_cell(np.zeros((2, 3)), 20) == "[dim]array[2×3][/dim]"
+        assert format_cell(np.array(5), 20) == "5"
+
+    def test_small_arrays_follow_element_types(self):
+        # Only float64 elements count as floats; other typed arrays print as text
+        assert format_cell(np.array([123456.0]), 20) == "[dim][1.2e+05][/dim]"
+        assert format_cell(np.array([123456]), 20) == "[dim][123456][/dim]"
+        assert format_cell(np.array([1, 2.5], dtype=object), 20) == "[dim][1,2.5][/dim]"
+
+
+class TestPickCellFormatter:
+    """Typed columns skip the general formatter"""
+
+    def test_typed_columns(self):
+        floats = pick_cell_formatter(pd.Series([1.5]).dtype)
+        ints = pick_cell_formatter(pd.Series([1]).dtype)
+
+        assert floats(1.23456, 10) == "1.23"
+        assert ints(np.int64(12), 10) == "12"
+
+    def test_narrow_float_columns_match_format_cell(self):
+        for dtype in ("float32", "float16", "Float32"):
+            value = pd.Series([1 / 3], dtype=dtype).iloc[0]
+            formatter = pick_cell_formatter(pd.Series([1.5], dtype=dtype).dtype)
+
+            assert formatter(value, 12) == format_cell(value, 12) == str(value)
+
+    def test_object_columns_use_format_cell(self):
+        assert pick_cell_formatter(pd.Series(["a"], dtype=object).dtype) is format_cell
+
+    def test_string_columns_are_truncated(self):
+        formatter = pick_cell_formatter(pd.Series(["a"], dtype="string").dtype)
+
+        assert formatter("a" * 20, 10) == format_cell("a" * 20, 10)
@@ -0,0 +1,155 @@
+"""
+Unit tests for the main view key handlers
+"""
+
+from datetime import datetime
+
+import pytest
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from rich.console import Console
+
+from parquet_analyzer.tui import ParquetTUI
+
+
+@pytest.fixture
+def tui(tmp_path):
+    """A TUI on a loaded 50-row, 5-row-group file"""
+    path = tmp_path / "data.parquet"
+    pq.write_table(pa.table({'id': list(range(50)), 'name': [f"row_{i}" for i in range(50)]}),
+                   path, row_group_size=10)
+    tui = ParquetTUI(str(path))
+    assert tui.load_parquet_file()
+    return tui
+
+
+def press(tui, key):
+    return tui._key_handlers.get(key, tui._go_back)()
+
+
+class TestKeyHandlers:
+    """Keys map onto the same view changes however they are typed"""
+
+    def test_switching_views(self, tui):
+        assert press(tui, '4')
+        assert tui.current_view == "rowgroups" and tui.compression_level == "rowgroups"
+        assert not press(tui, '4')
+
+    def test_vi_keys_match_arrows(self, tui):
+        press(tui, '4')
+        assert press(tui, 'j') and tui.selected_rowgroup == 1
+        assert press(tui, '\x1b[B') and tui.selected_rowgroup == 2
+        assert press(tui, 'K') and tui.selected_rowgroup == 1
+
+    def test_drilling_in_and_out(self, tui):
+        press(tui, '4')
+        press(tui, '\x1b[C')
+        assert tui.compression_level == "rowgroup_detail"
+        press(tui, '\x1b[D')
+        assert tui.compression_level == "rowgroups"
+
+    def test_arrows_outside_row_groups_go_back(self, tui):
+        press(tui, '2')
+        assert press(tui, '\x1b[B')
+        assert tui.current_view == "overview"
+
+    def test_escape_from_overview_quits(self, tui):
+        tui._running = True
+        assert not press(tui, '\x1b')
+        assert not tui._running
+
+    def test_data_paging(self, tui):
+        press(tui, '2')
+        assert press(tui, 'j') and tui.data_row_offset == 20
+        assert press(tui, 'j') and tui.data_row_offset == 30
+        assert not press(tui, 'j')
+
+    def test_selection_needs_a_file(self):
+        tui = ParquetTUI(None, console=Console(width=80, height=24))
+        tui.current_view = "rowgroups"
+
+        assert not tui.move_selection(1)
+        assert not press(tui, 'j')
+
+    def test_offsets_are_clamped_to_pages(self):
+        assert ParquetTUI._clamp_offset(-10, 100, 20) == 0
+        assert ParquetTUI._clamp_offset(95, 100, 20) == 80
+        assert ParquetTUI._clamp_offset(40, 100, 20) == 40
+        assert ParquetTUI._clamp_offset(40, 15, 20) == 0
+
+
+class TestStatusText:
+    """The status line matches the markup it was once printed from"""
+
+    def test_matches_printed_markup(self, tui):
+        press(tui, '4')
+        press(tui, 'j')
+        expected = tui.console.render_str(
+            "\n[bold green]View:[/bold green] [cyan]Rowgroups[/cyan]"
+            " | [bold green]Level:[/bold green] [cyan]rowgroups[/cyan]"
+            " | [bold green]Row Group:[/bold green] [cyan]2/5[/cyan]"
+        )
+        status = tui.create_status_text()
+
+        assert status.plain == expected.plain
+        assert list(status.render(tui.console)) == list(expected.render(tui.console))
+
+    def test_before_a_file_is_loaded(self):
+        tui = ParquetTUI(None, console=Console(width=80, height=24))
+
+        for view in ("data", "rowgroups"):
+            tui.current_view = view
+            assert "/0" in tui.create_status_text().plain
+
+
+class TestConsole:
+    """The terminal size follows the console the TUI renders to"""
+
+    def test_replacing_console_resets_size(self, tui):
+        tui.console = Console(width=50, height=20)
+        assert tui.terminal_size.width == 50
+
+        tui.console = Console(width=90, height=20)
+        assert tui.terminal_size.width == 90
+
+    def test_resize_signal_only_flags(self, tui):
+        tui.console = Console(width=50, height=20)
+        tui._cached_panel("overview", tui.create_overview_panel)
+        assert tui.terminal_size.width == 50
+
+        # The handler leaves the caches to the key loop, however it interrupts
+        tui._on_resize(None, None)
+        assert tui._resized and tui._panel_cache and tui._term_size is not None
+
+        tui._apply_resize()
+        assert not tui._resized and not tui._panel_cache and tui._term_size is None
+
+
+class TestStatistics:
+    """INT64 timestamp statistics are shown as dates, as they were before being kept raw"""
+
+    def test_timestamp_min_max_are_formatted(self, tmp_path):
+        path = tmp_path / "events.parquet"
+        millis = [1672531200000, 1672617600000]
+        pq.write_table(pa.table({'event_timestamp': pa.array(millis, type=pa.int64())}), path)
+        tui = ParquetTUI(str(path), console=Console(width=120, height=40))
+        assert tui.load_parquet_file()
+
+        expected = [datetime.fromtimestamp(ms / 1000).strftime('%Y-%m-%d %H:%M:%S') for ms in millis]
+        col = tui.analysis.columns[0]
+        rg_col = tui.analysis.row_groups[0].columns[0]
+        assert [col.format_stat(col.min_value), col.format_stat(col.max_value)] == expected
+        assert [rg_col.format_stat(rg_col.min_value), rg_col.format_stat(rg_col.max_value)] == expected
+
+        tui.current_view = "rowgroups"
+        tui.compression_level = "rowgroup_detail"
+        panels = [tui.create_compression_panel(), tui.create_rowgroup_column_detail_panel()]
+        tui.compression_level = "file"
+        panels.append(tui.create_column_detail_panel())
+        for panel in panels:
+            with tui.console.capture() as capture:
+                tui.console.print(panel)
+            text = capture.get()
+            assert expected[0][:15] in text
+            assert str(millis[0]) not in text
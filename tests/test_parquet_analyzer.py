@@ -0,0 +1,142 @@
+"""
+Tests for ParquetAnalyzer on the files from create_test_parquet_files
+"""
+
+import shutil
+
+import numpy as np
+import pytest
+import pyarrow.parquet as pq
+
+from parquet_analyzer import analyzer as analyzer_module
+from parquet_analyzer.analyzer import ParquetAnalyzer
+
+_PARQUET_TOOLS = shutil.which("parquet-tools")
+
+
+@pytest.fixture(scope="module")
+def parquet_files(parquet_test_files):
+    """PyArrow's own handles on the test files, opened once for the module"""
+    handles = {
+        name: pq.ParquetFile(parquet_test_files[name], memory_map=True, pre_buffer=True,
+                             buffer_size=1 << 20)
+        for name in ('simple', 'nested', 'large')
+    }
+    yield handles
+    for parquet_file in handles.values():
+        parquet_file.close()
+
+
+class TestParquetAnalyzer:
+    """Analyses of the simple, nested and large test files
+
+    The files come from the session-scoped parquet_test_files fixture, so they
+    are written once however many tests read them.
+    """
+
+    @pytest.fixture
+    def analyzer(self):
+        return ParquetAnalyzer()
+
+    def test_simple_file_analysis(self, analyzer, parquet_test_files):
+        analysis = analyzer.analyze_file(parquet_test_files['simple'])
+
+        assert analysis.total_rows == 5
+        assert analysis.num_row_groups == 1
+        assert list(analysis.schema_fields_by_name) == ['id', 'name', 'age', 'salary', 'active']
+
+    def test_nested_file_analysis(self, analyzer, parquet_test_files):
+        analysis = analyzer.analyze_file(parquet_test_files['nested'])
+
+        assert analysis.total_rows == 3
+        assert analysis.num_physical_columns > analysis.num_logical_columns
+
+    def test_large_file_analysis(self, analyzer, parquet_test_files):
+        analysis = analyzer.analyze_file(parquet_test_files['large'])
+
+        assert analysis.total_rows == 65536
+        assert analysis.num_row_groups == 2
+
+    def test_data_types_analysis(self, analyzer, parquet_test_files):
+        analysis = analyzer.analyze_file(parquet_test_files['large'])
+
+        # One pass over the columns gives every (physical, logical) pair
+        types = {col.name: (col.physical_type, col.logical_type) for col in analysis.columns}
+        assert types == {
+            'id': ('INT64', 'INT64'),
+            'value': ('DOUBLE', 'DOUBLE'),
+            'category': ('BYTE_ARRAY', 'UTF8'),
+            'timestamp': ('INT64', 'TIMESTAMP(ns)'),
+        }
+
+    def test_different_compressions(self, analyzer, parquet_test_files, tmp_path):
+        table = pq.read_table(parquet_test_files['simple'])
+        compression_files = {}
+        for compression in ('snappy', 'gzip', 'zstd'):
+            compression_files[compression] = str(tmp_path / f"{compression}.parquet")
+            pq.write_table(table, compression_files[compression], compression=compression)
+
+        # analyze_files overlaps the footer reads on a thread pool
+        analyses = dict(zip(compression_files, analyzer.analyze_files(list(compression_files.values()))))
+
+        for compression, analysis in analyses.items():
+            assert analysis.total_rows == 5
+            assert {col.compression for col in analysis.columns} == {compression.upper()}
+
+    @pytest.mark.parametrize("name", ['simple', 'nested', 'large'])
+    def test_schema_consistency_with_pyarrow(self, analyzer, parquet_test_files, parquet_files, name):
+        analysis = analyzer.analyze_file(parquet_test_files[name])
+
+        parquet_file = parquet_files[name]
+        schema = parquet_file.schema_arrow
+
+        assert analysis.num_physical_columns == parquet_file.metadata.num_columns
+        assert analysis.num_logical_columns == len(schema)
+        assert list(analysis.schema_fields_by_name) == schema.names
+
+    def test_row_count_consistency(self, analyzer, parquet_test_files, parquet_files):
+        names = list(parquet_files)
+        analyses = analyzer.analyze_files([parquet_test_files[name] for name in names])
+
+        # The row count is in the footer, so no column data is read
+        for name, analysis in zip(names, analyses):
+            assert analysis.total_rows == parquet_files[name].metadata.num_rows
+
+    def test_error_handling(self, analyzer, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            analyzer.analyze_file(str(tmp_path / "missing.parquet"))
+
+        bad_file = tmp_path / "bad.parquet"
+        bad_file.write_text("This is not a parquet file")
+        with pytest.raises(ValueError):
+            analyzer.analyze_file(str(bad_file))
+
+    @pytest.mark.parametrize("name", ['simple', 'nested', 'large'])
+    def test_compression_ratio_calculation(self, analyzer, parquet_test_files, name):
+        analysis = analyzer.analyze_file(parquet_test_files[name])
+        columns = analysis.columns
+
+        compressed = np.array([col.compressed_size for col in columns], dtype=np.float64)
+        uncompressed = np.array([col.uncompressed_size for col in columns], dtype=np.float64)
+        ratios = np.array([col.compression_ratio for col in columns], dtype=np.float64)
+
+        # Each column's ratio is its compressed over uncompressed size, and the
+        # file totals are the sums over its columns
+        mask = uncompressed > 0
+        np.testing.assert_allclose(ratios[mask], compressed[mask] / uncompressed[mask])
+        assert analysis.total_compressed == compressed.sum()
+        assert analysis.total_uncompressed == uncompressed.sum()
+
+    @pytest.mark.skipif(_PARQUET_TOOLS is None, reason="parquet-tools not installed")
+    def test_parquet_tools_comparison(self, analyzer, parquet_test_files):
+        result = analyzer.compare_with_parquet_tools(parquet_test_files['simple'])
+
+        assert result['available']
+        assert result['output']
+
+    def test_missing_parquet_tools_is_not_run(self, analyzer, parquet_test_files, monkeypatch):
+        monkeypatch.setattr(analyzer_module, "_parquet_tools_path", lambda: None)
+        monkeypatch.setattr("subprocess.run", pytest.fail)
+
+        result = analyzer.compare_with_parquet_tools(parquet_test_files['simple'])
+        assert result == {'available': False, 'error': "parquet-tools not found"}